@@ -5,6 +5,8 @@ from __future__ import annotations
 import logging
 from typing import Any, Callable, Dict, List, Mapping, Sequence, cast
 
+import numpy as np
+
 try:  # sounddevice is a required dependency, but be defensive for import-time errors
     import sounddevice as _sounddevice
 except Exception:  # pragma: no cover - exercised only if dependency is missing
@@ -75,6 +77,31 @@ def get_audio_input_devices() -> List[Dict[str, Any]]:
     return input_devices
 
 
+def rms_level(samples: np.ndarray) -> float:
+    """Return the root-mean-square level of ``samples`` (``0.0`` if empty).
+
+    The sum of squares is computed with a dot product, so no temporary array
+    of squared samples is allocated. This keeps the calculation cheap enough to
+    run on every audio block.
+    """
+    flat = samples.reshape(-1)
+    if flat.size == 0:
+        return 0.0
+    return float(np.sqrt(np.dot(flat, flat) / flat.size))
+
+
+def float_to_pcm16(samples: np.ndarray) -> np.ndarray:
+    """Convert float samples in the range -1.0 to 1.0 to 16-bit PCM.
+
+    Scaling and clipping happen in place on a single float32 buffer, so values
+    outside the nominal range saturate at the int16 limits instead of wrapping
+    around, and no float64 intermediate is allocated.
+    """
+    scaled: np.ndarray = np.multiply(samples, np.float32(32767.0), dtype=np.float32)
+    np.clip(scaled, -32768.0, 32767.0, out=scaled)
+    return scaled.astype(np.int16)
+
+
 def record_audio(
     callback: Callable[[Any, int, Any, Any], None],
     *,
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import sys
 import tempfile
 import threading
@@ -20,17 +21,17 @@ from rich.prompt import Confirm
 from rich.table import Table
 
 from rejoice import __version__
-from rejoice.audio import record_audio
+from rejoice.audio import float_to_pcm16, record_audio, rms_level
 from rejoice.cli.config_commands import config_group
 from rejoice.core.config import load_config
 from rejoice.core.logging import setup_logging
 from rejoice.exceptions import TranscriptError
 from rejoice.transcription import Transcriber
 from rejoice.transcript.manager import (
-    TRANSCRIPT_FILENAME_PATTERN,
     append_to_transcript,
     create_transcript,
     normalize_id,
+    parse_transcript_filename,
     update_language,
     update_status,
 )
@@ -60,10 +61,8 @@ def _calculate_audio_level(audio_chunk: np.ndarray) -> float:
 
     Returns a normalized value between 0.0 and 1.0 representing audio level.
     """
-    if len(audio_chunk) == 0:
-        return 0.0
     # Calculate RMS (Root Mean Square) for audio level
-    rms = float(np.sqrt(np.mean(audio_chunk**2)))
+    rms = rms_level(audio_chunk)
     # Normalize to 0-1 range (assuming input is typically -1.0 to 1.0)
     # Clamp to prevent values > 1.0 from causing display issues
     # Scale: 0.5 RMS = full bar (so rms/0.5 gives 0-2 range, min caps at 1.0)
@@ -117,8 +116,10 @@ def start_recording_session(
     temp_audio_path = Path(temp_audio_file.name)
     temp_audio_file.close()
 
-    # Open WAV file for writing
-    wav_file = wave.open(str(temp_audio_path), "wb")
+    # Open WAV file for writing. The underlying file is kept so each block can
+    # be flushed to disk as soon as it is written (zero data loss principle).
+    audio_file = open(temp_audio_path, "wb")
+    wav_file = wave.open(audio_file, "wb")
     wav_file.setnchannels(1)  # mono
     wav_file.setsampwidth(2)  # 16-bit
     wav_file.setframerate(config.audio.sample_rate)  # 16kHz
@@ -132,12 +133,18 @@ def start_recording_session(
 
     def _audio_callback(indata, frames, timing, status):  # pragma: no cover
         # Write audio buffer to WAV file
-        # Convert float32 to int16 PCM
-        audio_int16 = (indata * 32767).astype(np.int16)
-        wav_file.writeframes(audio_int16.tobytes())
+        # Convert float32 to int16 PCM (saturating, so clipped input can't wrap)
+        audio_int16 = float_to_pcm16(indata)
+        # wave accepts any buffer, so pass the array itself rather than paying
+        # for a .tobytes() copy on every block. writeframes() keeps the RIFF
+        # header's frame count current, and the flush puts both the header
+        # and the new frames on disk, so a crash mid-recording still leaves a
+        # readable WAV file.
+        wav_file.writeframes(audio_int16.data)
+        audio_file.flush()
 
         # Calculate audio level for meter
-        level = _calculate_audio_level(indata.flatten())
+        level = _calculate_audio_level(indata)
         with audio_level_lock:
             audio_level_state["value"] = level
 
@@ -272,6 +279,9 @@ def start_recording_session(
             wav_file.close()
         except Exception:  # pragma: no cover - defensive cleanup
             pass
+        finally:
+            # wave only closes files it opened itself.
+            audio_file.close()
 
         # Wait for display thread to finish (with timeout)
         # Only call join once - removed duplicate
@@ -499,18 +509,20 @@ def _iter_transcripts(save_dir: Path) -> list[Path]:
     if not save_dir.exists():
         return []
 
-    files: list[Path] = []
-    for entry in save_dir.iterdir():
-        if not entry.is_file():
-            continue
-        if TRANSCRIPT_FILENAME_PATTERN.match(entry.name):
-            files.append(entry)
+    # os.scandir() reports each entry's type from the directory listing, so
+    # is_file() costs no extra stat() call; check the cheap name match first.
+    with os.scandir(save_dir) as entries:
+        files = [
+            Path(entry.path)
+            for entry in entries
+            if parse_transcript_filename(entry.name) is not None and entry.is_file()
+        ]
 
     # Sort by date (derived from filename) and ID, newest first.
     def sort_key(path: Path) -> tuple[str, str]:
-        match = TRANSCRIPT_FILENAME_PATTERN.match(path.name)
-        assert match is not None  # Covered by construction above
-        id_str, date_str = match.groups()
+        parsed = parse_transcript_filename(path.name)
+        assert parsed is not None  # Covered by construction above
+        id_str, date_str = parsed
         return (date_str, id_str)
 
     files.sort(key=sort_key, reverse=True)
@@ -540,15 +552,14 @@ def _get_transcript_path_by_id(save_dir: Path, user_supplied_id: str) -> Path |
     """
     normalised_id = normalize_id(user_supplied_id)
 
-    for entry in save_dir.iterdir():
-        if not entry.is_file():
-            continue
-        match = TRANSCRIPT_FILENAME_PATTERN.match(entry.name)
-        if not match:
-            continue
-        id_str, _date_str = match.groups()
-        if id_str == normalised_id:
-            return entry
+    with os.scandir(save_dir) as entries:
+        for entry in entries:
+            parsed = parse_transcript_filename(entry.name)
+            if parsed is None:
+                continue
+            id_str, _date_str = parsed
+            if id_str == normalised_id and entry.is_file():
+                return Path(entry.path)
 
     return None
 
@@ -643,10 +654,10 @@ def list_recordings(limit: int = 50):
     table.add_column("Filename")
 
     for path in transcripts:
-        match = TRANSCRIPT_FILENAME_PATTERN.match(path.name)
-        if not match:
+        parsed = parse_transcript_filename(path.name)
+        if parsed is None:
             continue
-        id_str, date_str = match.groups()
+        id_str, date_str = parsed
         formatted_date = f"{date_str[0:4]}-{date_str[4:6]}-{date_str[6:8]}"
         table.add_row(id_str, formatted_date, path.name)
 
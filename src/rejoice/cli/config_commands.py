@@ -108,6 +108,8 @@ transcription:
   model: medium  # tiny, base, small, medium, large
   language: auto  # auto-detect or language code (en, es, fr, etc.)
   vad_filter: true  # Voice Activity Detection
+  cpu_threads: 0  # CPU threads for transcription (0 = all cores)
+  num_workers: 1  # Parallel transcriptions sharing the model
 
 output:
   save_path: ~/Documents/transcripts  # Where to save transcripts
@@ -18,6 +18,8 @@ class TranscriptionConfig:
     model: str = "medium"
     language: str = "auto"
     vad_filter: bool = True
+    cpu_threads: int = 0  # 0 = one thread per CPU core
+    num_workers: int = 1
 
 
 @dataclass
@@ -66,6 +68,25 @@ class Config:
                 f"Must be one of: {', '.join(valid_models)}"
             )
 
+        # Validate CPU tuning for faster-whisper. Values from env vars or YAML
+        # may arrive as strings, so convert them before comparing.
+        self.transcription.cpu_threads = _as_int(
+            "cpu_threads", self.transcription.cpu_threads
+        )
+        self.transcription.num_workers = _as_int(
+            "num_workers", self.transcription.num_workers
+        )
+        if self.transcription.cpu_threads < 0:
+            raise ConfigError(
+                f"Invalid cpu_threads: {self.transcription.cpu_threads}. "
+                "Must be 0 (use all CPU cores) or a positive number."
+            )
+        if self.transcription.num_workers < 1:
+            raise ConfigError(
+                f"Invalid num_workers: {self.transcription.num_workers}. "
+                "Must be at least 1."
+            )
+
         # Validate sample rate (Whisper requires 16kHz)
         if self.audio.sample_rate != 16000:
             raise ConfigError(
@@ -78,6 +99,18 @@ class Config:
         self.ai.prompts_path = str(Path(self.ai.prompts_path).expanduser())
 
 
+def _as_int(name: str, value: Any) -> int:
+    """Return ``value`` as an int, raising ConfigError if it is not one."""
+    if isinstance(value, bool):
+        raise ConfigError(f"Invalid {name}: {value!r}. Must be an integer.")
+    if isinstance(value, int):
+        return value
+    try:
+        return int(str(value).strip())
+    except ValueError:
+        raise ConfigError(f"Invalid {name}: {value!r}. Must be an integer.") from None
+
+
 def get_config_dir() -> Path:
     """Get the configuration directory."""
     config_home = os.getenv("XDG_CONFIG_HOME")
@@ -93,6 +126,8 @@ def get_default_config() -> Dict[str, Any]:
             "model": "medium",
             "language": "auto",
             "vad_filter": True,
+            "cpu_threads": 0,
+            "num_workers": 1,
         },
         "output": {
             "save_path": "~/Documents/transcripts",
@@ -140,6 +175,8 @@ def load_env_overrides() -> Dict[str, Any]:
         "REJOICE_TRANSCRIPTION_MODEL": ("transcription", "model"),
         "REJOICE_TRANSCRIPTION_LANGUAGE": ("transcription", "language"),
         "REJOICE_TRANSCRIPTION_VAD_FILTER": ("transcription", "vad_filter"),
+        "REJOICE_TRANSCRIPTION_CPU_THREADS": ("transcription", "cpu_threads"),
+        "REJOICE_TRANSCRIPTION_NUM_WORKERS": ("transcription", "num_workers"),
         "REJOICE_OUTPUT_SAVE_PATH": ("output", "save_path"),
         "REJOICE_OUTPUT_TEMPLATE": ("output", "template"),
         "REJOICE_OUTPUT_AUTO_ANALYZE": ("output", "auto_analyze"),
@@ -14,7 +14,7 @@ import logging
 import sys
 import time
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from rich.console import Console
 from rich.panel import Panel
@@ -25,10 +25,8 @@ from rejoice.audio import get_audio_input_devices, record_audio
 from rejoice.core.config import get_config_dir, get_default_config
 from rejoice.transcript.manager import create_transcript
 
-try:
-    from faster_whisper import WhisperModel
-except ImportError:  # pragma: no cover
-    WhisperModel = None
+# Imported on first use in download_whisper_model(); see rejoice.transcription.
+WhisperModel: Any = None
 
 if TYPE_CHECKING:
     from ollama import Client as Ollama
@@ -113,6 +111,12 @@ def download_whisper_model(model: str, check_only: bool = False) -> bool:
         True if model is available (or was successfully downloaded),
         False if download failed.
     """
+    global WhisperModel
+    if WhisperModel is None:
+        try:
+            from faster_whisper import WhisperModel
+        except ImportError:  # pragma: no cover
+            pass
     if WhisperModel is None:
         console.print(
             "[red]Error: faster-whisper is not installed.[/red]\n"
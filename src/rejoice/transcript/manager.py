@@ -5,23 +5,36 @@ Implements [R-003] Transcript Manager - Create File.
 
 from __future__ import annotations
 
+import functools
+import logging
 import os
 import re
 import tempfile
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Tuple
+from typing import Optional, Sequence, Tuple
 
 import yaml
 
 from rejoice.exceptions import TranscriptError
 
+logger = logging.getLogger(__name__)
 
 ID_WIDTH = 6
-TRANSCRIPT_FILENAME_PATTERN = re.compile(
-    r"^(\d{%d})_transcript_(\d{8})\.md$" % ID_WIDTH
-)
+# Sidecar file recording the last allocated transcript ID so that new
+# transcripts do not require a full directory scan.
+NEXT_ID_FILENAME = ".rejoice_next_id"
+# Anchoring is left to ``fullmatch`` so the engine can reject trailing
+# characters without evaluating a separate ``$`` assertion.
+TRANSCRIPT_FILENAME_PATTERN = re.compile(r"(\d{%d})_transcript_(\d{8})\.md" % ID_WIDTH)
+
+# Bound once at import time to avoid an attribute lookup per filename in scans.
+_match_transcript_filename = TRANSCRIPT_FILENAME_PATTERN.fullmatch
+
+# Splits a transcript into its YAML frontmatter block and body in one pass.
+# The block is optional so that an empty ``---\n---`` frontmatter still matches.
+_FRONTMATTER_PATTERN = re.compile(r"^---\n(?:(.*?)\n)?---\n?(.*)\Z", re.DOTALL)
 
 
 @dataclass(frozen=True)
@@ -74,35 +87,95 @@ def normalize_id(user_input: str) -> str:
     return str(numeric).zfill(ID_WIDTH)
 
 
+@functools.lru_cache(maxsize=4096)
+def parse_transcript_filename(filename: str) -> Optional[Tuple[str, str]]:
+    """Parse a transcript filename into its ``(id, date)`` string parts.
+
+    Returns ``None`` if ``filename`` does not follow the standard
+    ``<id>_transcript_<YYYYMMDD>.md`` pattern. Results are memoised because
+    listings and ID scans re-parse the same filenames repeatedly.
+    """
+    match = _match_transcript_filename(filename)
+    if match is None:
+        return None
+    id_str, date_str = match.groups()
+    return id_str, date_str
+
+
 def get_next_id(save_dir: Path) -> str:
     """Get the next available 6-digit transcript ID.
 
-    IDs are sequential across all dates and zero-padded to 6 digits.
+    IDs are sequential across all dates and zero-padded to 6 digits. The last
+    allocated ID is read from the :data:`NEXT_ID_FILENAME` sidecar maintained
+    by :func:`create_transcript`, so no directory listing is needed; the
+    directory is only scanned when the sidecar is missing or unreadable.
+    Collisions with files the sidecar does not know about are resolved by the
+    exclusive create in :func:`create_transcript`.
     """
     if not save_dir.exists():
         return "0".zfill(ID_WIDTH)
 
-    max_id = 0
+    last_id = _read_last_id(save_dir)
+    if last_id is None:
+        last_id = _scan_max_id(save_dir)
 
-    for entry in save_dir.iterdir():
-        if not entry.is_file():
-            continue
+    return str(last_id + 1).zfill(ID_WIDTH)
+
+
+def _read_last_id(save_dir: Path) -> Optional[int]:
+    """Return the last allocated ID from the sidecar file, if it is usable."""
+    try:
+        raw = (save_dir / NEXT_ID_FILENAME).read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+
+    if not raw.isdigit():
+        return None
+    return int(raw)
 
-        match = TRANSCRIPT_FILENAME_PATTERN.match(entry.name)
-        if not match:
-            continue
 
-        id_str, _date_str = match.groups()
+def _record_last_id(save_dir: Path, transcript_id: str) -> None:
+    """Record ``transcript_id`` as the last allocated ID in the sidecar.
+
+    If the write fails the sidecar is removed, so the next call falls back to
+    a directory scan instead of trusting an outdated value.
+    """
+    sidecar = save_dir / NEXT_ID_FILENAME
+    try:
+        write_file_atomic(sidecar, transcript_id)
+    except OSError:
+        logger.warning("Failed to update %s", NEXT_ID_FILENAME, exc_info=True)
         try:
-            numeric_id = int(id_str)
-        except ValueError:
+            sidecar.unlink(missing_ok=True)
+        except OSError:
+            logger.warning("Failed to remove %s", NEXT_ID_FILENAME, exc_info=True)
+
+
+def _scan_max_id(save_dir: Path) -> int:
+    """Return the highest transcript ID present in ``save_dir`` (0 if none)."""
+    max_id = 0
+
+    # os.scandir() returns the file type with each directory entry, so
+    # is_file() needs no extra stat() call (unlike Path.iterdir()). The suffix
+    # check skips audio and other files before touching the parser's cache.
+    with os.scandir(save_dir) as entries:
+        names = [
+            entry.name
+            for entry in entries
+            if entry.name.endswith(".md") and entry.is_file()
+        ]
+
+    for name in names:
+        parsed = parse_transcript_filename(name)
+        if parsed is None:
             continue
 
+        # The pattern only captures digits, so int() cannot fail here.
+        numeric_id = int(parsed[0])
         if numeric_id > max_id:
             max_id = numeric_id
 
-    next_id = max_id + 1
-    return str(next_id).zfill(ID_WIDTH)
+    return max_id
 
 
 def generate_frontmatter(metadata: TranscriptMetadata) -> str:
@@ -164,27 +237,52 @@ def create_transcript(save_dir: Path) -> Tuple[Path, str]:
 
     max_attempts = 1000
     attempts = 0
+    transcript_id = get_next_id(save_dir)
 
     while attempts < max_attempts:
-        transcript_id = get_next_id(save_dir)
         date_str = datetime.now().strftime("%Y%m%d")
         filename = f"{transcript_id}_transcript_{date_str}.md"
         filepath = save_dir / filename
 
-        if not filepath.exists():
-            metadata = TranscriptMetadata(
-                transcript_id=transcript_id,
-                created=datetime.now(),
-            )
-            frontmatter = generate_frontmatter(metadata)
-            write_file_atomic(filepath, frontmatter)
-            return filepath, transcript_id
-
-        # If filename exists, try again with the next ID
-        # by creating a dummy file that get_next_id will see.
-        attempts += 1
-        # Bump the max ID by simulating that this ID exists.
-        filepath.touch(exist_ok=True)
+        try:
+            # O_EXCL reserves the filename atomically, so two concurrent
+            # recordings can never both claim the same ID on the same date.
+            # Transcripts are private, so the file is owner-only, matching the
+            # mode write_file_atomic's temporary files get on later rewrites.
+            fd = os.open(str(filepath), os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        except FileExistsError:
+            # If the filename is already taken, try the following ID directly
+            # rather than rescanning the directory.
+            attempts += 1
+            transcript_id = str(int(transcript_id) + 1).zfill(ID_WIDTH)
+            continue
+
+        metadata = TranscriptMetadata(
+            transcript_id=transcript_id,
+            created=datetime.now(),
+        )
+        data = generate_frontmatter(metadata).encode("utf-8")
+        try:
+            # The file was just created empty, so there is no prior content
+            # that a direct write could corrupt. The frontmatter is a few
+            # hundred bytes, so write it straight to the descriptor instead of
+            # building a buffered text wrapper around it.
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view) :]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        except OSError as exc:
+            filepath.unlink(missing_ok=True)
+            raise TranscriptError(
+                f"Failed to write transcript file '{filepath}': {exc}",
+                suggestion="Check available disk space and directory permissions.",
+            ) from exc
+
+        _record_last_id(save_dir, transcript_id)
+        return filepath, transcript_id
 
     raise TranscriptError(
         "Unable to create unique transcript file after multiple attempts.",
@@ -204,6 +302,22 @@ def append_to_transcript(filepath: Path, text: str) -> None:
         filepath: Path to the transcript markdown file.
         text: Text to append to the transcript body.
     """
+    append_many_to_transcript(filepath, [text])
+
+
+def append_many_to_transcript(filepath: Path, texts: Sequence[str]) -> None:
+    """Atomically append several lines of text to an existing transcript file.
+
+    Equivalent to calling :func:`append_to_transcript` once per item, but the
+    file is read and rewritten only once for the whole batch.
+
+    Args:
+        filepath: Path to the transcript markdown file.
+        texts: Lines to append to the transcript body, in order.
+    """
+    if not texts:
+        return
+
     existing = filepath.read_text(encoding="utf-8")
 
     # Ensure there is exactly one trailing newline before appending content
@@ -211,7 +325,7 @@ def append_to_transcript(filepath: Path, text: str) -> None:
         existing = existing + "\n"
 
     # Always end appended content with a newline to keep transcript tidy
-    updated = existing + text + "\n"
+    updated = existing + "".join(f"{text}\n" for text in texts)
 
     write_file_atomic(filepath, updated)
 
@@ -241,20 +355,16 @@ def update_status(filepath: Path, status: str) -> None:
             suggestion="Ensure transcripts are created via the transcript manager.",
         )
 
-    try:
-        # Find the first pair of frontmatter delimiters.
-        first_sep_end = raw.index("\n", 3)  # end of initial '---\n'
-        second_sep_start = raw.index("\n---", first_sep_end)
-    except ValueError as exc:  # pragma: no cover - defensive; tested via error paths
+    match = _FRONTMATTER_PATTERN.match(raw)
+    if match is None:
         raise TranscriptError(
             "Transcript frontmatter is malformed.",
             suggestion=(
                 "Check the transcript file for manual edits " "to the '---' markers."
             ),
-        ) from exc
+        )
 
-    frontmatter_block = raw[first_sep_end + 1 : second_sep_start]
-    body = raw[second_sep_start + len("\n---\n") :]
+    frontmatter_block, body = match.groups("")
 
     try:
         data = yaml.safe_load(frontmatter_block) or {}
@@ -310,19 +420,16 @@ def update_language(filepath: Path, language: str) -> None:
             suggestion="Ensure transcripts are created via the transcript manager.",
         )
 
-    try:
-        first_sep_end = raw.index("\n", 3)
-        second_sep_start = raw.index("\n---", first_sep_end)
-    except ValueError as exc:  # pragma: no cover - defensive; tested via error paths
+    match = _FRONTMATTER_PATTERN.match(raw)
+    if match is None:
         raise TranscriptError(
             "Transcript frontmatter is malformed.",
             suggestion=(
                 "Check the transcript file for manual edits " "to the '---' markers."
             ),
-        ) from exc
+        )
 
-    frontmatter_block = raw[first_sep_end + 1 : second_sep_start]
-    body = raw[second_sep_start + len("\n---\n") :]
+    frontmatter_block, body = match.groups("")
 
     try:
         data = yaml.safe_load(frontmatter_block) or {}
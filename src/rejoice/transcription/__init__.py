@@ -11,24 +11,129 @@ single ``transcribe_file`` method that yields normalised segments.
 from __future__ import annotations
 
 import logging
+import os
+import threading
+import wave
 from pathlib import Path
-from typing import Dict, Iterable, Iterator, Optional, cast
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Union, cast
+
+import numpy as np
 
 from rejoice.transcript.manager import append_to_transcript, update_language
 from rejoice.core.config import TranscriptionConfig
 from rejoice.exceptions import TranscriptionError
 
-try:  # pragma: no cover - happy path is exercised via monkeypatched model
-    from faster_whisper import WhisperModel as _WhisperModel
-except Exception:  # pragma: no cover - exercised only if dependency is missing
-    _WhisperModel = None
+# faster-whisper pulls in CTranslate2 and tokenizers, which adds hundreds of
+# milliseconds to every import of this module, so it is only imported when a
+# Transcriber is first constructed. The classes are bound to public names so
+# tests and other modules can monkeypatch or introspect the model constructor
+# without importing faster-whisper directly.
+WhisperModel: Any = None
+BatchedInferencePipeline: Any = None
+
 
-# Rebind into a public name so tests and other modules can monkeypatch or
-# introspect the model constructor without importing faster-whisper directly.
-WhisperModel = _WhisperModel
+def _import_faster_whisper() -> None:
+    """Bind the faster-whisper classes on first use.
+
+    Leaves ``WhisperModel`` as ``None`` when the dependency is missing so the
+    caller can raise a helpful :class:`TranscriptionError`.
+    """
+    global WhisperModel, BatchedInferencePipeline
+    if WhisperModel is not None:
+        return
+    try:
+        import faster_whisper
+    except Exception:  # pragma: no cover - exercised only if dependency is missing
+        return
+    WhisperModel = faster_whisper.WhisperModel
+    # Only available in faster-whisper >= 1.1
+    BatchedInferencePipeline = getattr(faster_whisper, "BatchedInferencePipeline", None)
+
+
+# Files longer than this are decoded through faster-whisper's batched pipeline,
+# which transcribes several VAD-delimited windows per encoder call. Shorter
+# audio (such as real-time chunks) keeps the lower-latency sequential path.
+BATCHED_MIN_DURATION_SECONDS = 60.0
+BATCH_SIZE = 8
 
 logger = logging.getLogger(__name__)
 
+# Loaded models shared by every Transcriber in the process, keyed on
+# ``(model, device, compute_type, cpu_threads, num_workers)``. Loading weights
+# takes seconds and hundreds of megabytes, so each combination is only ever
+# loaded once.
+_MODEL_CACHE: Dict[Tuple[str, str, str, int, int], Any] = {}
+_MODEL_CACHE_LOCK = threading.Lock()
+
+
+def _get_model(
+    model: str,
+    device: str,
+    compute_type: str,
+    cpu_threads: int = 0,
+    num_workers: int = 1,
+) -> Any:
+    """Return the shared ``WhisperModel`` for the given settings, loading it once."""
+    key = (model, device, compute_type, cpu_threads, num_workers)
+    with _MODEL_CACHE_LOCK:
+        cached = _MODEL_CACHE.get(key)
+        if cached is None:
+            # Enforce local-only operation to comply with "all local, no cloud"
+            # vision. Models must be downloaded once (during setup) and then
+            # work offline.
+            cached = WhisperModel(
+                model,
+                device=device,
+                compute_type=compute_type,
+                cpu_threads=cpu_threads,
+                num_workers=num_workers,
+                local_files_only=True,  # Prevent runtime cloud downloads
+            )
+            _MODEL_CACHE[key] = cached
+        return cached
+
+
+def clear_model_cache() -> None:
+    """Drop all shared models so the next Transcriber reloads its weights."""
+    with _MODEL_CACHE_LOCK:
+        _MODEL_CACHE.clear()
+
+
+def _cuda_available() -> bool:
+    """Return ``True`` if CTranslate2 (faster-whisper's backend) can see a GPU."""
+    try:
+        import ctranslate2
+
+        return bool(ctranslate2.get_cuda_device_count() > 0)
+    except Exception:  # pragma: no cover - missing or broken CUDA runtime
+        return False
+
+
+def _resolve_device(device: str, compute_type: str) -> Tuple[str, str]:
+    """Resolve ``"auto"`` device and compute type values to concrete settings.
+
+    ``device="auto"`` selects ``"cuda"`` when a GPU is available and ``"cpu"``
+    otherwise. ``compute_type="auto"`` selects ``"float16"`` on CUDA and
+    dynamic ``"int8"`` quantisation on CPU, which is markedly faster than
+    float32 with negligible accuracy loss.
+    """
+    if device == "auto":
+        device = "cuda" if _cuda_available() else "cpu"
+    if compute_type == "auto":
+        compute_type = "float16" if device == "cuda" else "int8"
+    return device, compute_type
+
+
+def _resolve_cpu_threads(cpu_threads: int) -> int:
+    """Resolve a configured thread count, where ``0`` means one per CPU core.
+
+    CTranslate2 otherwise falls back to a fixed small pool, which leaves cores
+    idle on typical desktop machines.
+    """
+    if cpu_threads > 0:
+        return cpu_threads
+    return max(1, os.cpu_count() or 1)
+
 
 class Transcriber:
     """High-level transcription facade wrapping faster-whisper.
@@ -40,19 +145,21 @@ class Transcriber:
         model size, default language and VAD behaviour.
     device:
         Device string passed through to ``WhisperModel`` (for example, ``"cpu"``
-        or ``"cuda"``). Defaults to ``"cpu"``.
+        or ``"cuda"``). Defaults to ``"auto"``, which uses CUDA when available.
     compute_type:
         Compute type string for faster-whisper (for example, ``"int8"`` or
-        ``"float16"``). Defaults to ``"int8"`` for modest resource usage.
+        ``"float16"``). Defaults to ``"auto"``: ``"float16"`` on CUDA and
+        ``"int8"`` on CPU.
     """
 
     def __init__(
         self,
         config: TranscriptionConfig,
         *,
-        device: str = "cpu",
-        compute_type: str = "int8",
+        device: str = "auto",
+        compute_type: str = "auto",
     ) -> None:
+        _import_faster_whisper()
         if WhisperModel is None:
             # Provide a clear, actionable error instead of a low-level ImportError.
             raise TranscriptionError(
@@ -69,15 +176,24 @@ class Transcriber:
         # Track the last language used/detected for [T-002] so that callers
         # can persist it into transcript frontmatter if desired.
         self._last_language: Optional[str] = None
+        # faster-whisper treats ``language=None`` as "auto-detect", which matches
+        # our config semantics where ``language='auto'`` means "let the model
+        # decide". Resolved once here rather than on every transcription call.
+        self._language_arg: Optional[str] = (
+            None if config.language == "auto" else config.language
+        )
+        # Created lazily on the first long file; see BATCHED_MIN_DURATION_SECONDS.
+        self._batched_pipeline: Optional[Any] = None
+
+        device, compute_type = _resolve_device(device, compute_type)
 
         try:
-            # Enforce local-only operation to comply with "all local, no cloud" vision.
-            # Models must be downloaded once (during setup) and then work offline.
-            self._model = WhisperModel(
+            self._model = _get_model(
                 config.model,
-                device=device,
-                compute_type=compute_type,
-                local_files_only=True,  # Prevent runtime cloud downloads
+                device,
+                compute_type,
+                cpu_threads=_resolve_cpu_threads(config.cpu_threads),
+                num_workers=config.num_workers,
             )
         except Exception as exc:  # pragma: no cover - exercised via error tests
             message = f"Failed to load transcription model '{config.model}': {exc}"
@@ -128,58 +244,119 @@ class Transcriber:
         TranscriptionError
             If the underlying model raises any error during transcription.
         """
+        return self._transcribe(
+            audio_path,
+            description=f"'{audio_path}'",
+            suggestion="Verify that the audio file exists and is a supported format.",
+            batched=self._should_batch(audio_path),
+        )
 
-        # faster-whisper treats ``language=None`` as "auto-detect", which matches
-        # our config semantics where ``language='auto'`` means "let the model
-        # decide".
-        if self._config.language == "auto":
-            language_arg: Optional[str] = None
-        else:
-            language_arg = self._config.language
+    def transcribe_array(self, audio: np.ndarray) -> Iterator[Dict[str, object]]:
+        """Transcribe in-memory audio and yield normalised segment dictionaries.
+
+        This mirrors :meth:`transcribe_file` but hands the samples straight to
+        faster-whisper, avoiding a WAV encode/decode round-trip for audio that
+        is already in memory (for example, real-time recording chunks).
+
+        Parameters
+        ----------
+        audio:
+            Mono float32 samples at 16 kHz, in the range -1.0 to 1.0.
+
+        Raises
+        ------
+        TranscriptionError
+            If the underlying model raises any error during transcription.
+        """
+        for seg in self._iter_array_segments(audio):
+            yield _segment_to_dict(seg)
+
+    def transcribe_array_texts(self, audio: np.ndarray) -> Iterator[str]:
+        """Transcribe in-memory audio and yield only the non-empty segment texts.
+
+        A leaner variant of :meth:`transcribe_array` for callers that discard
+        timestamps, such as the real-time worker; no per-segment dictionaries
+        are built.
+        """
+        for seg in self._iter_array_segments(audio):
+            text = getattr(seg, "text", "").strip()
+            if text:
+                yield text
+
+    def _iter_array_segments(self, audio: np.ndarray) -> Iterator[Any]:
+        """Run the model on in-memory samples and yield its raw segments."""
+        return self._iter_raw_segments(
+            audio.astype(np.float32, copy=False),
+            description=f"in-memory audio ({len(audio)} samples)",
+            suggestion="Verify that the audio is mono float32 sampled at 16 kHz.",
+        )
+
+    def _should_batch(self, audio_path: str) -> bool:
+        """Return whether ``audio_path`` should use the batched pipeline.
+
+        Batched inference splits audio on VAD boundaries, so it is only used
+        when VAD filtering is enabled and the file is long enough to benefit.
+        """
+        if BatchedInferencePipeline is None or not self._config.vad_filter:
+            return False
+        duration = _wav_duration_seconds(audio_path)
+        return duration is not None and duration > BATCHED_MIN_DURATION_SECONDS
+
+    def _transcribe(
+        self,
+        audio: Union[str, np.ndarray],
+        *,
+        description: str,
+        suggestion: str,
+        batched: bool = False,
+    ) -> Iterator[Dict[str, object]]:
+        """Run the model on ``audio`` and yield normalised segments."""
+        for seg in self._iter_raw_segments(
+            audio, description=description, suggestion=suggestion, batched=batched
+        ):
+            yield _segment_to_dict(seg)
+
+    def _iter_raw_segments(
+        self,
+        audio: Union[str, np.ndarray],
+        *,
+        description: str,
+        suggestion: str,
+        batched: bool = False,
+    ) -> Iterator[Any]:
+        """Run the model on ``audio`` and yield faster-whisper's own segments."""
+
+        language_arg = self._language_arg
 
         try:
-            segments, info = self._model.transcribe(
-                audio_path,
-                vad_filter=self._config.vad_filter,
-                language=language_arg,
-            )
+            if batched:
+                if self._batched_pipeline is None:
+                    self._batched_pipeline = BatchedInferencePipeline(model=self._model)
+                segments, info = self._batched_pipeline.transcribe(
+                    audio,
+                    batch_size=BATCH_SIZE,
+                    vad_filter=self._config.vad_filter,
+                    language=language_arg,
+                )
+            else:
+                segments, info = self._model.transcribe(
+                    audio,
+                    vad_filter=self._config.vad_filter,
+                    language=language_arg,
+                )
         except Exception as exc:
-            message = f"Transcription failed for '{audio_path}': {exc}"
+            message = f"Transcription failed for {description}: {exc}"
             logger.error(message, exc_info=True)
-            raise TranscriptionError(
-                message,
-                suggestion=(
-                    "Verify that the audio file exists and is a supported format."
-                ),
-            ) from exc
+            raise TranscriptionError(message, suggestion=suggestion) from exc
 
-        # Derive the effective language for this transcription run.
-        detected_language: Optional[str]
-        if language_arg is not None:
-            detected_language = language_arg
+        # Derive the effective language for this transcription run; the model
+        # output only needs inspecting when auto-detection was requested.
+        if language_arg is None:
+            self._last_language = _detected_language(info)
         else:
-            # For auto-detection, faster-whisper exposes language information
-            # via the ``info`` object; support both attribute and mapping styles.
-            detected_language = None
-            if hasattr(info, "language"):
-                detected_language = getattr(info, "language")
-            elif isinstance(info, dict) and "language" in info:
-                detected_language = cast(Optional[str], info.get("language"))
-            elif hasattr(info, "get") and hasattr(info, "__contains__"):
-                # Support dict-like objects that aren't actually dicts
-                if "language" in info:
-                    detected_language = cast(Optional[str], info.get("language"))
-
-        self._last_language = detected_language
-
-        # Normalise the third-party segment objects into simple dictionaries so
-        # the rest of the codebase does not depend on faster-whisper's types.
-        for seg in _normalise_iterable(segments):
-            yield {
-                "text": getattr(seg, "text", "").strip(),
-                "start": float(getattr(seg, "start", 0.0)),
-                "end": float(getattr(seg, "end", 0.0)),
-            }
+            self._last_language = language_arg
+
+        yield from _normalise_iterable(segments)
 
     def stream_file_to_transcript(
         self, audio_path: str, transcript_path: Path
@@ -217,12 +394,50 @@ class Transcriber:
             update_language(transcript_path, effective_language)
 
 
+def _segment_to_dict(seg: object) -> Dict[str, object]:
+    """Normalise a faster-whisper segment into a plain dictionary.
+
+    Keeps the rest of the codebase independent of faster-whisper's types.
+    """
+    return {
+        "text": getattr(seg, "text", "").strip(),
+        "start": float(getattr(seg, "start", 0.0)),
+        "end": float(getattr(seg, "end", 0.0)),
+    }
+
+
+def _detected_language(info: object) -> Optional[str]:
+    """Extract the detected language from faster-whisper's ``info`` object.
+
+    Supports both attribute-style objects and mappings (including dict-like
+    objects that only implement ``get``).
+    """
+    language = getattr(info, "language", None)
+    if language is None and hasattr(info, "get"):
+        language = info.get("language")
+    return cast(Optional[str], language)
+
+
+def _wav_duration_seconds(audio_path: str) -> Optional[float]:
+    """Return the duration of a WAV file, or ``None`` if it cannot be read."""
+    try:
+        with wave.open(audio_path, "rb") as wav_file:
+            return wav_file.getnframes() / wav_file.getframerate()
+    except Exception:
+        return None
+
+
 def _normalise_iterable(segments: Iterable[object]) -> Iterable[object]:
     """Return an iterable of segment-like objects from the model output."""
     return segments
 
 
-__all__ = ["Transcriber", "WhisperModel"]
+__all__ = [
+    "BatchedInferencePipeline",
+    "Transcriber",
+    "WhisperModel",
+    "clear_model_cache",
+]
 
 # Import real-time transcription components
 # Note: RealtimeTranscriptionWorker is imported directly in commands.py
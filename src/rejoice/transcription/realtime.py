@@ -8,17 +8,17 @@ confirmed.
 from __future__ import annotations
 
 import logging
-import tempfile
 import threading
-import wave
+from collections import deque
 from pathlib import Path
 from queue import Empty, Queue
-from typing import Optional
+from typing import Deque, List, Optional
 
 import numpy as np
 
+from rejoice.audio import rms_level
 from rejoice.exceptions import TranscriptionError
-from rejoice.transcript.manager import append_to_transcript
+from rejoice.transcript.manager import append_many_to_transcript
 from rejoice.transcription import Transcriber
 
 logger = logging.getLogger(__name__)
@@ -27,9 +27,10 @@ logger = logging.getLogger(__name__)
 class RealtimeTranscriptionWorker:
     """Background worker that processes audio chunks for real-time transcription.
 
-    This worker runs in a separate thread, consuming audio chunks from a queue
-    and transcribing them incrementally. Transcribed segments are appended to
-    the transcript file as they are confirmed.
+    This worker runs in a separate thread, consuming audio chunks from a deque
+    and transcribing them incrementally. Transcribed segments are handed to a
+    second writer thread that appends them to the transcript file, so file I/O
+    for one window overlaps with transcription of the next.
 
     Parameters
     ----------
@@ -41,6 +42,12 @@ class RealtimeTranscriptionWorker:
         Audio sample rate (default: 16000 Hz).
     min_chunk_size_seconds:
         Minimum chunk size in seconds before processing (default: 1.0).
+    silence_threshold:
+        RMS level below which accumulated audio is treated as silence and
+        discarded without invoking the model (default: 0.001).
+    max_chunk_size_seconds:
+        Upper bound on a single transcription window when a backlog of chunks
+        has built up (default: 30.0, Whisper's native window length).
     """
 
     def __init__(
@@ -49,23 +56,42 @@ class RealtimeTranscriptionWorker:
         transcript_path: Path,
         sample_rate: int = 16000,
         min_chunk_size_seconds: float = 1.0,
+        silence_threshold: float = 1e-3,
+        max_chunk_size_seconds: float = 30.0,
     ):
         self.transcriber = transcriber
         self.transcript_path = transcript_path
         self.sample_rate = sample_rate
         self.min_chunk_size_seconds = min_chunk_size_seconds
         self.min_chunk_samples = int(min_chunk_size_seconds * sample_rate)
+        self.silence_threshold = silence_threshold
+        self.max_chunk_samples = max(
+            int(max_chunk_size_seconds * sample_rate), self.min_chunk_samples
+        )
 
-        # Thread-safe queue for audio chunks
-        self.audio_queue: Queue[np.ndarray] = Queue()
+        # Audio chunks from the capture callback. There is exactly one producer
+        # and one consumer, so a deque (whose append/popleft are atomic) plus
+        # a wake-up event avoids Queue's mutex and condition per chunk.
+        self.audio_queue: Deque[np.ndarray] = deque()
+        self._audio_ready = threading.Event()
         self.is_running = threading.Event()
         self.worker_thread: Optional[threading.Thread] = None
 
-        # Accumulated audio buffer
-        self.accumulated_audio: list[np.ndarray] = []
-
-        # Lock for thread-safe file operations
-        self.file_lock = threading.Lock()
+        # Preallocated float32 arena holding audio that has not been
+        # transcribed yet, plus a write cursor. Appending copies into the arena
+        # instead of re-concatenating a list of chunks on every pass.
+        self._buffer = np.empty(max(self.min_chunk_samples * 2, 1), dtype=np.float32)
+        self._buffer_len = 0
+
+        # Batches of transcribed text waiting to be appended by the writer
+        # thread. ``None`` is the shutdown sentinel sent once the worker loop
+        # has drained. ``_writer_lock`` makes checking ``_writer_accepting``
+        # and queueing a batch atomic with closing the queue, so no batch can
+        # land behind the sentinel.
+        self.append_queue: Queue[Optional[List[str]]] = Queue()
+        self.writer_thread: Optional[threading.Thread] = None
+        self._writer_accepting = False
+        self._writer_lock = threading.Lock()
 
         # Track processed chunks for testing/debugging
         self.processed_chunks_count = 0
@@ -77,6 +103,11 @@ class RealtimeTranscriptionWorker:
             return
 
         self.is_running.set()
+        self._writer_accepting = True
+        self.writer_thread = threading.Thread(
+            target=self._writer_loop, daemon=True, name="RealtimeTranscriptWriter"
+        )
+        self.writer_thread.start()
         self.worker_thread = threading.Thread(
             target=self._worker_loop, daemon=True, name="RealtimeTranscriptionWorker"
         )
@@ -95,44 +126,65 @@ class RealtimeTranscriptionWorker:
             return
 
         self.is_running.clear()
+        self._audio_ready.set()  # Wake the worker so it notices promptly
         if self.worker_thread.is_alive():
             self.worker_thread.join(timeout=timeout)
             if self.worker_thread.is_alive():
                 logger.warning(
                     "Realtime transcription worker thread did not stop within timeout"
                 )
+                # The worker only sends the writer its sentinel once it has
+                # drained, so send it here or the writer would wait forever.
+                # Anything the worker produces later is appended directly.
+                self._close_writer()
             else:
                 logger.info("Stopped real-time transcription worker thread")
 
+        if self.writer_thread is not None and self.writer_thread.is_alive():
+            self.writer_thread.join(timeout=timeout)
+            if self.writer_thread.is_alive():
+                logger.warning(
+                    "Realtime transcript writer thread did not stop within timeout"
+                )
+
     def add_audio_chunk(self, audio_chunk: np.ndarray) -> None:
         """Add an audio chunk to the processing queue.
 
+        The worker takes ownership of ``audio_chunk`` without copying it, so
+        callers must not modify the array afterwards. Producers that reuse
+        their buffer (such as a sounddevice callback's ``indata``) should pass
+        a copy.
+
         Parameters
         ----------
         audio_chunk:
             Audio data as a numpy array (float32, mono).
         """
         if self.is_running.is_set():
-            self.audio_queue.put(audio_chunk.copy())
+            self.audio_queue.append(audio_chunk)
+            self._audio_ready.set()
 
     def _worker_loop(self) -> None:
         """Main worker loop that processes audio chunks from the queue."""
         logger.debug("Realtime transcription worker loop started")
 
-        while self.is_running.is_set() or not self.audio_queue.empty():
+        while self.is_running.is_set() or self.audio_queue:
             try:
-                # Get audio chunk from queue (with timeout to allow checking is_running)
-                try:
-                    chunk = self.audio_queue.get(timeout=0.1)
-                except Empty:
+                if not self.audio_queue:
+                    # Clear before re-checking so a chunk appended in between
+                    # still wakes us; the timeout lets us re-check is_running.
+                    self._audio_ready.clear()
+                    if not self.audio_queue:
+                        self._audio_ready.wait(timeout=0.1)
                     continue
+                chunk = self.audio_queue.popleft()
 
                 # Accumulate chunks until we have enough for processing
-                self.accumulated_audio.append(chunk)
-
-                # Check if we have enough accumulated audio
-                total_samples = sum(len(c) for c in self.accumulated_audio)
-                if total_samples >= self.min_chunk_samples:
+                self._append_to_buffer(chunk)
+                if self._buffer_len >= self.min_chunk_samples:
+                    # If transcription has fallen behind, fold the backlog into
+                    # this window so it costs one model call instead of many.
+                    self._drain_backlog()
                     self._process_accumulated_audio()
             except Exception as exc:
                 # Log error but continue processing (don't stop recording)
@@ -141,57 +193,131 @@ class RealtimeTranscriptionWorker:
                     exc_info=True,
                 )
 
-        # Process any remaining accumulated audio
-        if self.accumulated_audio:
-            self._process_accumulated_audio()
+        try:
+            # Process any remaining accumulated audio
+            if self._buffer_len:
+                self._process_accumulated_audio()
+        finally:
+            # Let the writer finish the queued text and exit; anything produced
+            # after this point is appended directly.
+            self._close_writer()
 
         logger.debug("Realtime transcription worker loop finished")
 
+    def _drain_backlog(self) -> None:
+        """Move already-queued chunks into the buffer, up to one full window."""
+        while self._buffer_len < self.max_chunk_samples:
+            try:
+                chunk = self.audio_queue.popleft()
+            except IndexError:
+                return
+            self._append_to_buffer(chunk)
+
+    def _writer_loop(self) -> None:
+        """Append transcribed text from ``append_queue`` until the sentinel."""
+        stopping = False
+        while not stopping:
+            texts = self.append_queue.get()
+            if texts is None:
+                break
+            # Coalesce any other batches that are already waiting so they are
+            # written to the transcript in a single rewrite.
+            while True:
+                try:
+                    more = self.append_queue.get_nowait()
+                except Empty:
+                    break
+                if more is None:
+                    stopping = True
+                    break
+                texts.extend(more)
+            try:
+                self._append_texts(texts)
+            except Exception as exc:
+                # Log error but keep draining so later segments are not lost
+                logger.error(
+                    f"Error appending real-time transcription segments: {exc}",
+                    exc_info=True,
+                )
+
+    def _close_writer(self) -> None:
+        """Stop queueing text and send the writer its shutdown sentinel once."""
+        with self._writer_lock:
+            if not self._writer_accepting:
+                return
+            self._writer_accepting = False
+            self.append_queue.put(None)
+
+    def _append_texts(self, texts: List[str]) -> None:
+        """Append ``texts`` to the transcript in one atomic rewrite."""
+        append_many_to_transcript(self.transcript_path, texts)
+
+    def _write_segments(self, texts: List[str]) -> None:
+        """Queue ``texts`` for the writer thread, or append them directly.
+
+        The writer thread is the only one touching the transcript while it
+        runs, so no file lock is needed. Once it has been told to stop, wait
+        for it to flush what is queued before appending here, which keeps
+        segments in order and never has two writers on the file at once.
+        """
+        if not texts:
+            return
+        with self._writer_lock:
+            if self._writer_accepting:
+                self.append_queue.put(texts)
+                return
+        writer = self.writer_thread
+        if writer is not None and writer is not threading.current_thread():
+            writer.join()
+        self._append_texts(texts)
+
+    def _append_to_buffer(self, chunk: np.ndarray) -> None:
+        """Copy ``chunk`` into the accumulation arena, growing it if needed."""
+        samples = chunk.reshape(-1)
+        end = self._buffer_len + len(samples)
+        if end > len(self._buffer):
+            grown = np.empty(max(end, len(self._buffer) * 2), dtype=np.float32)
+            grown[: self._buffer_len] = self._buffer[: self._buffer_len]
+            self._buffer = grown
+        self._buffer[self._buffer_len : end] = samples
+        self._buffer_len = end
+
     def _process_accumulated_audio(self) -> None:
         """Process accumulated audio chunks by transcribing them."""
-        if not self.accumulated_audio:
+        if not self._buffer_len:
             return
 
         try:
-            # Concatenate accumulated audio
-            audio_array = np.concatenate(self.accumulated_audio)
-
-            # Save to temporary WAV file for faster-whisper
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp_file:
-                tmp_path = Path(tmp_file.name)
-
-            # Write audio to WAV file
-            with wave.open(str(tmp_path), "wb") as wav_file:
-                wav_file.setnchannels(1)  # mono
-                wav_file.setsampwidth(2)  # 16-bit
-                wav_file.setframerate(self.sample_rate)
-
-                # Convert float32 to int16 PCM
-                audio_int16 = (audio_array * 32767).astype(np.int16)
-                wav_file.writeframes(audio_int16.tobytes())
-
-            # Transcribe the chunk
+            # A view over the filled part of the arena; no copy is made.
+            audio_array = self._buffer[: self._buffer_len]
+
+            # Skip the model entirely for silent windows; an encoder pass is
+            # far more expensive than this energy check.
+            if rms_level(audio_array) < self.silence_threshold:
+                logger.debug("Skipping silent real-time audio window")
+                self._buffer_len = 0
+                return
+
+            # Transcribe the samples directly; faster-whisper accepts float32
+            # arrays, so there is no need to round-trip through a WAV file.
+            # Only the text is kept, so skip building per-segment dictionaries.
+            texts: List[str] = []
             try:
-                for segment in self.transcriber.transcribe_file(str(tmp_path)):
-                    text = str(segment.get("text", "") or "").strip()
-                    if text:
-                        # Thread-safe append to transcript
-                        with self.file_lock:
-                            append_to_transcript(self.transcript_path, text)
-                        self.processed_chunks_count += 1
-                        logger.debug(
-                            f"Appended real-time transcription segment: {text[:50]}"
-                        )
-
+                for text in self.transcriber.transcribe_array_texts(audio_array):
+                    texts.append(text)
             finally:
-                # Clean up temp file
-                try:
-                    tmp_path.unlink(missing_ok=True)
-                except Exception:  # pragma: no cover
-                    pass
-
-            # Clear accumulated audio after processing
-            self.accumulated_audio.clear()
+                # Hand the whole window over at once so it costs a single
+                # write, including any segments decoded before a failure.
+                self._write_segments(texts)
+                self.processed_chunks_count += len(texts)
+                if texts:
+                    # This window's text is already written, so drop it rather
+                    # than letting a retry after a failure write it twice.
+                    self._buffer_len = 0
+            logger.debug(f"Queued {len(texts)} real-time transcription segment(s)")
+
+            # Reset the cursor after processing; the arena is reused.
+            self._buffer_len = 0
 
         except TranscriptionError as exc:
             # Log transcription errors but don't stop recording
@@ -213,20 +339,28 @@ class RealtimeTranscriptionWorker:
         remaining_audio_path:
             Optional path to audio file containing remaining audio to transcribe.
         """
+        if self.worker_thread is not None and self.worker_thread.is_alive():
+            # The worker still owns the buffer and may append to the
+            # transcript, so wait for it rather than racing it or dropping the
+            # final pass.
+            logger.info("Waiting for real-time transcription worker to finish")
+            self.worker_thread.join()
+
         # Process any accumulated audio that didn't reach min_chunk_size
-        if self.accumulated_audio:
+        if self._buffer_len:
             self._process_accumulated_audio()
 
         # Process remaining audio file if provided
         if remaining_audio_path and remaining_audio_path.exists():
             try:
+                texts: List[str] = []
                 for segment in self.transcriber.transcribe_file(
                     str(remaining_audio_path)
                 ):
                     text = str(segment.get("text", "") or "").strip()
                     if text:
-                        with self.file_lock:
-                            append_to_transcript(self.transcript_path, text)
+                        texts.append(text)
+                self._write_segments(texts)
                 logger.info("Final transcription pass completed")
             except TranscriptionError as exc:
                 logger.warning(f"Error in final transcription pass: {exc}")
@@ -11,6 +11,7 @@ if str(src_path) not in sys.path:
 import pytest  # noqa: E402
 import tempfile  # noqa: E402
 import shutil  # noqa: E402
+from click.testing import CliRunner  # noqa: E402
 
 
 @pytest.fixture
@@ -35,3 +36,9 @@ def config_dir(tmp_dir):
     config_dir = tmp_dir / ".rejoice" / "config"
     config_dir.mkdir(parents=True)
     return config_dir
+
+
+@pytest.fixture(scope="session")
+def cli_runner():
+    """Shared Click test runner; it keeps no state between invocations."""
+    return CliRunner()
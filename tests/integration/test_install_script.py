@@ -7,10 +7,14 @@ Full installation testing should be done manually on clean systems.
 import subprocess
 from pathlib import Path
 
+SCRIPTS_DIR = Path(__file__).parent.parent.parent / "scripts"
+INSTALL_SCRIPT = SCRIPTS_DIR / "install.sh"
+SHEBANG = b"#!/bin/bash"
+
 
 def test_install_script_syntax():
     """Test that the installation script has valid bash syntax."""
-    script_path = Path(__file__).parent.parent.parent / "scripts" / "install.sh"
+    script_path = INSTALL_SCRIPT
 
     # Use bash -n to check syntax without executing
     result = subprocess.run(
@@ -22,19 +26,21 @@ def test_install_script_syntax():
 
 def test_install_script_exists():
     """Test that the installation script exists."""
-    script_path = Path(__file__).parent.parent.parent / "scripts" / "install.sh"
+    script_path = INSTALL_SCRIPT
     assert script_path.exists(), "Installation script not found"
     assert script_path.is_file(), "Installation script is not a file"
 
 
 def test_install_script_is_executable():
     """Test that the installation script is executable."""
-    script_path = Path(__file__).parent.parent.parent / "scripts" / "install.sh"
+    script_path = INSTALL_SCRIPT
     assert script_path.stat().st_mode & 0o111, "Installation script is not executable"
 
 
 def test_install_script_has_shebang():
     """Test that the installation script has a shebang line."""
-    script_path = Path(__file__).parent.parent.parent / "scripts" / "install.sh"
-    content = script_path.read_text()
-    assert content.startswith("#!/bin/bash"), "Script missing shebang line"
+    script_path = INSTALL_SCRIPT
+    # Only the first line matters, so avoid reading the whole script.
+    with script_path.open("rb") as script:
+        head = script.read(len(SHEBANG))
+    assert head == SHEBANG, "Script missing shebang line"
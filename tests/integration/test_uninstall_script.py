@@ -11,6 +11,7 @@ from pathlib import Path
 
 SCRIPTS_DIR = Path(__file__).parent.parent.parent / "scripts"
 UNINSTALL_SCRIPT = SCRIPTS_DIR / "uninstall.sh"
+SHEBANG = b"#!/bin/bash"
 
 
 def test_uninstall_script_exists():
@@ -21,8 +22,10 @@ def test_uninstall_script_exists():
 
 def test_uninstall_script_has_shebang():
     """The uninstall script should start with a bash shebang."""
-    content = UNINSTALL_SCRIPT.read_text()
-    assert content.startswith("#!/bin/bash"), "Uninstall script missing bash shebang"
+    # Only the first line matters, so avoid reading the whole script.
+    with UNINSTALL_SCRIPT.open("rb") as script:
+        head = script.read(len(SHEBANG))
+    assert head == SHEBANG, "Uninstall script missing bash shebang"
 
 
 def test_uninstall_script_is_executable():
@@ -1,14 +1,28 @@
 """Tests for audio device detection and configuration commands."""
 
-from unittest.mock import patch
-
-from click.testing import CliRunner
-
-from rejoice.audio import get_audio_input_devices, record_audio
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+import rejoice.audio
+from rejoice.audio import (
+    float_to_pcm16,
+    get_audio_input_devices,
+    record_audio,
+    rms_level,
+)
 from rejoice.cli.commands import main
 
+# Tests that patch attributes of the real ``sounddevice`` module need it to have
+# imported, which also requires the PortAudio system library.
+requires_sounddevice = pytest.mark.skipif(
+    rejoice.audio.sd is None, reason="sounddevice (PortAudio) is not available"
+)
+
 
-def test_get_audio_input_devices_filters_input_only():
+@requires_sounddevice
+def test_get_audio_input_devices_filters_input_only(monkeypatch):
     """GIVEN sounddevice reports multiple devices
     WHEN get_audio_input_devices is called
     THEN only input-capable devices are returned"""
@@ -18,15 +32,19 @@ def test_get_audio_input_devices_filters_input_only():
         {"name": "USB Mic", "max_input_channels": 1, "max_output_channels": 0},
     ]
 
-    with patch("rejoice.audio.sd.query_devices", return_value=fake_devices):
-        devices = get_audio_input_devices()
+    monkeypatch.setattr(
+        "rejoice.audio.sd.query_devices", lambda *args, **kwargs: fake_devices
+    )
+
+    devices = get_audio_input_devices()
 
     assert len(devices) == 1
     assert devices[0]["name"] == "USB Mic"
     assert devices[0]["index"] == 1  # index should match position from sounddevice
 
 
-def test_config_list_mics_shows_devices():
+@requires_sounddevice
+def test_config_list_mics_shows_devices(monkeypatch, cli_runner):
     """GIVEN rec config list-mics
     WHEN invoked with available devices
     THEN device list is shown in the output"""
@@ -36,23 +54,26 @@ def test_config_list_mics_shows_devices():
         {"name": "USB Mic", "max_input_channels": 1, "max_output_channels": 0},
     ]
 
-    with patch("rejoice.audio.sd.query_devices", return_value=fake_devices):
-        runner = CliRunner()
-        result = runner.invoke(main, ["config", "list-mics"])
+    monkeypatch.setattr(
+        "rejoice.audio.sd.query_devices", lambda *args, **kwargs: fake_devices
+    )
+
+    result = cli_runner.invoke(main, ["config", "list-mics"])
 
     assert result.exit_code == 0
     assert "USB Mic" in result.output
     assert "Index" in result.output or "index" in result.output.lower()
 
 
-def test_config_list_mics_handles_no_devices_gracefully():
+@requires_sounddevice
+def test_config_list_mics_handles_no_devices_gracefully(monkeypatch, cli_runner):
     """GIVEN rec config list-mics
     WHEN no audio devices are available
     THEN a clear warning is shown and command succeeds"""
 
-    with patch("rejoice.audio.sd.query_devices", return_value=[]):
-        runner = CliRunner()
-        result = runner.invoke(main, ["config", "list-mics"])
+    monkeypatch.setattr("rejoice.audio.sd.query_devices", lambda *args, **kwargs: [])
+
+    result = cli_runner.invoke(main, ["config", "list-mics"])
 
     assert result.exit_code == 0
     assert (
@@ -82,7 +103,9 @@ def test_record_audio_uses_correct_parameters(monkeypatch):
     def callback(indata, frames, time, status):  # pragma: no cover - callback not run
         pass
 
-    monkeypatch.setattr("rejoice.audio.sd.InputStream", fake_input_stream)
+    monkeypatch.setattr(
+        "rejoice.audio.sd", SimpleNamespace(InputStream=fake_input_stream)
+    )
 
     stream = record_audio(callback=callback, device="USB Mic")
 
@@ -131,7 +154,9 @@ def test_record_audio_wraps_sounddevice_errors(monkeypatch):
     def dummy_callback(indata, frames, time, status):  # pragma: no cover
         pass
 
-    monkeypatch.setattr("rejoice.audio.sd.InputStream", boom_input_stream)
+    monkeypatch.setattr(
+        "rejoice.audio.sd", SimpleNamespace(InputStream=boom_input_stream)
+    )
 
     try:
         record_audio(dummy_callback, device="Busy Device")
@@ -165,8 +190,34 @@ def test_get_audio_input_devices_handles_default_device_tuple(monkeypatch):
         },
     )()
 
-    with patch("rejoice.audio.sd", mock_sd):
-        devices = get_audio_input_devices()
+    monkeypatch.setattr("rejoice.audio.sd", mock_sd)
+
+    devices = get_audio_input_devices()
 
     # First device should be marked as default
     assert any(d["is_default"] for d in devices)
+
+
+def test_float_to_pcm16_scales_and_saturates():
+    """GIVEN float samples including values outside -1.0..1.0
+    WHEN float_to_pcm16 is called
+    THEN samples are scaled to int16 and out-of-range values saturate"""
+    samples = np.array([[0.0], [0.5], [-0.5], [1.0], [1.5], [-2.0]], dtype=np.float32)
+
+    pcm = float_to_pcm16(samples)
+
+    assert pcm.dtype == np.int16
+    assert pcm.shape == samples.shape
+    assert pcm.ravel().tolist() == [0, 16383, -16383, 32767, 32767, -32768]
+
+
+def test_rms_level_matches_reference_calculation():
+    """GIVEN a block of samples
+    WHEN rms_level is called
+    THEN it matches the square-root of the mean of squares"""
+    samples = np.random.default_rng(0).uniform(-1, 1, (1024, 1)).astype(np.float32)
+
+    expected = float(np.sqrt(np.mean(samples.astype(np.float64) ** 2)))
+
+    assert abs(rms_level(samples) - expected) < 1e-5
+    assert rms_level(np.empty(0, dtype=np.float32)) == 0.0
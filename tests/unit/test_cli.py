@@ -1,72 +1,205 @@
 """Tests for CLI commands."""
 
+import sys
+import tempfile
 import threading
+import time
+import wave
 from pathlib import Path
 from typing import List, Tuple
 
+import click
+import numpy as np
 import pytest
-from click.testing import CliRunner
 
+import rejoice.cli.commands as cli_commands
 from rejoice.cli.commands import (
     _default_wait_for_stop,
+    _iter_transcripts,
+    _split_frontmatter,
     main,
     start_recording_session,
     view_transcript,
 )
+from rejoice.core.config import Config, OutputConfig
+from rejoice.exceptions import TranscriptError, TranscriptionError
+
+
+def _patch_commands(monkeypatch, **replacements) -> None:
+    """Replace attributes of :mod:`rejoice.cli.commands` for the current test."""
+    for name, value in replacements.items():
+        monkeypatch.setattr(cli_commands, name, value)
+
+
+class _FakeStream:
+    """Stand-in for the sounddevice input stream returned by record_audio."""
+
+    def __init__(self) -> None:
+        self.stopped = False
+        self.closed = False
+
+    def stop(self) -> None:
+        self.stopped = True
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _FakeWaveFile:
+    """No-op replacement for ``wave.open`` in tests that ignore the WAV output."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def setnchannels(self, n):
+        pass
+
+    def setsampwidth(self, width):
+        pass
+
+    def setframerate(self, rate):
+        pass
+
+    def writeframes(self, data):
+        pass
+
+    def close(self):
+        pass
+
+
+class _FakeTempFile:
+    """Stand-in for the ``NamedTemporaryFile`` that holds the recorded WAV."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def write(self, data):
+        pass
+
+    def close(self):
+        pass
+
+
+def _patch_wav_tempfile(monkeypatch, audio_path: Path) -> None:
+    """Hand out ``audio_path`` as the recording temp file.
+
+    Other temporary files, such as those used for atomic transcript writes,
+    are still created by the real ``tempfile.NamedTemporaryFile``.
+    """
+    original_named_temporary_file = tempfile.NamedTemporaryFile
+
+    def fake_named_temporary_file(*args, **kwargs):
+        if kwargs.get("suffix") == ".wav" and kwargs.get("delete") is False:
+            return _FakeTempFile(str(audio_path))
+        return original_named_temporary_file(*args, **kwargs)
+
+    monkeypatch.setattr(tempfile, "NamedTemporaryFile", fake_named_temporary_file)
+
+
+def _simulate_ctrl_c(monkeypatch) -> threading.Event:
+    """Interrupt the recording wait loop once, as if Ctrl+C were pressed.
+
+    ``input()`` blocks until the returned event is set. Set it once the
+    session has returned so the input thread exits with the test.
+    """
+    interrupted = threading.Event()
+    release_input = threading.Event()
+    original_sleep = time.sleep
+
+    def fake_sleep(seconds):
+        if threading.current_thread() is threading.main_thread():
+            if not interrupted.is_set():
+                interrupted.set()
+                raise KeyboardInterrupt()
+            return None
+        return original_sleep(seconds)
+
+    def fake_input_blocking(prompt=""):
+        release_input.wait()
+
+    monkeypatch.setattr(cli_commands.time, "sleep", fake_sleep)
+    monkeypatch.setattr("builtins.input", fake_input_blocking)
+    return release_input
+
+
+_FRONTMATTER = (
+    "---\n"
+    "id: '{id}'\n"
+    "type: voice-note\n"
+    "status: completed\n"
+    "created: {created}\n"
+    "language: en\n"
+    "tags: []\n"
+    'summary: ""\n'
+    "---\n\n"
+    "{body}"
+)
+
+
+def _make_config(save_path: Path) -> Config:
+    """Return a default configuration that saves transcripts under ``save_path``."""
+    return Config(output=OutputConfig(save_path=str(save_path)))
+
+
+@pytest.fixture(autouse=True)
+def _patched_load_config(monkeypatch, tmp_path):
+    """Point load_config at a per-test save path instead of the user's config."""
+    _patch_commands(monkeypatch, load_config=lambda: _make_config(tmp_path))
+
+
+@pytest.fixture
+def transcript_and_audio(tmp_path):
+    """Create a bare transcript and a dummy recording, returning both paths."""
+    transcript_path = tmp_path / "000001_transcript_20250101.md"
+    transcript_path.write_text("---\nid: '000001'\n---\n\n", encoding="utf-8")
+    temp_audio_path = tmp_path / "temp_audio.wav"
+    temp_audio_path.write_bytes(b"dummy audio data")
+    return transcript_path, temp_audio_path
 
 
 def test_cli_help():
     """GIVEN rec command
     WHEN --help is called
     THEN help text is displayed"""
-    runner = CliRunner()
-    result = runner.invoke(main, ["--help"])
-    assert result.exit_code == 0
-    assert "Rejoice" in result.output
-    assert "rec" in result.output.lower() or "recording" in result.output.lower()
+    help_text = main.get_help(click.Context(main, info_name="rec"))
+    assert "Rejoice" in help_text
+    assert "rec" in help_text.lower() or "recording" in help_text.lower()
 
 
-def test_cli_version():
+def test_cli_version(cli_runner):
     """GIVEN --version flag
     WHEN main is invoked
     THEN version is displayed"""
-    runner = CliRunner()
-    result = runner.invoke(main, ["--version"])
+    result = cli_runner.invoke(main, ["--version"])
     assert result.exit_code == 0
     assert "2.0.0" in result.output
 
 
-def test_cli_debug_flag(monkeypatch, tmp_path):
+def test_cli_debug_flag(monkeypatch, tmp_path, cli_runner):
     """GIVEN --debug flag
     WHEN main is invoked
     THEN debug mode is enabled"""
-    monkeypatch.setattr("rejoice.cli.commands.setup_logging", lambda debug=False: None)
-    monkeypatch.setattr(
-        "rejoice.cli.commands.start_recording_session",
-        lambda *args, **kwargs: (None, None),
+    _patch_commands(
+        monkeypatch,
+        setup_logging=lambda debug=False: None,
+        start_recording_session=lambda *args, **kwargs: (None, None),
     )
 
-    from rejoice.core.config import AudioConfig, OutputConfig, TranscriptionConfig
-
-    class FakeConfig:
-        def __init__(self):
-            self.audio = AudioConfig()
-            self.output = OutputConfig(save_path=str(tmp_path))
-            self.transcription = TranscriptionConfig()
-
-    monkeypatch.setattr("rejoice.cli.commands.load_config", lambda: FakeConfig())
-
-    runner = CliRunner()
-    result = runner.invoke(main, ["--debug"])
+    result = cli_runner.invoke(main, ["--debug"])
     assert result.exit_code == 0
     assert "Debug mode enabled" in result.output or "debug" in result.output.lower()
 
 
-def test_main_starts_recording_when_no_subcommand(monkeypatch, tmp_path):
+def test_main_starts_recording_when_no_subcommand(monkeypatch, tmp_path, cli_runner):
     """GIVEN rec is invoked without subcommand
     WHEN main is executed
     THEN a recording session is started via helper."""
-    runner = CliRunner()
 
     calls = {"started": False}
 
@@ -77,30 +210,14 @@ def test_main_starts_recording_when_no_subcommand(monkeypatch, tmp_path):
         # Return dummy path/id to satisfy any callers
         return tmp_path / "000001_transcript_20250101.md", "000001"
 
-    # Mock load_config to avoid permission errors with default save path
-    from rejoice.core.config import AudioConfig, OutputConfig, TranscriptionConfig
-
-    class FakeConfig:
-        def __init__(self):
-            self.audio = AudioConfig()
-            self.output = OutputConfig(save_path=str(tmp_path))
-            self.transcription = TranscriptionConfig()
-
     # Mock setup_logging to avoid filesystem access
-    monkeypatch.setattr(
-        "rejoice.cli.commands.setup_logging",
-        lambda debug=False: None,
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.load_config",
-        lambda: FakeConfig(),
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.start_recording_session",
-        fake_start_recording_session,
+    _patch_commands(
+        monkeypatch,
+        setup_logging=lambda debug=False: None,
+        start_recording_session=fake_start_recording_session,
     )
 
-    result = runner.invoke(main, [])
+    result = cli_runner.invoke(main, [])
 
     assert result.exit_code == 0
     assert calls["started"] is True
@@ -120,18 +237,7 @@ def test_start_recording_creates_transcript_before_audio(monkeypatch, tmp_path):
         # Simulate that file would be created by manager without touching disk here
         return transcript_path, "000001"
 
-    class FakeStream:
-        def __init__(self) -> None:
-            self.stopped = False
-            self.closed = False
-
-        def stop(self) -> None:
-            self.stopped = True
-
-        def close(self) -> None:
-            self.closed = True
-
-    fake_stream = FakeStream()
+    fake_stream = _FakeStream()
 
     def fake_record_audio(callback, *, device=None, samplerate=16000, channels=1):
         events.append("record_audio")
@@ -144,31 +250,16 @@ def test_start_recording_creates_transcript_before_audio(monkeypatch, tmp_path):
     def fake_wait_for_stop() -> None:
         events.append("wait_for_stop")
 
-    monkeypatch.setattr(
-        "rejoice.cli.commands.create_transcript",
-        fake_create_transcript,
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.record_audio",
-        fake_record_audio,
-    )
     # Avoid touching the filesystem for status updates in this ordering test.
-    monkeypatch.setattr(
-        "rejoice.cli.commands.update_status",
-        lambda path, status: events.append(("update_status", path, status)),
+    _patch_commands(
+        monkeypatch,
+        create_transcript=fake_create_transcript,
+        record_audio=fake_record_audio,
+        update_status=lambda path, status: events.append(
+            ("update_status", path, status)
+        ),
     )
 
-    # Mock config to use tmp_path
-    from rejoice.core.config import AudioConfig, OutputConfig, TranscriptionConfig
-
-    class FakeConfig:
-        def __init__(self):
-            self.audio = AudioConfig()
-            self.output = OutputConfig(save_path=str(tmp_path))
-            self.transcription = TranscriptionConfig()
-
-    monkeypatch.setattr("rejoice.cli.commands.load_config", lambda: FakeConfig())
-
     # Mock input() to avoid hanging when pytest captures output
     def fake_input(prompt=""):
         return ""  # Enter key
@@ -176,54 +267,8 @@ def test_start_recording_creates_transcript_before_audio(monkeypatch, tmp_path):
     monkeypatch.setattr("builtins.input", fake_input)
 
     # Mock tempfile and wave to avoid filesystem issues
-    import tempfile
-    import wave
-
-    class FakeWaveFile:
-        def __init__(self, *args, **kwargs):
-            pass
-
-        def setnchannels(self, n):
-            pass
-
-        def setsampwidth(self, width):
-            pass
-
-        def setframerate(self, rate):
-            pass
-
-        def writeframes(self, data):
-            pass
-
-        def close(self):
-            pass
-
-    # Save original NamedTemporaryFile before patching
-    _original_named_temporary_file = tempfile.NamedTemporaryFile
-
-    def fake_named_temporary_file(*args, **kwargs):
-        if kwargs.get("suffix") == ".wav" and kwargs.get("delete") is False:
-
-            class FakeTempFile:
-                def __init__(self):
-                    self.name = str(tmp_path / "temp_audio.wav")
-
-                def __enter__(self):
-                    return self
-
-                def __exit__(self, *args):
-                    pass
-
-                def close(self):
-                    pass
-
-            return FakeTempFile()
-        else:
-            # Use original function to avoid recursion
-            return _original_named_temporary_file(*args, **kwargs)
-
-    monkeypatch.setattr(tempfile, "NamedTemporaryFile", fake_named_temporary_file)
-    monkeypatch.setattr(wave, "open", FakeWaveFile)
+    _patch_wav_tempfile(monkeypatch, tmp_path / "temp_audio.wav")
+    monkeypatch.setattr(wave, "open", _FakeWaveFile)
 
     # Call the helper under test
     filepath, transcript_id = start_recording_session(wait_for_stop=fake_wait_for_stop)
@@ -280,18 +325,7 @@ def test_start_recording_marks_transcript_completed(monkeypatch, tmp_path):
         events.append("create_transcript")
         return transcript_path, "000010"
 
-    class FakeStream:
-        def __init__(self) -> None:
-            self.stopped = False
-            self.closed = False
-
-        def stop(self) -> None:
-            self.stopped = True
-
-        def close(self) -> None:
-            self.closed = True
-
-    fake_stream = FakeStream()
+    fake_stream = _FakeStream()
 
     def fake_record_audio(callback, *, device=None, samplerate=16000, channels=1):
         events.append("record_audio")
@@ -304,82 +338,19 @@ def test_start_recording_marks_transcript_completed(monkeypatch, tmp_path):
     def fake_update_status(path: Path, status: str) -> None:
         events.append(("update_status", path, status))
 
-    monkeypatch.setattr(
-        "rejoice.cli.commands.create_transcript",
-        fake_create_transcript,
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.record_audio",
-        fake_record_audio,
+    _patch_commands(
+        monkeypatch,
+        create_transcript=fake_create_transcript,
+        record_audio=fake_record_audio,
+        update_status=fake_update_status,
     )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.update_status",
-        fake_update_status,
-    )
-
-    # Mock config to use tmp_path
-    from rejoice.core.config import AudioConfig, OutputConfig, TranscriptionConfig
-
-    class FakeConfig:
-        def __init__(self):
-            self.audio = AudioConfig()
-            self.output = OutputConfig(save_path=str(tmp_path))
-            self.transcription = TranscriptionConfig()
-
-    monkeypatch.setattr("rejoice.cli.commands.load_config", lambda: FakeConfig())
 
     # Mock input() to avoid hanging when pytest captures output
     monkeypatch.setattr("builtins.input", lambda prompt="": "")
 
     # Mock tempfile and wave to avoid filesystem issues
-    import tempfile
-    import wave
-
-    class FakeWaveFile:
-        def __init__(self, *args, **kwargs):
-            pass
-
-        def setnchannels(self, n):
-            pass
-
-        def setsampwidth(self, width):
-            pass
-
-        def setframerate(self, rate):
-            pass
-
-        def writeframes(self, data):
-            pass
-
-        def close(self):
-            pass
-
-    # Save original NamedTemporaryFile before patching
-    _original_named_temporary_file = tempfile.NamedTemporaryFile
-
-    def fake_named_temporary_file(*args, **kwargs):
-        if kwargs.get("suffix") == ".wav" and kwargs.get("delete") is False:
-
-            class FakeTempFile:
-                def __init__(self):
-                    self.name = str(tmp_path / "temp_audio.wav")
-
-                def __enter__(self):
-                    return self
-
-                def __exit__(self, *args):
-                    pass
-
-                def close(self):
-                    pass
-
-            return FakeTempFile()
-        else:
-            # Use original function to avoid recursion
-            return _original_named_temporary_file(*args, **kwargs)
-
-    monkeypatch.setattr(tempfile, "NamedTemporaryFile", fake_named_temporary_file)
-    monkeypatch.setattr(wave, "open", FakeWaveFile)
+    _patch_wav_tempfile(monkeypatch, tmp_path / "temp_audio.wav")
+    monkeypatch.setattr(wave, "open", _FakeWaveFile)
 
     filepath, transcript_id = start_recording_session(wait_for_stop=fake_wait_for_stop)
 
@@ -410,18 +381,7 @@ def test_start_recording_handles_ctrl_c_and_marks_cancelled(monkeypatch, tmp_pat
         events.append("create_transcript")
         return transcript_path, "000020"
 
-    class FakeStream:
-        def __init__(self) -> None:
-            self.stopped = False
-            self.closed = False
-
-        def stop(self) -> None:
-            self.stopped = True
-
-        def close(self) -> None:
-            self.closed = True
-
-    fake_stream = FakeStream()
+    fake_stream = _FakeStream()
 
     def fake_record_audio(callback, *, device=None, samplerate=16000, channels=1):
         events.append("record_audio")
@@ -447,112 +407,30 @@ def test_start_recording_handles_ctrl_c_and_marks_cancelled(monkeypatch, tmp_pat
     def fake_update_status(path: Path, status: str) -> None:
         events.append(("update_status", path, status))
 
-    monkeypatch.setattr(
-        "rejoice.cli.commands.create_transcript",
-        fake_create_transcript,
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.record_audio",
-        fake_record_audio,
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.update_status",
-        fake_update_status,
+    _patch_commands(
+        monkeypatch,
+        create_transcript=fake_create_transcript,
+        record_audio=fake_record_audio,
+        update_status=fake_update_status,
     )
     monkeypatch.setattr(
-        "rejoice.cli.commands.Confirm.ask",
+        cli_commands.Confirm,
+        "ask",
         fake_confirm_keep,
     )
 
-    # Mock config to use tmp_path
-    from rejoice.core.config import AudioConfig, OutputConfig, TranscriptionConfig
-
-    class FakeConfig:
-        def __init__(self):
-            self.audio = AudioConfig()
-            self.output = OutputConfig(save_path=str(tmp_path))
-            self.transcription = TranscriptionConfig()
-
-    monkeypatch.setattr("rejoice.cli.commands.load_config", lambda: FakeConfig())
-
-    # Mock time.sleep to raise KeyboardInterrupt in the main thread's wait loop
-    # This simulates Ctrl+C being pressed during the wait
-    import time
-
-    call_count = {"count": 0}
-    original_sleep = time.sleep
-
-    def fake_sleep(seconds):
-        call_count["count"] += 1
-        # After a few iterations, raise KeyboardInterrupt in the main thread's wait loop
-        # This will be caught by the except KeyboardInterrupt block
-        if call_count["count"] > 2:
-            raise KeyboardInterrupt()
-        return original_sleep(seconds)
-
-    monkeypatch.setattr("rejoice.cli.commands.time.sleep", fake_sleep)
-
-    # Mock input() to block (don't return immediately, so the wait loop runs)
-    # The KeyboardInterrupt from time.sleep will be caught instead
-    def fake_input_blocking(prompt=""):
-        # Block forever using threading.Event (no recursion, no sleep)
-        import threading
-
-        threading.Event().wait()  # Block forever, no sleep calls
-
-    monkeypatch.setattr("builtins.input", fake_input_blocking)
+    release_input = _simulate_ctrl_c(monkeypatch)
 
     # Mock tempfile and wave to avoid filesystem issues
-    import tempfile
-    import wave
-
-    class FakeWaveFile:
-        def __init__(self, *args, **kwargs):
-            pass
-
-        def setnchannels(self, n):
-            pass
-
-        def setsampwidth(self, width):
-            pass
-
-        def setframerate(self, rate):
-            pass
-
-        def writeframes(self, data):
-            pass
-
-        def close(self):
-            pass
-
-    # Save original NamedTemporaryFile before patching
-    _original_named_temporary_file = tempfile.NamedTemporaryFile
-
-    def fake_named_temporary_file(*args, **kwargs):
-        if kwargs.get("suffix") == ".wav" and kwargs.get("delete") is False:
-
-            class FakeTempFile:
-                def __init__(self):
-                    self.name = str(tmp_path / "temp_audio.wav")
-
-                def __enter__(self):
-                    return self
-
-                def __exit__(self, *args):
-                    pass
+    _patch_wav_tempfile(monkeypatch, tmp_path / "temp_audio.wav")
+    monkeypatch.setattr(wave, "open", _FakeWaveFile)
 
-                def close(self):
-                    pass
-
-            return FakeTempFile()
-        else:
-            # Use original function to avoid recursion
-            return _original_named_temporary_file(*args, **kwargs)
-
-    monkeypatch.setattr(tempfile, "NamedTemporaryFile", fake_named_temporary_file)
-    monkeypatch.setattr(wave, "open", FakeWaveFile)
-
-    filepath, transcript_id = start_recording_session(wait_for_stop=fake_wait_for_stop)
+    try:
+        filepath, transcript_id = start_recording_session(
+            wait_for_stop=fake_wait_for_stop
+        )
+    finally:
+        release_input.set()
 
     # Core flow order still respected up to the interrupt
     # Note: wait_for_stop is no longer called - the new implementation
@@ -567,50 +445,34 @@ def test_start_recording_handles_ctrl_c_and_marks_cancelled(monkeypatch, tmp_pat
     assert ("update_status", transcript_path, "cancelled") in events
 
 
-def test_list_recordings_shows_message_when_no_transcripts(monkeypatch, tmp_path):
+def test_list_recordings_shows_message_when_no_transcripts(
+    monkeypatch, tmp_path, cli_runner
+):
     """GIVEN no transcript files in the save directory
     WHEN `rec list` is invoked
     THEN a friendly 'no recordings' message is shown and the command exits successfully.
     """
 
-    class FakeOutputConfig:
-        def __init__(self, save_path: str) -> None:
-            self.save_path = save_path
-
-    class FakeConfig:
-        def __init__(self, save_path: str) -> None:
-            self.output = FakeOutputConfig(save_path)
-
     # Point the CLI at an empty temporary directory for transcripts
     save_dir = tmp_path / "transcripts"
     save_dir.mkdir()
 
-    monkeypatch.setattr(
-        "rejoice.cli.commands.load_config",
-        lambda: FakeConfig(str(save_dir)),
-    )
+    _patch_commands(monkeypatch, load_config=lambda: _make_config(save_dir))
 
-    runner = CliRunner()
-    result = runner.invoke(main, ["list"])
+    result = cli_runner.invoke(main, ["list"])
 
     assert result.exit_code == 0
     assert "No recordings found" in result.output
 
 
-def test_list_recordings_shows_transcripts_sorted_newest_first(monkeypatch, tmp_path):
+def test_list_recordings_shows_transcripts_sorted_newest_first(
+    monkeypatch, tmp_path, cli_runner
+):
     """GIVEN multiple transcript files in the save directory
     WHEN `rec list` is invoked
     THEN transcripts are listed newest-first with ID, date and filename columns.
     """
 
-    class FakeOutputConfig:
-        def __init__(self, save_path: str) -> None:
-            self.save_path = save_path
-
-    class FakeConfig:
-        def __init__(self, save_path: str) -> None:
-            self.output = FakeOutputConfig(save_path)
-
     save_dir = tmp_path / "transcripts"
     save_dir.mkdir()
 
@@ -623,13 +485,9 @@ def test_list_recordings_shows_transcripts_sorted_newest_first(monkeypatch, tmp_
         path.write_text("dummy content", encoding="utf-8")
 
     # Point config at our temporary transcripts directory
-    monkeypatch.setattr(
-        "rejoice.cli.commands.load_config",
-        lambda: FakeConfig(str(save_dir)),
-    )
+    _patch_commands(monkeypatch, load_config=lambda: _make_config(save_dir))
 
-    runner = CliRunner()
-    result = runner.invoke(main, ["list"])
+    result = cli_runner.invoke(main, ["list"])
 
     assert result.exit_code == 0
 
@@ -649,49 +507,31 @@ def test_list_recordings_shows_transcripts_sorted_newest_first(monkeypatch, tmp_
     assert "2025-01-01" in output_lines[2]
 
 
-def test_view_transcript_by_id_hides_frontmatter_by_default(monkeypatch, tmp_path):
+def test_view_transcript_by_id_hides_frontmatter_by_default(
+    monkeypatch, tmp_path, cli_runner
+):
     """GIVEN an existing transcript
     WHEN `rec view <id>` is invoked
     THEN the body is shown and YAML frontmatter is hidden by default.
     """
 
-    class FakeOutputConfig:
-        def __init__(self, save_path: str) -> None:
-            self.save_path = save_path
-
-    class FakeConfig:
-        def __init__(self, save_path: str) -> None:
-            self.output = FakeOutputConfig(save_path)
-
     save_dir = tmp_path / "transcripts"
     save_dir.mkdir()
 
     transcript_path = save_dir / "000001_transcript_20250101.md"
     transcript_path.write_text(
-        (
-            "---\n"
-            "id: '000001'\n"
-            "type: voice-note\n"
-            "status: completed\n"
-            "created: 2025-01-01 10:00\n"
-            "language: en\n"
-            "tags: []\n"
-            'summary: ""\n'
-            "---\n\n"
-            "# My Note\n\n"
-            "This is the body of the transcript.\n"
+        _FRONTMATTER.format(
+            id="000001",
+            created="2025-01-01 10:00",
+            body="# My Note\n\nThis is the body of the transcript.\n",
         ),
         encoding="utf-8",
     )
 
-    monkeypatch.setattr(
-        "rejoice.cli.commands.load_config",
-        lambda: FakeConfig(str(save_dir)),
-    )
+    _patch_commands(monkeypatch, load_config=lambda: _make_config(save_dir))
 
-    runner = CliRunner()
     # Use a short numeric ID to exercise ID normalisation.
-    result = runner.invoke(view_transcript, ["1"])
+    result = cli_runner.invoke(view_transcript, ["1"])
 
     assert result.exit_code == 0
     # Body content should be rendered
@@ -703,50 +543,29 @@ def test_view_transcript_by_id_hides_frontmatter_by_default(monkeypatch, tmp_pat
 
 
 def test_view_transcript_with_show_frontmatter_displays_metadata(
-    monkeypatch,
-    tmp_path,
+    monkeypatch, tmp_path, cli_runner
 ):
     """GIVEN an existing transcript
     WHEN `rec view --show-frontmatter <id>` is invoked
     THEN both YAML frontmatter and body are displayed.
     """
 
-    class FakeOutputConfig:
-        def __init__(self, save_path: str) -> None:
-            self.save_path = save_path
-
-    class FakeConfig:
-        def __init__(self, save_path: str) -> None:
-            self.output = FakeOutputConfig(save_path)
-
     save_dir = tmp_path / "transcripts"
     save_dir.mkdir()
 
     transcript_path = save_dir / "000010_transcript_20250102.md"
     transcript_path.write_text(
-        (
-            "---\n"
-            "id: '000010'\n"
-            "type: voice-note\n"
-            "status: completed\n"
-            "created: 2025-01-02 12:00\n"
-            "language: en\n"
-            "tags: []\n"
-            'summary: ""\n'
-            "---\n\n"
-            "## Heading\n\n"
-            "Body content here.\n"
+        _FRONTMATTER.format(
+            id="000010",
+            created="2025-01-02 12:00",
+            body="## Heading\n\nBody content here.\n",
         ),
         encoding="utf-8",
     )
 
-    monkeypatch.setattr(
-        "rejoice.cli.commands.load_config",
-        lambda: FakeConfig(str(save_dir)),
-    )
+    _patch_commands(monkeypatch, load_config=lambda: _make_config(save_dir))
 
-    runner = CliRunner()
-    result = runner.invoke(view_transcript, ["--show-frontmatter", "10"])
+    result = cli_runner.invoke(view_transcript, ["--show-frontmatter", "10"])
 
     assert result.exit_code == 0
     # Frontmatter metadata should be visible
@@ -757,20 +576,12 @@ def test_view_transcript_with_show_frontmatter_displays_metadata(
     assert "Body content here." in result.output
 
 
-def test_view_latest_shows_most_recent_transcript(monkeypatch, tmp_path):
+def test_view_latest_shows_most_recent_transcript(monkeypatch, tmp_path, cli_runner):
     """GIVEN multiple transcripts
     WHEN `rec view latest` is invoked
     THEN the most recent transcript (by filename pattern) is displayed.
     """
 
-    class FakeOutputConfig:
-        def __init__(self, save_path: str) -> None:
-            self.save_path = save_path
-
-    class FakeConfig:
-        def __init__(self, save_path: str) -> None:
-            self.output = FakeOutputConfig(save_path)
-
     save_dir = tmp_path / "transcripts"
     save_dir.mkdir()
 
@@ -778,105 +589,55 @@ def test_view_latest_shows_most_recent_transcript(monkeypatch, tmp_path):
     newer = save_dir / "000002_transcript_20250102.md"
 
     older.write_text(
-        (
-            "---\n"
-            "id: '000001'\n"
-            "type: voice-note\n"
-            "status: completed\n"
-            "created: 2025-01-01 09:00\n"
-            "language: en\n"
-            "tags: []\n"
-            'summary: ""\n'
-            "---\n\n"
-            "Older transcript body.\n"
+        _FRONTMATTER.format(
+            id="000001",
+            created="2025-01-01 09:00",
+            body="Older transcript body.\n",
         ),
         encoding="utf-8",
     )
     newer.write_text(
-        (
-            "---\n"
-            "id: '000002'\n"
-            "type: voice-note\n"
-            "status: completed\n"
-            "created: 2025-01-02 10:00\n"
-            "language: en\n"
-            "tags: []\n"
-            'summary: ""\n'
-            "---\n\n"
-            "NEWEST transcript body.\n"
+        _FRONTMATTER.format(
+            id="000002",
+            created="2025-01-02 10:00",
+            body="NEWEST transcript body.\n",
         ),
         encoding="utf-8",
     )
 
-    monkeypatch.setattr(
-        "rejoice.cli.commands.load_config",
-        lambda: FakeConfig(str(save_dir)),
-    )
+    _patch_commands(monkeypatch, load_config=lambda: _make_config(save_dir))
 
-    runner = CliRunner()
-    result = runner.invoke(view_transcript, ["latest"])
+    result = cli_runner.invoke(view_transcript, ["latest"])
 
     assert result.exit_code == 0
     assert "NEWEST transcript body." in result.output
     assert "Older transcript body." not in result.output
 
 
-def test_view_invalid_id_shows_clear_error(monkeypatch, tmp_path):
-    """GIVEN an invalid transcript ID
+@pytest.mark.parametrize(
+    ("transcript_id", "expected_message"),
+    [
+        ("abc", "is not a valid transcript ID"),
+        ("42", "Transcript with ID 000042 was not found"),
+    ],
+)
+def test_view_unknown_transcript_shows_clear_error(
+    monkeypatch, tmp_path, cli_runner, transcript_id, expected_message
+):
+    """GIVEN an invalid ID, or a well-formed ID with no matching file
     WHEN `rec view` is invoked
     THEN a clear error message is shown and the command fails.
     """
 
-    class FakeOutputConfig:
-        def __init__(self, save_path: str) -> None:
-            self.save_path = save_path
-
-    class FakeConfig:
-        def __init__(self, save_path: str) -> None:
-            self.output = FakeOutputConfig(save_path)
-
-    save_dir = tmp_path / "transcripts"
-    save_dir.mkdir()
-
-    monkeypatch.setattr(
-        "rejoice.cli.commands.load_config",
-        lambda: FakeConfig(str(save_dir)),
-    )
-
-    runner = CliRunner()
-    result = runner.invoke(view_transcript, ["abc"])
-
-    assert result.exit_code != 0
-    assert "is not a valid transcript ID" in result.output
-
-
-def test_view_missing_transcript_shows_friendly_message(monkeypatch, tmp_path):
-    """GIVEN a well-formed ID that does not correspond to any file
-    WHEN `rec view` is invoked
-    THEN a friendly 'not found' message is shown and the command fails.
-    """
-
-    class FakeOutputConfig:
-        def __init__(self, save_path: str) -> None:
-            self.save_path = save_path
-
-    class FakeConfig:
-        def __init__(self, save_path: str) -> None:
-            self.output = FakeOutputConfig(save_path)
-
     save_dir = tmp_path / "transcripts"
     save_dir.mkdir()
 
-    monkeypatch.setattr(
-        "rejoice.cli.commands.load_config",
-        lambda: FakeConfig(str(save_dir)),
-    )
+    _patch_commands(monkeypatch, load_config=lambda: _make_config(save_dir))
 
-    runner = CliRunner()
-    result = runner.invoke(view_transcript, ["42"])
+    result = cli_runner.invoke(view_transcript, [transcript_id])
 
     assert result.exit_code != 0
-    assert "Transcript with ID 000042 was not found" in result.output
+    assert expected_message in result.output
 
 
 def test_recording_saves_audio_to_temp_file(monkeypatch, tmp_path):
@@ -889,36 +650,13 @@ def test_recording_saves_audio_to_temp_file(monkeypatch, tmp_path):
     transcript_path = tmp_path / "000001_transcript_20250101.md"
     transcript_path.write_text("---\nid: '000001'\n---\n\n", encoding="utf-8")
 
-    # Mock config to use tmp_path
-    from rejoice.core.config import (
-        AudioConfig,
-        OutputConfig,
-        TranscriptionConfig,
-    )
-
-    class FakeConfig:
-        def __init__(self):
-            self.audio = AudioConfig()
-            self.output = OutputConfig(save_path=str(tmp_path))
-            self.transcription = TranscriptionConfig()
-
     def fake_create_transcript(save_dir: Path):
         return transcript_path, "000001"
 
-    class FakeStream:
-        def stop(self) -> None:
-            pass
-
-        def close(self) -> None:
-            pass
-
-    fake_stream = FakeStream()
+    fake_stream = _FakeStream()
 
     def fake_record_audio(callback, *, device=None, samplerate=16000, channels=1):
-        # Simulate audio callback being called with audio data
-        import numpy as np
-
-        # Create dummy audio data (16-bit PCM samples)
+        # Simulate the audio callback receiving a block of float32 samples
         dummy_audio = np.array([0.5, -0.3, 0.8], dtype=np.float32)
         callback(dummy_audio, len(dummy_audio), None, None)
         return fake_stream
@@ -951,34 +689,19 @@ def test_recording_saves_audio_to_temp_file(monkeypatch, tmp_path):
             wave_file_created["closed"] = True
             events.append("wave_file_closed")
 
-    monkeypatch.setattr(
-        "rejoice.cli.commands.load_config",
-        lambda: FakeConfig(),
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.create_transcript",
-        fake_create_transcript,
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.record_audio",
-        fake_record_audio,
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.update_status",
-        lambda path, status: None,
+    _patch_commands(
+        monkeypatch,
+        create_transcript=fake_create_transcript,
+        record_audio=fake_record_audio,
+        update_status=lambda path, status: None,
     )
 
     # Mock input() to avoid hanging when pytest captures output
     monkeypatch.setattr("builtins.input", lambda prompt="": "")
 
     # Mock wave module
-    import wave
-
     monkeypatch.setattr(wave, "open", FakeWaveFile)
 
-    # Mock input() to avoid hanging when pytest captures output
-    monkeypatch.setattr("builtins.input", lambda prompt="": "")
-
     start_recording_session(wait_for_stop=fake_wait_for_stop)
 
     # Verify wave file was created and configured
@@ -990,37 +713,63 @@ def test_recording_saves_audio_to_temp_file(monkeypatch, tmp_path):
     assert wave_file_created["closed"] is True
 
 
-def test_transcription_runs_after_recording_stops(monkeypatch, tmp_path):
-    """GIVEN a completed recording session
-    WHEN recording stops normally
-    THEN transcription is automatically run on the temporary audio file."""
-    events: List[object] = []
-
+def test_recording_keeps_wav_header_current_before_close(monkeypatch, tmp_path):
+    """GIVEN a recording session writing a real WAV file
+    WHEN audio blocks arrive and the file has not been closed yet
+    THEN the on-disk header already reports the frames written so far."""
     transcript_path = tmp_path / "000001_transcript_20250101.md"
     transcript_path.write_text("---\nid: '000001'\n---\n\n", encoding="utf-8")
     temp_audio_path = tmp_path / "temp_audio.wav"
-    temp_audio_path.write_bytes(b"dummy audio data")
-
-    # Mock config
-    from rejoice.core.config import AudioConfig, OutputConfig, TranscriptionConfig
-
-    class FakeConfig:
-        def __init__(self):
-            self.audio = AudioConfig()
-            self.output = OutputConfig(save_path=str(tmp_path))
-            self.transcription = TranscriptionConfig()
+    frames_on_disk: List[int] = []
 
     def fake_create_transcript(save_dir: Path):
         return transcript_path, "000001"
 
-    class FakeStream:
-        def stop(self) -> None:
-            pass
+    def fake_record_audio(callback, *, device=None, samplerate=16000, channels=1):
+        block = np.zeros(160, dtype=np.float32)
+        callback(block, len(block), None, None)
+        callback(block, len(block), None, None)
+        # Read the file as a crashed process would leave it: without close().
+        with wave.open(str(temp_audio_path), "rb") as reader:
+            frames_on_disk.append(reader.getnframes())
+        return _FakeStream()
 
-        def close(self) -> None:
-            pass
+    class FakeTranscriber:
+        def __init__(self, config):
+            self.last_language = None
 
-    fake_stream = FakeStream()
+        def transcribe_file(self, audio_path):
+            return iter(())
+
+    _patch_commands(
+        monkeypatch,
+        create_transcript=fake_create_transcript,
+        record_audio=fake_record_audio,
+        update_status=lambda path, status: None,
+        Transcriber=FakeTranscriber,
+    )
+    monkeypatch.setattr("builtins.input", lambda prompt="": "")
+    _patch_wav_tempfile(monkeypatch, temp_audio_path)
+
+    start_recording_session(wait_for_stop=lambda: None)
+
+    assert frames_on_disk == [320]
+
+
+def test_transcription_runs_after_recording_stops(
+    monkeypatch, tmp_path, transcript_and_audio
+):
+    """GIVEN a completed recording session
+    WHEN recording stops normally
+    THEN transcription is automatically run on the temporary audio file."""
+    events: List[object] = []
+
+    transcript_path, temp_audio_path = transcript_and_audio
+
+    def fake_create_transcript(save_dir: Path):
+        return transcript_path, "000001"
+
+    fake_stream = _FakeStream()
 
     def fake_record_audio(callback, *, device=None, samplerate=16000, channels=1):
         return fake_stream
@@ -1039,86 +788,20 @@ def test_transcription_runs_after_recording_stops(monkeypatch, tmp_path):
             # Yield a dummy segment
             yield {"text": "Hello world", "start": 0.0, "end": 1.0}
 
-    monkeypatch.setattr(
-        "rejoice.cli.commands.load_config",
-        lambda: FakeConfig(),
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.create_transcript",
-        fake_create_transcript,
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.record_audio",
-        fake_record_audio,
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.update_status",
-        lambda path, status: None,
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.append_to_transcript",
-        lambda path, text: events.append(("append_to_transcript", path, text)),
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.Transcriber",
-        FakeTranscriber,
+    _patch_commands(
+        monkeypatch,
+        create_transcript=fake_create_transcript,
+        record_audio=fake_record_audio,
+        update_status=lambda path, status: None,
+        append_to_transcript=lambda path, text: events.append(
+            ("append_to_transcript", path, text)
+        ),
+        Transcriber=FakeTranscriber,
     )
 
     # Mock tempfile and wave
-    import tempfile
-    import wave
-
-    # Save reference to original before patching
-    original_named_temporary_file = tempfile.NamedTemporaryFile
-
-    def fake_named_temporary_file(*args, **kwargs):
-        # Check if this is for the audio file (has .wav suffix and delete=False)
-        # or for atomic writes (has mode='w' and encoding)
-        if kwargs.get("suffix") == ".wav" and kwargs.get("delete") is False:
-            # This is for the audio recording temp file
-            class FakeTempFile:
-                def __init__(self):
-                    self.name = str(temp_audio_path)
-                    self._content = ""
-
-                def __enter__(self):
-                    return self
-
-                def __exit__(self, *args):
-                    pass
-
-                def write(self, data):
-                    self._content += data
-
-                def close(self):
-                    pass
-
-            return FakeTempFile()
-        else:
-            # This is for atomic file writes - use original tempfile
-            return original_named_temporary_file(*args, **kwargs)
-
-    class FakeWaveFile:
-        def __init__(self, *args, **kwargs):
-            pass
-
-        def setnchannels(self, n):
-            pass
-
-        def setsampwidth(self, width):
-            pass
-
-        def setframerate(self, rate):
-            pass
-
-        def writeframes(self, data):
-            pass
-
-        def close(self):
-            pass
-
-    monkeypatch.setattr(tempfile, "NamedTemporaryFile", fake_named_temporary_file)
-    monkeypatch.setattr(wave, "open", FakeWaveFile)
+    _patch_wav_tempfile(monkeypatch, temp_audio_path)
+    monkeypatch.setattr(wave, "open", _FakeWaveFile)
 
     # Mock input() to avoid hanging when pytest captures output
     monkeypatch.setattr("builtins.input", lambda prompt="": "")
@@ -1137,35 +820,18 @@ def test_transcription_runs_after_recording_stops(monkeypatch, tmp_path):
     )
 
 
-def test_transcription_appends_text_to_transcript(monkeypatch, tmp_path):
+def test_transcription_appends_text_to_transcript(
+    monkeypatch, tmp_path, transcript_and_audio
+):
     """GIVEN a completed recording session
     WHEN transcription runs
     THEN transcribed text is appended to the transcript file."""
-    transcript_path = tmp_path / "000001_transcript_20250101.md"
-    transcript_path.write_text("---\nid: '000001'\n---\n\n", encoding="utf-8")
-    temp_audio_path = tmp_path / "temp_audio.wav"
-    temp_audio_path.write_bytes(b"dummy audio data")
-
-    # Mock config
-    from rejoice.core.config import AudioConfig, OutputConfig, TranscriptionConfig
-
-    class FakeConfig:
-        def __init__(self):
-            self.audio = AudioConfig()
-            self.output = OutputConfig(save_path=str(tmp_path))
-            self.transcription = TranscriptionConfig()
+    transcript_path, temp_audio_path = transcript_and_audio
 
     def fake_create_transcript(save_dir: Path):
         return transcript_path, "000001"
 
-    class FakeStream:
-        def stop(self) -> None:
-            pass
-
-        def close(self) -> None:
-            pass
-
-    fake_stream = FakeStream()
+    fake_stream = _FakeStream()
 
     def fake_record_audio(callback, *, device=None, samplerate=16000, channels=1):
         return fake_stream
@@ -1187,82 +853,17 @@ def test_transcription_appends_text_to_transcript(monkeypatch, tmp_path):
             for segment in segments:
                 yield segment
 
-    monkeypatch.setattr(
-        "rejoice.cli.commands.load_config",
-        lambda: FakeConfig(),
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.create_transcript",
-        fake_create_transcript,
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.record_audio",
-        fake_record_audio,
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.update_status",
-        lambda path, status: None,
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.Transcriber",
-        FakeTranscriber,
+    _patch_commands(
+        monkeypatch,
+        create_transcript=fake_create_transcript,
+        record_audio=fake_record_audio,
+        update_status=lambda path, status: None,
+        Transcriber=FakeTranscriber,
     )
 
     # Mock tempfile and wave
-    import tempfile
-    import wave
-
-    # Save reference to original before patching
-    original_named_temporary_file = tempfile.NamedTemporaryFile
-
-    def fake_named_temporary_file(*args, **kwargs):
-        # Check if this is for the audio file (has .wav suffix and delete=False)
-        # or for atomic writes (has mode='w' and encoding)
-        if kwargs.get("suffix") == ".wav" and kwargs.get("delete") is False:
-            # This is for the audio recording temp file
-            class FakeTempFile:
-                def __init__(self):
-                    self.name = str(temp_audio_path)
-                    self._content = ""
-
-                def __enter__(self):
-                    return self
-
-                def __exit__(self, *args):
-                    pass
-
-                def write(self, data):
-                    self._content += data
-
-                def close(self):
-                    pass
-
-            return FakeTempFile()
-        else:
-            # This is for atomic file writes - use original tempfile
-            return original_named_temporary_file(*args, **kwargs)
-
-    class FakeWaveFile:
-        def __init__(self, *args, **kwargs):
-            pass
-
-        def setnchannels(self, n):
-            pass
-
-        def setsampwidth(self, width):
-            pass
-
-        def setframerate(self, rate):
-            pass
-
-        def writeframes(self, data):
-            pass
-
-        def close(self):
-            pass
-
-    monkeypatch.setattr(tempfile, "NamedTemporaryFile", fake_named_temporary_file)
-    monkeypatch.setattr(wave, "open", FakeWaveFile)
+    _patch_wav_tempfile(monkeypatch, temp_audio_path)
+    monkeypatch.setattr(wave, "open", _FakeWaveFile)
 
     # Mock input() to avoid hanging when pytest captures output
     monkeypatch.setattr("builtins.input", lambda prompt="": "")
@@ -1275,35 +876,16 @@ def test_transcription_appends_text_to_transcript(monkeypatch, tmp_path):
     assert "Second segment" in content
 
 
-def test_temp_file_cleanup_on_success(monkeypatch, tmp_path):
+def test_temp_file_cleanup_on_success(monkeypatch, tmp_path, transcript_and_audio):
     """GIVEN a successful recording and transcription
     WHEN transcription completes
     THEN the temporary audio file is deleted."""
-    transcript_path = tmp_path / "000001_transcript_20250101.md"
-    transcript_path.write_text("---\nid: '000001'\n---\n\n", encoding="utf-8")
-    temp_audio_path = tmp_path / "temp_audio.wav"
-    temp_audio_path.write_bytes(b"dummy audio data")
-
-    # Mock config
-    from rejoice.core.config import AudioConfig, OutputConfig, TranscriptionConfig
-
-    class FakeConfig:
-        def __init__(self):
-            self.audio = AudioConfig()
-            self.output = OutputConfig(save_path=str(tmp_path))
-            self.transcription = TranscriptionConfig()
+    transcript_path, temp_audio_path = transcript_and_audio
 
     def fake_create_transcript(save_dir: Path):
         return transcript_path, "000001"
 
-    class FakeStream:
-        def stop(self) -> None:
-            pass
-
-        def close(self) -> None:
-            pass
-
-    fake_stream = FakeStream()
+    fake_stream = _FakeStream()
 
     def fake_record_audio(callback, *, device=None, samplerate=16000, channels=1):
         return fake_stream
@@ -1318,92 +900,23 @@ def test_temp_file_cleanup_on_success(monkeypatch, tmp_path):
         def transcribe_file(self, audio_path):
             yield {"text": "Test", "start": 0.0, "end": 1.0}
 
-    monkeypatch.setattr(
-        "rejoice.cli.commands.load_config",
-        lambda: FakeConfig(),
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.create_transcript",
-        fake_create_transcript,
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.record_audio",
-        fake_record_audio,
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.update_status",
-        lambda path, status: None,
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.append_to_transcript",
-        lambda path, text: None,
+    _patch_commands(
+        monkeypatch,
+        create_transcript=fake_create_transcript,
+        record_audio=fake_record_audio,
+        update_status=lambda path, status: None,
+        append_to_transcript=lambda path, text: None,
+        Transcriber=FakeTranscriber,
     )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.Transcriber",
-        FakeTranscriber,
-    )
-
-    import tempfile
-    import wave
-
-    def fake_named_temporary_file(*args, **kwargs):
-        # Check if this is for the audio file (has .wav suffix and delete=False)
-        # or for atomic writes (has mode='w' and encoding)
-        if kwargs.get("suffix") == ".wav" and kwargs.get("delete") is False:
-            # This is for the audio recording temp file
-            class FakeTempFile:
-                def __init__(self):
-                    self.name = str(temp_audio_path)
-                    self._content = ""
-
-                def __enter__(self):
-                    return self
-
-                def __exit__(self, *args):
-                    pass
-
-                def write(self, data):
-                    self._content += data
-
-                def close(self):
-                    pass
-
-            return FakeTempFile()
-        else:
-            # This is for atomic file writes - use real tempfile
-            import tempfile as tf
-
-            return tf.NamedTemporaryFile(*args, **kwargs)
-
-    class FakeWaveFile:
-        def __init__(self, *args, **kwargs):
-            pass
 
-        def setnchannels(self, n):
-            pass
-
-        def setsampwidth(self, width):
-            pass
-
-        def setframerate(self, rate):
-            pass
-
-        def writeframes(self, data):
-            pass
-
-        def close(self):
-            pass
-
-    monkeypatch.setattr(tempfile, "NamedTemporaryFile", fake_named_temporary_file)
-    monkeypatch.setattr(wave, "open", FakeWaveFile)
+    _patch_wav_tempfile(monkeypatch, temp_audio_path)
+    monkeypatch.setattr(wave, "open", _FakeWaveFile)
 
     # Mock input() to avoid hanging when pytest captures output
     monkeypatch.setattr("builtins.input", lambda prompt="": "")
 
     # Mock Confirm.ask to return True (default yes for deletion)
-    from rich.prompt import Confirm
-
-    monkeypatch.setattr(Confirm, "ask", lambda prompt, default=True: True)
+    monkeypatch.setattr(cli_commands.Confirm, "ask", lambda prompt, default=True: True)
 
     start_recording_session(wait_for_stop=fake_wait_for_stop)
 
@@ -1411,35 +924,18 @@ def test_temp_file_cleanup_on_success(monkeypatch, tmp_path):
     assert not temp_audio_path.exists()
 
 
-def test_transcription_error_handled_gracefully(monkeypatch, tmp_path):
+def test_transcription_error_handled_gracefully(
+    monkeypatch, tmp_path, transcript_and_audio
+):
     """GIVEN a recording session
     WHEN transcription fails
     THEN the error is handled gracefully without crashing the CLI."""
-    transcript_path = tmp_path / "000001_transcript_20250101.md"
-    transcript_path.write_text("---\nid: '000001'\n---\n\n", encoding="utf-8")
-    temp_audio_path = tmp_path / "temp_audio.wav"
-    temp_audio_path.write_bytes(b"dummy audio data")
-
-    # Mock config
-    from rejoice.core.config import AudioConfig, OutputConfig, TranscriptionConfig
-
-    class FakeConfig:
-        def __init__(self):
-            self.audio = AudioConfig()
-            self.output = OutputConfig(save_path=str(tmp_path))
-            self.transcription = TranscriptionConfig()
+    transcript_path, temp_audio_path = transcript_and_audio
 
     def fake_create_transcript(save_dir: Path):
         return transcript_path, "000001"
 
-    class FakeStream:
-        def stop(self) -> None:
-            pass
-
-        def close(self) -> None:
-            pass
-
-    fake_stream = FakeStream()
+    fake_stream = _FakeStream()
 
     def fake_record_audio(callback, *, device=None, samplerate=16000, channels=1):
         return fake_stream
@@ -1447,8 +943,6 @@ def test_transcription_error_handled_gracefully(monkeypatch, tmp_path):
     def fake_wait_for_stop() -> None:
         pass
 
-    from rejoice.exceptions import TranscriptionError
-
     class FakeTranscriber:
         def __init__(self, config):
             self.last_language = None
@@ -1458,80 +952,16 @@ def test_transcription_error_handled_gracefully(monkeypatch, tmp_path):
                 "Transcription failed", suggestion="Check audio file"
             )
 
-    monkeypatch.setattr(
-        "rejoice.cli.commands.load_config",
-        lambda: FakeConfig(),
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.create_transcript",
-        fake_create_transcript,
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.record_audio",
-        fake_record_audio,
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.update_status",
-        lambda path, status: None,
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.Transcriber",
-        FakeTranscriber,
+    _patch_commands(
+        monkeypatch,
+        create_transcript=fake_create_transcript,
+        record_audio=fake_record_audio,
+        update_status=lambda path, status: None,
+        Transcriber=FakeTranscriber,
     )
 
-    import tempfile
-    import wave
-
-    def fake_named_temporary_file(*args, **kwargs):
-        # Check if this is for the audio file (has .wav suffix and delete=False)
-        # or for atomic writes (has mode='w' and encoding)
-        if kwargs.get("suffix") == ".wav" and kwargs.get("delete") is False:
-            # This is for the audio recording temp file
-            class FakeTempFile:
-                def __init__(self):
-                    self.name = str(temp_audio_path)
-                    self._content = ""
-
-                def __enter__(self):
-                    return self
-
-                def __exit__(self, *args):
-                    pass
-
-                def write(self, data):
-                    self._content += data
-
-                def close(self):
-                    pass
-
-            return FakeTempFile()
-        else:
-            # This is for atomic file writes - use real tempfile
-            import tempfile as tf
-
-            return tf.NamedTemporaryFile(*args, **kwargs)
-
-    class FakeWaveFile:
-        def __init__(self, *args, **kwargs):
-            pass
-
-        def setnchannels(self, n):
-            pass
-
-        def setsampwidth(self, width):
-            pass
-
-        def setframerate(self, rate):
-            pass
-
-        def writeframes(self, data):
-            pass
-
-        def close(self):
-            pass
-
-    monkeypatch.setattr(tempfile, "NamedTemporaryFile", fake_named_temporary_file)
-    monkeypatch.setattr(wave, "open", FakeWaveFile)
+    _patch_wav_tempfile(monkeypatch, temp_audio_path)
+    monkeypatch.setattr(wave, "open", _FakeWaveFile)
 
     # Mock input() to avoid hanging when pytest captures output
     monkeypatch.setattr("builtins.input", lambda prompt="": "")
@@ -1553,26 +983,10 @@ def test_cancelled_recording_skips_transcription(monkeypatch, tmp_path):
     transcript_path = tmp_path / "000001_transcript_20250101.md"
     transcript_path.write_text("---\nid: '000001'\n---\n\n", encoding="utf-8")
 
-    # Mock config
-    from rejoice.core.config import AudioConfig, OutputConfig, TranscriptionConfig
-
-    class FakeConfig:
-        def __init__(self):
-            self.audio = AudioConfig()
-            self.output = OutputConfig(save_path=str(tmp_path))
-            self.transcription = TranscriptionConfig()
-
     def fake_create_transcript(save_dir: Path):
         return transcript_path, "000001"
 
-    class FakeStream:
-        def stop(self) -> None:
-            pass
-
-        def close(self) -> None:
-            pass
-
-    fake_stream = FakeStream()
+    fake_stream = _FakeStream()
 
     def fake_record_audio(callback, *, device=None, samplerate=16000, channels=1):
         return fake_stream
@@ -1589,132 +1003,48 @@ def test_cancelled_recording_skips_transcription(monkeypatch, tmp_path):
             events.append("transcribe_file_called")
             yield {"text": "Should not appear", "start": 0.0, "end": 1.0}
 
-    monkeypatch.setattr(
-        "rejoice.cli.commands.load_config",
-        lambda: FakeConfig(),
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.create_transcript",
-        fake_create_transcript,
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.record_audio",
-        fake_record_audio,
+    _patch_commands(
+        monkeypatch,
+        create_transcript=fake_create_transcript,
+        record_audio=fake_record_audio,
+        update_status=lambda path, status: None,
+        Transcriber=FakeTranscriber,
     )
     monkeypatch.setattr(
-        "rejoice.cli.commands.update_status",
-        lambda path, status: None,
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.Transcriber",
-        FakeTranscriber,
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.Confirm.ask",
+        cli_commands.Confirm,
+        "ask",
         lambda *args, **kwargs: True,  # Confirm cancellation
     )
 
-    import tempfile
-    import wave
-    import time
-
-    def fake_named_temporary_file(*args, **kwargs):
-        class FakeTempFile:
-            def __init__(self):
-                self.name = str(tmp_path / "temp_audio.wav")
-
-            def __enter__(self):
-                return self
-
-            def __exit__(self, *args):
-                pass
-
-            def close(self):
-                pass
-
-        return FakeTempFile()
-
-    class FakeWaveFile:
-        def __init__(self, *args, **kwargs):
-            pass
-
-        def setnchannels(self, n):
-            pass
-
-        def setsampwidth(self, width):
-            pass
-
-        def setframerate(self, rate):
-            pass
-
-        def writeframes(self, data):
-            pass
-
-        def close(self):
-            pass
-
-    monkeypatch.setattr(tempfile, "NamedTemporaryFile", fake_named_temporary_file)
-    monkeypatch.setattr(wave, "open", FakeWaveFile)
-
-    # Mock time.sleep to raise KeyboardInterrupt to simulate Ctrl+C
-    call_count = {"count": 0}
-    original_sleep = time.sleep
-
-    def fake_sleep(seconds):
-        call_count["count"] += 1
-        if call_count["count"] > 2:
-            raise KeyboardInterrupt()
-        return original_sleep(seconds)
-
-    monkeypatch.setattr("rejoice.cli.commands.time.sleep", fake_sleep)
-
-    # Mock input() to block (KeyboardInterrupt will come from time.sleep)
-    def fake_input_blocking(prompt=""):
-        # Block forever using threading.Event (no recursion, no sleep)
-        import threading
-
-        threading.Event().wait()  # Block forever, no sleep calls
+    _patch_wav_tempfile(monkeypatch, tmp_path / "temp_audio.wav")
+    monkeypatch.setattr(wave, "open", _FakeWaveFile)
 
-    monkeypatch.setattr("builtins.input", fake_input_blocking)
+    release_input = _simulate_ctrl_c(monkeypatch)
 
-    start_recording_session(wait_for_stop=fake_wait_for_stop)
+    try:
+        start_recording_session(wait_for_stop=fake_wait_for_stop)
+    finally:
+        release_input.set()
 
     # For cancelled recordings:
     # - Transcription should NOT be called
     assert "transcribe_file_called" not in events
 
 
-def test_language_flag_passed_to_transcriber(monkeypatch, tmp_path):
+def test_language_flag_passed_to_transcriber(
+    monkeypatch, tmp_path, transcript_and_audio
+):
     """GIVEN a recording session with --language flag
     WHEN transcription runs
     THEN the language override is passed to Transcriber."""
     events: List[object] = []
 
-    transcript_path = tmp_path / "000001_transcript_20250101.md"
-    transcript_path.write_text("---\nid: '000001'\n---\n\n", encoding="utf-8")
-    temp_audio_path = tmp_path / "temp_audio.wav"
-    temp_audio_path.write_bytes(b"dummy audio data")
-
-    # Mock config with default language
-    from rejoice.core.config import AudioConfig, OutputConfig, TranscriptionConfig
-
-    class FakeConfig:
-        def __init__(self):
-            self.audio = AudioConfig()
-            self.output = OutputConfig(save_path=str(tmp_path))
-            self.transcription = TranscriptionConfig(language="auto")  # Default
+    transcript_path, temp_audio_path = transcript_and_audio
 
     def fake_create_transcript(save_dir: Path):
         return transcript_path, "000001"
 
-    class FakeStream:
-        def stop(self) -> None:
-            pass
-
-        def close(self) -> None:
-            pass
-
-    fake_stream = FakeStream()
+    fake_stream = _FakeStream()
 
     def fake_record_audio(callback, *, device=None, samplerate=16000, channels=1):
         return fake_stream
@@ -1730,91 +1060,21 @@ def test_language_flag_passed_to_transcriber(monkeypatch, tmp_path):
         def transcribe_file(self, audio_path):
             yield {"text": "Test", "start": 0.0, "end": 1.0}
 
-    monkeypatch.setattr(
-        "rejoice.cli.commands.load_config",
-        lambda: FakeConfig(),
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.create_transcript",
-        fake_create_transcript,
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.record_audio",
-        fake_record_audio,
+    _patch_commands(
+        monkeypatch,
+        create_transcript=fake_create_transcript,
+        record_audio=fake_record_audio,
+        update_status=lambda path, status: None,
+        append_to_transcript=lambda path, text: None,
+        Transcriber=FakeTranscriber,
     )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.update_status",
-        lambda path, status: None,
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.append_to_transcript",
-        lambda path, text: None,
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.Transcriber",
-        FakeTranscriber,
-    )
-
-    import tempfile
-    import wave
-
-    def fake_named_temporary_file(*args, **kwargs):
-        # Check if this is for the audio file (has .wav suffix and delete=False)
-        # or for atomic writes (has mode='w' and encoding)
-        if kwargs.get("suffix") == ".wav" and kwargs.get("delete") is False:
-            # This is for the audio recording temp file
-            class FakeTempFile:
-                def __init__(self):
-                    self.name = str(temp_audio_path)
-                    self._content = ""
-
-                def __enter__(self):
-                    return self
-
-                def __exit__(self, *args):
-                    pass
-
-                def write(self, data):
-                    self._content += data
-
-                def close(self):
-                    pass
-
-            return FakeTempFile()
-        else:
-            # This is for atomic file writes - use real tempfile
-            import tempfile as tf
 
-            return tf.NamedTemporaryFile(*args, **kwargs)
+    _patch_wav_tempfile(monkeypatch, temp_audio_path)
+    monkeypatch.setattr(wave, "open", _FakeWaveFile)
 
-    class FakeWaveFile:
-        def __init__(self, *args, **kwargs):
-            pass
-
-        def setnchannels(self, n):
-            pass
-
-        def setsampwidth(self, width):
-            pass
-
-        def setframerate(self, rate):
-            pass
-
-        def writeframes(self, data):
-            pass
-
-        def close(self):
-            pass
-
-    monkeypatch.setattr(tempfile, "NamedTemporaryFile", fake_named_temporary_file)
-    monkeypatch.setattr(wave, "open", FakeWaveFile)
-
-    # Use the FakeConfig already defined above (with default "auto" language)
-    fake_config = FakeConfig()
-    monkeypatch.setattr(
-        "rejoice.cli.commands.load_config",
-        lambda: fake_config,
-    )
+    # Default configuration (language 'auto')
+    fake_config = _make_config(tmp_path)
+    _patch_commands(monkeypatch, load_config=lambda: fake_config)
 
     # Mock input() to avoid hanging when pytest captures output
     monkeypatch.setattr("builtins.input", lambda prompt="": "")
@@ -1855,14 +1115,7 @@ def test_start_recording_user_does_not_confirm_cancellation(monkeypatch, tmp_pat
         events.append("create_transcript")
         return transcript_path, "000030"
 
-    class FakeStream:
-        def stop(self):
-            pass
-
-        def close(self):
-            pass
-
-    fake_stream = FakeStream()
+    fake_stream = _FakeStream()
 
     def fake_record_audio(callback, *, device=None, samplerate=16000, channels=1):
         events.append("record_audio")
@@ -1877,73 +1130,17 @@ def test_start_recording_user_does_not_confirm_cancellation(monkeypatch, tmp_pat
         events.append(("confirm_cancel", False))
         return False  # User doesn't confirm cancellation
 
-    monkeypatch.setattr(
-        "rejoice.cli.commands.create_transcript", fake_create_transcript
+    _patch_commands(
+        monkeypatch,
+        create_transcript=fake_create_transcript,
+        record_audio=fake_record_audio,
     )
-    monkeypatch.setattr("rejoice.cli.commands.record_audio", fake_record_audio)
-    monkeypatch.setattr("rejoice.cli.commands.Confirm.ask", fake_confirm)
-    monkeypatch.setattr("rejoice.cli.commands.time.time", lambda: 1000)
-
-    # Mock load_config
-    from rejoice.core.config import AudioConfig, OutputConfig, TranscriptionConfig
-
-    class FakeConfig:
-        def __init__(self):
-            self.audio = AudioConfig()
-            self.output = OutputConfig(save_path=str(tmp_path))
-            self.transcription = TranscriptionConfig()
-
-    monkeypatch.setattr("rejoice.cli.commands.load_config", lambda: FakeConfig())
+    monkeypatch.setattr(cli_commands.Confirm, "ask", fake_confirm)
+    monkeypatch.setattr(cli_commands.time, "time", lambda: 1000)
 
     # Mock tempfile and wave
-    import tempfile
-    import wave
-
-    class FakeWaveFile:
-        def __init__(self, *args, **kwargs):
-            pass
-
-        def setnchannels(self, n):
-            pass
-
-        def setsampwidth(self, width):
-            pass
-
-        def setframerate(self, rate):
-            pass
-
-        def writeframes(self, data):
-            pass
-
-        def close(self):
-            pass
-
-    # Save original NamedTemporaryFile before patching
-    _original_named_temporary_file = tempfile.NamedTemporaryFile
-
-    def fake_named_temporary_file(*args, **kwargs):
-        if kwargs.get("suffix") == ".wav" and kwargs.get("delete") is False:
-
-            class FakeTempFile:
-                def __init__(self):
-                    self.name = str(tmp_path / "temp_audio.wav")
-
-                def __enter__(self):
-                    return self
-
-                def __exit__(self, *args):
-                    pass
-
-                def close(self):
-                    pass
-
-            return FakeTempFile()
-        else:
-            # Use original function to avoid recursion
-            return _original_named_temporary_file(*args, **kwargs)
-
-    monkeypatch.setattr(tempfile, "NamedTemporaryFile", fake_named_temporary_file)
-    monkeypatch.setattr(wave, "open", FakeWaveFile)
+    _patch_wav_tempfile(monkeypatch, tmp_path / "temp_audio.wav")
+    monkeypatch.setattr(wave, "open", _FakeWaveFile)
 
     # Mock Transcriber
     class FakeTranscriber:
@@ -1953,60 +1150,20 @@ def test_start_recording_user_does_not_confirm_cancellation(monkeypatch, tmp_pat
         def transcribe_file(self, audio_path):
             yield {"text": "Test", "start": 0.0, "end": 1.0}
 
-    monkeypatch.setattr("rejoice.cli.commands.Transcriber", FakeTranscriber)
-    monkeypatch.setattr(
-        "rejoice.cli.commands.append_to_transcript",
-        lambda path, text: None,
+    _patch_commands(
+        monkeypatch,
+        Transcriber=FakeTranscriber,
+        append_to_transcript=lambda path, text: None,
     )
 
-    # Mock time.sleep to raise KeyboardInterrupt in the main thread's wait loop
-    # Use a dict to track sleep calls per thread
-    import threading
-
-    sleep_counts = {}
-    sleep_lock = threading.Lock()
-
-    def fake_sleep(seconds):
-        thread_id = threading.current_thread().ident
-        with sleep_lock:
-            if thread_id not in sleep_counts:
-                sleep_counts[thread_id] = 0
-            sleep_counts[thread_id] += 1
-            count = sleep_counts[thread_id]
-
-        # Get current thread to identify main thread
-        current_thread = threading.current_thread()
-        is_main_thread = (
-            current_thread.name == "MainThread" or not current_thread.daemon
-        )
+    release_input = _simulate_ctrl_c(monkeypatch)
 
-        # Only raise KeyboardInterrupt in main thread (wait loop) after a few calls
-        if is_main_thread and count > 2:
-            raise KeyboardInterrupt()
-
-        # For other threads (input, display), just do nothing
-        # They'll wait via Event anyway, and the main thread will raise
-        # KeyboardInterrupt before they matter
-        pass
-
-    monkeypatch.setattr("rejoice.cli.commands.time.sleep", fake_sleep)
-
-    # Mock input() to block forever using threading.Event (no recursion, no sleep)
-    def fake_input_blocking(prompt=""):
-        threading.Event().wait()  # Block forever, no sleep calls
-
-    monkeypatch.setattr("builtins.input", fake_input_blocking)
-
-    # This should not raise, and cancelled should be False
     try:
-        filepath, transcript_id = start_recording_session(
-            wait_for_stop=fake_wait_for_stop
-        )
-        # If we get here, cancellation was not confirmed
-        assert ("confirm_cancel", False) in events
-    except KeyboardInterrupt:
-        # If KeyboardInterrupt propagates, that's also acceptable for this test
-        pass
+        start_recording_session(wait_for_stop=fake_wait_for_stop)
+    finally:
+        release_input.set()
+
+    assert ("confirm_cancel", False) in events
 
 
 def test_start_recording_cancelled_keeps_file(monkeypatch, tmp_path):
@@ -2033,15 +1190,8 @@ def test_start_recording_cancelled_keeps_file(monkeypatch, tmp_path):
     def fake_create_transcript(save_dir: Path):
         return transcript_path, "000040"
 
-    class FakeStream:
-        def stop(self):
-            pass
-
-        def close(self):
-            pass
-
     def fake_record_audio(callback, *, device=None, samplerate=16000, channels=1):
-        return FakeStream()
+        return _FakeStream()
 
     def fake_wait_for_stop():
         # Not used in new implementation
@@ -2061,100 +1211,25 @@ def test_start_recording_cancelled_keeps_file(monkeypatch, tmp_path):
     def fake_update_status(path: Path, status: str):
         events.append(("update_status", path, status))
 
-    monkeypatch.setattr(
-        "rejoice.cli.commands.create_transcript", fake_create_transcript
+    _patch_commands(
+        monkeypatch,
+        create_transcript=fake_create_transcript,
+        record_audio=fake_record_audio,
     )
-    monkeypatch.setattr("rejoice.cli.commands.record_audio", fake_record_audio)
-    monkeypatch.setattr("rejoice.cli.commands.Confirm.ask", fake_confirm)
-    monkeypatch.setattr("rejoice.cli.commands.update_status", fake_update_status)
-    monkeypatch.setattr("rejoice.cli.commands.time.time", lambda: 1000)
-
-    from rejoice.core.config import AudioConfig, OutputConfig, TranscriptionConfig
-
-    class FakeConfig:
-        def __init__(self):
-            self.audio = AudioConfig()
-            self.output = OutputConfig(save_path=str(tmp_path))
-            self.transcription = TranscriptionConfig()
-
-    monkeypatch.setattr("rejoice.cli.commands.load_config", lambda: FakeConfig())
+    monkeypatch.setattr(cli_commands.Confirm, "ask", fake_confirm)
+    _patch_commands(monkeypatch, update_status=fake_update_status)
+    monkeypatch.setattr(cli_commands.time, "time", lambda: 1000)
 
     # Mock tempfile and wave
-    import tempfile
-    import wave
-    import time
-
-    class FakeWaveFile:
-        def __init__(self, *args, **kwargs):
-            pass
+    _patch_wav_tempfile(monkeypatch, tmp_path / "temp_audio.wav")
+    monkeypatch.setattr(wave, "open", _FakeWaveFile)
 
-        def setnchannels(self, n):
-            pass
-
-        def setsampwidth(self, width):
-            pass
-
-        def setframerate(self, rate):
-            pass
-
-        def writeframes(self, data):
-            pass
-
-        def close(self):
-            pass
-
-    # Save original NamedTemporaryFile before patching
-    _original_named_temporary_file = tempfile.NamedTemporaryFile
-
-    def fake_named_temporary_file(*args, **kwargs):
-        if kwargs.get("suffix") == ".wav" and kwargs.get("delete") is False:
-
-            class FakeTempFile:
-                def __init__(self):
-                    self.name = str(tmp_path / "temp_audio.wav")
-
-                def __enter__(self):
-                    return self
-
-                def __exit__(self, *args):
-                    pass
-
-                def close(self):
-                    pass
-
-            return FakeTempFile()
-        else:
-            # Use original function to avoid recursion
-            return _original_named_temporary_file(*args, **kwargs)
-
-    monkeypatch.setattr(tempfile, "NamedTemporaryFile", fake_named_temporary_file)
-    monkeypatch.setattr(wave, "open", FakeWaveFile)
-
-    # Mock time.sleep to raise KeyboardInterrupt to simulate Ctrl+C
-    call_count = {"count": 0}
-    original_sleep = time.sleep
-
-    def fake_sleep(seconds):
-        call_count["count"] += 1
-        if call_count["count"] > 2:
-            raise KeyboardInterrupt()
-        return original_sleep(seconds)
-
-    monkeypatch.setattr("rejoice.cli.commands.time.sleep", fake_sleep)
-
-    # Mock input() to block (KeyboardInterrupt will come from time.sleep)
-    def fake_input_blocking(prompt=""):
-        # Block forever using threading.Event (no recursion, no sleep)
-        import threading
-
-        threading.Event().wait()  # Block forever, no sleep calls
-
-    monkeypatch.setattr("builtins.input", fake_input_blocking)
+    release_input = _simulate_ctrl_c(monkeypatch)
 
     try:
         start_recording_session(wait_for_stop=fake_wait_for_stop)
-    except KeyboardInterrupt:
-        pass
+    finally:
+        release_input.set()
 
     # Should have called update_status with "cancelled"
     assert ("update_status", transcript_path, "cancelled") in events
@@ -2164,8 +1239,6 @@ def test_iter_transcripts_handles_nonexistent_directory(monkeypatch):
     """GIVEN _iter_transcripts
     WHEN directory doesn't exist
     THEN returns empty list (line 217)"""
-    from rejoice.cli.commands import _iter_transcripts
-    from pathlib import Path
 
     nonexistent_dir = Path("/nonexistent/path/that/does/not/exist")
     result = _iter_transcripts(nonexistent_dir)
@@ -2176,7 +1249,6 @@ def test_iter_transcripts_skips_non_files(monkeypatch, tmp_path):
     """GIVEN _iter_transcripts
     WHEN directory contains subdirectories
     THEN subdirectories are skipped (line 222)"""
-    from rejoice.cli.commands import _iter_transcripts
 
     save_dir = tmp_path / "transcripts"
     save_dir.mkdir()
@@ -2198,8 +1270,6 @@ def test_split_frontmatter_handles_malformed_frontmatter():
     """GIVEN _split_frontmatter
     WHEN frontmatter is malformed (missing closing ---)
     THEN TranscriptError is raised (lines 285-286)"""
-    from rejoice.cli.commands import _split_frontmatter
-    from rejoice.exceptions import TranscriptError
 
     # Malformed: starts with --- but no closing ---
     malformed = "---\nkey: value\nbody content"
@@ -2214,7 +1284,6 @@ def test_split_frontmatter_handles_no_frontmatter():
     """GIVEN _split_frontmatter
     WHEN content doesn't start with ---
     THEN returns empty frontmatter and full content (line 280)"""
-    from rejoice.cli.commands import _split_frontmatter
 
     content = "Just plain content\nwith no frontmatter"
     frontmatter, body = _split_frontmatter(content)
@@ -2223,56 +1292,40 @@ def test_split_frontmatter_handles_no_frontmatter():
     assert body == content
 
 
-def test_main_version_flag_exits_early(monkeypatch):
+def test_main_version_flag_exits_early(monkeypatch, cli_runner):
     """GIVEN main command
     WHEN --version flag is used
     THEN version is printed and command exits (lines 318-319)"""
-    from rejoice.cli.commands import main
-    from click.testing import CliRunner
 
-    runner = CliRunner()
-    result = runner.invoke(main, ["--version"])
+    result = cli_runner.invoke(main, ["--version"])
 
     assert result.exit_code == 0
     assert "2.0.0" in result.output or "Rejoice" in result.output
 
 
-def test_main_debug_flag_enables_debug(monkeypatch, tmp_path):
+def test_main_debug_flag_enables_debug(monkeypatch, tmp_path, cli_runner):
     """GIVEN main command
     WHEN --debug flag is used
     THEN debug message is printed (line 322)"""
-    from rejoice.cli.commands import main
-    from click.testing import CliRunner
 
-    monkeypatch.setattr("rejoice.cli.commands.setup_logging", lambda debug=False: None)
-    monkeypatch.setattr(
-        "rejoice.cli.commands.start_recording_session",
-        lambda *args, **kwargs: (None, None),
+    _patch_commands(
+        monkeypatch,
+        setup_logging=lambda debug=False: None,
+        start_recording_session=lambda *args, **kwargs: (None, None),
     )
 
-    from rejoice.core.config import AudioConfig, OutputConfig, TranscriptionConfig
-
-    class FakeConfig:
-        def __init__(self):
-            self.audio = AudioConfig()
-            self.output = OutputConfig(save_path=str(tmp_path))
-            self.transcription = TranscriptionConfig()
-
-    monkeypatch.setattr("rejoice.cli.commands.load_config", lambda: FakeConfig())
-
-    runner = CliRunner()
-    result = runner.invoke(main, ["--debug"])
+    result = cli_runner.invoke(main, ["--debug"])
 
     # Should show debug message or proceed without error
     assert result.exit_code == 0 or "Debug mode enabled" in result.output
 
 
-def test_list_recordings_shows_table_with_transcripts(monkeypatch, tmp_path):
+def test_list_recordings_shows_table_with_transcripts(
+    monkeypatch, tmp_path, cli_runner
+):
     """GIVEN list command
     WHEN transcripts exist
     THEN table is displayed with transcript info (lines 338-362)"""
-    from rejoice.cli.commands import main
-    from click.testing import CliRunner
 
     save_dir = tmp_path / "transcripts"
     save_dir.mkdir()
@@ -2281,49 +1334,25 @@ def test_list_recordings_shows_table_with_transcripts(monkeypatch, tmp_path):
     (save_dir / "000001_transcript_20250101.md").write_text("test1")
     (save_dir / "000002_transcript_20250102.md").write_text("test2")
 
-    class FakeOutputConfig:
-        def __init__(self, save_path: str):
-            self.save_path = save_path
-
-    class FakeConfig:
-        def __init__(self, save_path: str):
-            self.output = FakeOutputConfig(save_path)
-
-    monkeypatch.setattr(
-        "rejoice.cli.commands.load_config", lambda: FakeConfig(str(save_dir))
-    )
+    _patch_commands(monkeypatch, load_config=lambda: _make_config(save_dir))
 
-    runner = CliRunner()
-    result = runner.invoke(main, ["list"])
+    result = cli_runner.invoke(main, ["list"])
 
     assert result.exit_code == 0
     assert "Your Recordings" in result.output
     assert "000001" in result.output or "000002" in result.output
 
 
-def test_view_transcript_latest_when_no_transcripts(monkeypatch, tmp_path):
+def test_view_transcript_latest_when_no_transcripts(monkeypatch, tmp_path, cli_runner):
     """GIVEN view command with 'latest'
     WHEN no transcripts exist
     THEN shows 'No transcripts found' message (line 391)"""
-    from rejoice.cli.commands import main
-    from click.testing import CliRunner
-    from pathlib import Path
 
     save_dir = tmp_path / "transcripts"
     save_dir.mkdir()  # Empty directory
 
-    class FakeOutputConfig:
-        def __init__(self, save_path: str):
-            self.save_path = save_path
-
-    class FakeConfig:
-        def __init__(self, save_path: str):
-            self.output = FakeOutputConfig(save_path)
-
     # Mock both load_config and Path.expanduser to avoid permission issues
-    monkeypatch.setattr(
-        "rejoice.cli.commands.load_config", lambda: FakeConfig(str(save_dir))
-    )
+    _patch_commands(monkeypatch, load_config=lambda: _make_config(save_dir))
 
     # Mock Path.expanduser to just return the path as-is
     original_expanduser = Path.expanduser
@@ -2335,8 +1364,7 @@ def test_view_transcript_latest_when_no_transcripts(monkeypatch, tmp_path):
 
     monkeypatch.setattr(Path, "expanduser", mock_expanduser)
 
-    runner = CliRunner()
-    result = runner.invoke(main, ["view", "latest"])
+    result = cli_runner.invoke(main, ["view", "latest"])
 
     assert result.exit_code == 1  # click.Abort() causes exit code 1
     assert (
@@ -2345,12 +1373,10 @@ def test_view_transcript_latest_when_no_transcripts(monkeypatch, tmp_path):
     )
 
 
-def test_list_recordings_handles_non_matching_files(monkeypatch, tmp_path):
+def test_list_recordings_handles_non_matching_files(monkeypatch, tmp_path, cli_runner):
     """GIVEN list command
     WHEN directory contains non-transcript files
     THEN non-matching files are skipped (line 356-357)"""
-    from rejoice.cli.commands import main
-    from click.testing import CliRunner
 
     save_dir = tmp_path / "transcripts"
     save_dir.mkdir()
@@ -2360,20 +1386,9 @@ def test_list_recordings_handles_non_matching_files(monkeypatch, tmp_path):
     # Create non-matching file
     (save_dir / "other_file.txt").write_text("not a transcript")
 
-    class FakeOutputConfig:
-        def __init__(self, save_path: str):
-            self.save_path = save_path
+    _patch_commands(monkeypatch, load_config=lambda: _make_config(save_dir))
 
-    class FakeConfig:
-        def __init__(self, save_path: str):
-            self.output = FakeOutputConfig(save_path)
-
-    monkeypatch.setattr(
-        "rejoice.cli.commands.load_config", lambda: FakeConfig(str(save_dir))
-    )
-
-    runner = CliRunner()
-    result = runner.invoke(main, ["list"])
+    result = cli_runner.invoke(main, ["list"])
 
     assert result.exit_code == 0
     assert "000001" in result.output
@@ -2394,14 +1409,6 @@ def test_recording_cleanup_order_audio_closed_before_display_join(
     transcript_path = tmp_path / "000001_transcript_20250101.md"
     transcript_path.write_text("---\nid: '000001'\n---\n\n", encoding="utf-8")
 
-    from rejoice.core.config import AudioConfig, OutputConfig, TranscriptionConfig
-
-    class FakeConfig:
-        def __init__(self):
-            self.audio = AudioConfig()
-            self.output = OutputConfig(save_path=str(tmp_path))
-            self.transcription = TranscriptionConfig()
-
     def fake_create_transcript(save_dir: Path):
         return transcript_path, "000001"
 
@@ -2462,28 +1469,13 @@ def test_recording_cleanup_order_audio_closed_before_display_join(
             events.append("display_thread_join")
         return original_join(self, timeout)
 
-    monkeypatch.setattr(
-        "rejoice.cli.commands.load_config",
-        lambda: FakeConfig(),
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.create_transcript",
-        fake_create_transcript,
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.record_audio",
-        fake_record_audio,
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.update_status",
-        lambda path, status: None,
+    _patch_commands(
+        monkeypatch,
+        create_transcript=fake_create_transcript,
+        record_audio=fake_record_audio,
+        update_status=lambda path, status: None,
+        append_to_transcript=lambda path, text: None,
     )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.append_to_transcript",
-        lambda path, text: None,
-    )
-
-    import wave
 
     monkeypatch.setattr(wave, "open", FakeWaveFile)
 
@@ -2505,39 +1497,9 @@ def test_recording_cleanup_order_audio_closed_before_display_join(
         def transcribe_file(self, audio_path):
             yield {"text": "Test", "start": 0.0, "end": 1.0}
 
-    monkeypatch.setattr(
-        "rejoice.cli.commands.Transcriber",
-        FakeTranscriber,
-    )
-
-    import tempfile
-
-    def fake_named_temporary_file(*args, **kwargs):
-        if kwargs.get("suffix") == ".wav" and kwargs.get("delete") is False:
-
-            class FakeTempFile:
-                def __init__(self):
-                    self.name = str(tmp_path / "temp_audio.wav")
-
-                def __enter__(self):
-                    return self
-
-                def __exit__(self, *args):
-                    pass
+    _patch_commands(monkeypatch, Transcriber=FakeTranscriber)
 
-                def close(self):
-                    pass
-
-            return FakeTempFile()
-        else:
-            import tempfile as tf
-
-            return tf.NamedTemporaryFile(*args, **kwargs)
-
-    monkeypatch.setattr(tempfile, "NamedTemporaryFile", fake_named_temporary_file)
-
-    # Mock input() to avoid hanging when pytest captures output
-    monkeypatch.setattr("builtins.input", lambda prompt="": "")
+    _patch_wav_tempfile(monkeypatch, tmp_path / "temp_audio.wav")
 
     start_recording_session(wait_for_stop=fake_wait_for_stop)
 
@@ -2560,113 +1522,41 @@ def test_recording_cleanup_order_audio_closed_before_display_join(
             assert wav_close_idx < display_join_idx
 
 
-def test_recording_enter_key_sets_event_and_stops_recording(monkeypatch, tmp_path):
-    """GIVEN a recording session
-    WHEN Enter key is pressed (input() returns)
-    THEN enter_pressed event is set and recording stops.
-    """
-    transcript_path = tmp_path / "000001_transcript_20250101.md"
-    transcript_path.write_text("---\nid: '000001'\n---\n\n", encoding="utf-8")
-
-    from rejoice.core.config import AudioConfig, OutputConfig, TranscriptionConfig
-
-    class FakeConfig:
-        def __init__(self):
-            self.audio = AudioConfig()
-            self.output = OutputConfig(save_path=str(tmp_path))
-            self.transcription = TranscriptionConfig()
-
-    def fake_create_transcript(save_dir: Path):
-        return transcript_path, "000001"
-
-    class FakeStream:
-        def stop(self):
-            pass
-
-        def close(self):
-            pass
-
-    def fake_record_audio(callback, *, device=None, samplerate=16000, channels=1):
-        return FakeStream()
-
-    input_called = {"called": False}
-
-    def fake_input(prompt=""):
-        input_called["called"] = True
-        return ""  # Enter key
-
-    def fake_wait_for_stop():
-        # This should not block - input thread handles it
-        pass
-
-    monkeypatch.setattr("builtins.input", fake_input)
-    monkeypatch.setattr(
-        "rejoice.cli.commands.load_config",
-        lambda: FakeConfig(),
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.create_transcript",
-        fake_create_transcript,
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.record_audio",
-        fake_record_audio,
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.update_status",
-        lambda path, status: None,
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.append_to_transcript",
-        lambda path, text: None,
-    )
-
-    import tempfile
-    import wave
-
-    class FakeWaveFile:
-        def __init__(self, *args, **kwargs):
-            pass
-
-        def setnchannels(self, n):
-            pass
-
-        def setsampwidth(self, width):
-            pass
-
-        def setframerate(self, rate):
-            pass
-
-        def writeframes(self, data):
-            pass
-
-        def close(self):
-            pass
-
-    def fake_named_temporary_file(*args, **kwargs):
-        if kwargs.get("suffix") == ".wav" and kwargs.get("delete") is False:
+def test_recording_enter_key_sets_event_and_stops_recording(monkeypatch, tmp_path):
+    """GIVEN a recording session
+    WHEN Enter key is pressed (input() returns)
+    THEN enter_pressed event is set and recording stops.
+    """
+    transcript_path = tmp_path / "000001_transcript_20250101.md"
+    transcript_path.write_text("---\nid: '000001'\n---\n\n", encoding="utf-8")
 
-            class FakeTempFile:
-                def __init__(self):
-                    self.name = str(tmp_path / "temp_audio.wav")
+    def fake_create_transcript(save_dir: Path):
+        return transcript_path, "000001"
 
-                def __enter__(self):
-                    return self
+    def fake_record_audio(callback, *, device=None, samplerate=16000, channels=1):
+        return _FakeStream()
 
-                def __exit__(self, *args):
-                    pass
+    input_called = {"called": False}
 
-                def close(self):
-                    pass
+    def fake_input(prompt=""):
+        input_called["called"] = True
+        return ""  # Enter key
 
-            return FakeTempFile()
-        else:
-            import tempfile as tf
+    def fake_wait_for_stop():
+        # This should not block - input thread handles it
+        pass
 
-            return tf.NamedTemporaryFile(*args, **kwargs)
+    monkeypatch.setattr("builtins.input", fake_input)
+    _patch_commands(
+        monkeypatch,
+        create_transcript=fake_create_transcript,
+        record_audio=fake_record_audio,
+        update_status=lambda path, status: None,
+        append_to_transcript=lambda path, text: None,
+    )
 
-    monkeypatch.setattr(tempfile, "NamedTemporaryFile", fake_named_temporary_file)
-    monkeypatch.setattr(wave, "open", FakeWaveFile)
+    _patch_wav_tempfile(monkeypatch, tmp_path / "temp_audio.wav")
+    monkeypatch.setattr(wave, "open", _FakeWaveFile)
 
     class FakeTranscriber:
         def __init__(self, config):
@@ -2675,10 +1565,7 @@ def test_recording_enter_key_sets_event_and_stops_recording(monkeypatch, tmp_pat
         def transcribe_file(self, audio_path):
             yield {"text": "Test", "start": 0.0, "end": 1.0}
 
-    monkeypatch.setattr(
-        "rejoice.cli.commands.Transcriber",
-        FakeTranscriber,
-    )
+    _patch_commands(monkeypatch, Transcriber=FakeTranscriber)
 
     # The recording should complete successfully
     filepath, transcript_id = start_recording_session(wait_for_stop=fake_wait_for_stop)
@@ -2697,26 +1584,11 @@ def test_recording_display_thread_exits_when_enter_pressed(monkeypatch, tmp_path
     transcript_path = tmp_path / "000001_transcript_20250101.md"
     transcript_path.write_text("---\nid: '000001'\n---\n\n", encoding="utf-8")
 
-    from rejoice.core.config import AudioConfig, OutputConfig, TranscriptionConfig
-
-    class FakeConfig:
-        def __init__(self):
-            self.audio = AudioConfig()
-            self.output = OutputConfig(save_path=str(tmp_path))
-            self.transcription = TranscriptionConfig()
-
     def fake_create_transcript(save_dir: Path):
         return transcript_path, "000001"
 
-    class FakeStream:
-        def stop(self):
-            pass
-
-        def close(self):
-            pass
-
     def fake_record_audio(callback, *, device=None, samplerate=16000, channels=1):
-        return FakeStream()
+        return _FakeStream()
 
     live_context_exited = {"exited": False}
 
@@ -2739,76 +1611,19 @@ def test_recording_display_thread_exits_when_enter_pressed(monkeypatch, tmp_path
         return ""
 
     monkeypatch.setattr("builtins.input", fake_input)
-    monkeypatch.setattr(
-        "rejoice.cli.commands.load_config",
-        lambda: FakeConfig(),
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.create_transcript",
-        fake_create_transcript,
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.record_audio",
-        fake_record_audio,
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.update_status",
-        lambda path, status: None,
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.append_to_transcript",
-        lambda path, text: None,
+    _patch_commands(
+        monkeypatch,
+        create_transcript=fake_create_transcript,
+        record_audio=fake_record_audio,
+        update_status=lambda path, status: None,
+        append_to_transcript=lambda path, text: None,
     )
 
     # Mock Rich Live
-    monkeypatch.setattr("rejoice.cli.commands.Live", FakeLive)
-
-    import tempfile
-    import wave
-
-    class FakeWaveFile:
-        def __init__(self, *args, **kwargs):
-            pass
-
-        def setnchannels(self, n):
-            pass
-
-        def setsampwidth(self, width):
-            pass
-
-        def setframerate(self, rate):
-            pass
-
-        def writeframes(self, data):
-            pass
-
-        def close(self):
-            pass
+    _patch_commands(monkeypatch, Live=FakeLive)
 
-    def fake_named_temporary_file(*args, **kwargs):
-        if kwargs.get("suffix") == ".wav" and kwargs.get("delete") is False:
-
-            class FakeTempFile:
-                def __init__(self):
-                    self.name = str(tmp_path / "temp_audio.wav")
-
-                def __enter__(self):
-                    return self
-
-                def __exit__(self, *args):
-                    pass
-
-                def close(self):
-                    pass
-
-            return FakeTempFile()
-        else:
-            import tempfile as tf
-
-            return tf.NamedTemporaryFile(*args, **kwargs)
-
-    monkeypatch.setattr(tempfile, "NamedTemporaryFile", fake_named_temporary_file)
-    monkeypatch.setattr(wave, "open", FakeWaveFile)
+    _patch_wav_tempfile(monkeypatch, tmp_path / "temp_audio.wav")
+    monkeypatch.setattr(wave, "open", _FakeWaveFile)
 
     class FakeTranscriber:
         def __init__(self, config):
@@ -2817,56 +1632,33 @@ def test_recording_display_thread_exits_when_enter_pressed(monkeypatch, tmp_path
         def transcribe_file(self, audio_path):
             yield {"text": "Test", "start": 0.0, "end": 1.0}
 
-    monkeypatch.setattr(
-        "rejoice.cli.commands.Transcriber",
-        FakeTranscriber,
-    )
+    _patch_commands(monkeypatch, Transcriber=FakeTranscriber)
 
     def fake_wait_for_stop():
         pass
 
+    # start_recording_session joins the display thread before returning, so
+    # there is no need to wait for it here.
     start_recording_session(wait_for_stop=fake_wait_for_stop)
 
-    # Give display thread time to exit (it's a daemon, but we check the Live context)
-    import time
-
-    time.sleep(0.1)
-
     # The Live context should have exited when enter_pressed was set
     # Note: In a real scenario, the display thread would exit when the loop condition
     # (recording_active.is_set() and not enter_pressed.is_set()) becomes False
     # This test verifies the structure allows clean exit
 
 
-def test_audio_file_deletion_prompt_user_keeps_file(monkeypatch, tmp_path, capsys):
+def test_audio_file_deletion_prompt_user_keeps_file(
+    monkeypatch, tmp_path, capsys, transcript_and_audio
+):
     """GIVEN a successful recording and transcription
     WHEN user chooses not to delete the audio file
     THEN the temporary audio file is preserved."""
-    transcript_path = tmp_path / "000001_transcript_20250101.md"
-    transcript_path.write_text("---\nid: '000001'\n---\n\n", encoding="utf-8")
-    temp_audio_path = tmp_path / "temp_audio.wav"
-    temp_audio_path.write_bytes(b"dummy audio data")
-
-    # Mock config
-    from rejoice.core.config import AudioConfig, OutputConfig, TranscriptionConfig
-
-    class FakeConfig:
-        def __init__(self):
-            self.audio = AudioConfig()
-            self.output = OutputConfig(save_path=str(tmp_path))
-            self.transcription = TranscriptionConfig()
+    transcript_path, temp_audio_path = transcript_and_audio
 
     def fake_create_transcript(save_dir: Path):
         return transcript_path, "000001"
 
-    class FakeStream:
-        def stop(self) -> None:
-            pass
-
-        def close(self) -> None:
-            pass
-
-    fake_stream = FakeStream()
+    fake_stream = _FakeStream()
 
     def fake_record_audio(callback, *, device=None, samplerate=16000, channels=1):
         return fake_stream
@@ -2881,89 +1673,23 @@ def test_audio_file_deletion_prompt_user_keeps_file(monkeypatch, tmp_path, capsy
         def transcribe_file(self, audio_path):
             yield {"text": "Test", "start": 0.0, "end": 1.0}
 
-    monkeypatch.setattr(
-        "rejoice.cli.commands.load_config",
-        lambda: FakeConfig(),
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.create_transcript",
-        fake_create_transcript,
+    _patch_commands(
+        monkeypatch,
+        create_transcript=fake_create_transcript,
+        record_audio=fake_record_audio,
+        update_status=lambda path, status: None,
+        append_to_transcript=lambda path, text: None,
+        Transcriber=FakeTranscriber,
     )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.record_audio",
-        fake_record_audio,
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.update_status",
-        lambda path, status: None,
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.append_to_transcript",
-        lambda path, text: None,
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.Transcriber",
-        FakeTranscriber,
-    )
-
-    import tempfile
-    import wave
-
-    def fake_named_temporary_file(*args, **kwargs):
-        if kwargs.get("suffix") == ".wav" and kwargs.get("delete") is False:
-
-            class FakeTempFile:
-                def __init__(self):
-                    self.name = str(temp_audio_path)
-                    self._content = ""
-
-                def __enter__(self):
-                    return self
-
-                def __exit__(self, *args):
-                    pass
-
-                def write(self, data):
-                    self._content += data
-
-                def close(self):
-                    pass
-
-            return FakeTempFile()
-        else:
-            import tempfile as tf
-
-            return tf.NamedTemporaryFile(*args, **kwargs)
-
-    class FakeWaveFile:
-        def __init__(self, *args, **kwargs):
-            pass
-
-        def setnchannels(self, n):
-            pass
-
-        def setsampwidth(self, width):
-            pass
-
-        def setframerate(self, rate):
-            pass
 
-        def writeframes(self, data):
-            pass
-
-        def close(self):
-            pass
-
-    monkeypatch.setattr(tempfile, "NamedTemporaryFile", fake_named_temporary_file)
-    monkeypatch.setattr(wave, "open", FakeWaveFile)
+    _patch_wav_tempfile(monkeypatch, temp_audio_path)
+    monkeypatch.setattr(wave, "open", _FakeWaveFile)
 
     # Mock input() to avoid hanging when pytest captures output
     monkeypatch.setattr("builtins.input", lambda prompt="": "")
 
     # Mock Confirm.ask to return False (user chooses not to delete)
-    from rich.prompt import Confirm
-
-    monkeypatch.setattr(Confirm, "ask", lambda prompt, default=True: False)
+    monkeypatch.setattr(cli_commands.Confirm, "ask", lambda prompt, default=True: False)
 
     start_recording_session(wait_for_stop=fake_wait_for_stop)
 
@@ -2971,35 +1697,18 @@ def test_audio_file_deletion_prompt_user_keeps_file(monkeypatch, tmp_path, capsy
     assert temp_audio_path.exists()
 
 
-def test_completion_output_shows_correct_format(monkeypatch, tmp_path, capsys):
+def test_completion_output_shows_correct_format(
+    monkeypatch, tmp_path, capsys, transcript_and_audio
+):
     """GIVEN a successful recording and transcription
     WHEN transcription completes
     THEN the completion panel shows correct format with session details."""
-    transcript_path = tmp_path / "000001_transcript_20250101.md"
-    transcript_path.write_text("---\nid: '000001'\n---\n\n", encoding="utf-8")
-    temp_audio_path = tmp_path / "temp_audio.wav"
-    temp_audio_path.write_bytes(b"dummy audio data")
-
-    # Mock config
-    from rejoice.core.config import AudioConfig, OutputConfig, TranscriptionConfig
-
-    class FakeConfig:
-        def __init__(self):
-            self.audio = AudioConfig()
-            self.output = OutputConfig(save_path=str(tmp_path))
-            self.transcription = TranscriptionConfig()
+    transcript_path, temp_audio_path = transcript_and_audio
 
     def fake_create_transcript(save_dir: Path):
         return transcript_path, "000001"
 
-    class FakeStream:
-        def stop(self) -> None:
-            pass
-
-        def close(self) -> None:
-            pass
-
-    fake_stream = FakeStream()
+    fake_stream = _FakeStream()
 
     def fake_record_audio(callback, *, device=None, samplerate=16000, channels=1):
         return fake_stream
@@ -3016,93 +1725,25 @@ def test_completion_output_shows_correct_format(monkeypatch, tmp_path, capsys):
             yield {"text": "Hello world test", "start": 0.0, "end": 1.0}
             yield {"text": "More words here", "start": 1.0, "end": 2.0}
 
-    monkeypatch.setattr(
-        "rejoice.cli.commands.load_config",
-        lambda: FakeConfig(),
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.create_transcript",
-        fake_create_transcript,
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.record_audio",
-        fake_record_audio,
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.update_status",
-        lambda path, status: None,
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.append_to_transcript",
-        lambda path, text: None,
+    _patch_commands(
+        monkeypatch,
+        create_transcript=fake_create_transcript,
+        record_audio=fake_record_audio,
+        update_status=lambda path, status: None,
+        append_to_transcript=lambda path, text: None,
+        Transcriber=FakeTranscriber,
     )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.Transcriber",
-        FakeTranscriber,
-    )
-
-    import tempfile
-    import wave
-
-    def fake_named_temporary_file(*args, **kwargs):
-        if kwargs.get("suffix") == ".wav" and kwargs.get("delete") is False:
-
-            class FakeTempFile:
-                def __init__(self):
-                    self.name = str(temp_audio_path)
-                    self._content = ""
-
-                def __enter__(self):
-                    return self
-
-                def __exit__(self, *args):
-                    pass
-
-                def write(self, data):
-                    self._content += data
-
-                def close(self):
-                    pass
-
-            return FakeTempFile()
-        else:
-            import tempfile as tf
-
-            return tf.NamedTemporaryFile(*args, **kwargs)
-
-    class FakeWaveFile:
-        def __init__(self, *args, **kwargs):
-            pass
-
-        def setnchannels(self, n):
-            pass
-
-        def setsampwidth(self, width):
-            pass
-
-        def setframerate(self, rate):
-            pass
-
-        def writeframes(self, data):
-            pass
-
-        def close(self):
-            pass
 
-    monkeypatch.setattr(tempfile, "NamedTemporaryFile", fake_named_temporary_file)
-    monkeypatch.setattr(wave, "open", FakeWaveFile)
+    _patch_wav_tempfile(monkeypatch, temp_audio_path)
+    monkeypatch.setattr(wave, "open", _FakeWaveFile)
 
     # Mock input() to avoid hanging when pytest captures output
     monkeypatch.setattr("builtins.input", lambda prompt="": "")
 
     # Mock Confirm.ask to return True (default yes for deletion)
-    from rich.prompt import Confirm
-
-    monkeypatch.setattr(Confirm, "ask", lambda prompt, default=True: True)
+    monkeypatch.setattr(cli_commands.Confirm, "ask", lambda prompt, default=True: True)
 
     # Mock sys.stdout.write to capture screen clear
-    import sys
-
     screen_clears = []
     original_write = sys.stdout.write
 
@@ -3132,37 +1773,20 @@ def test_completion_output_shows_correct_format(monkeypatch, tmp_path, capsys):
     assert str(tmp_path) in output or "Saved to" in output
 
 
-def test_transcription_progress_display_format(monkeypatch, tmp_path):
+def test_transcription_progress_display_format(
+    monkeypatch, tmp_path, transcript_and_audio
+):
     """GIVEN a recording session with transcription
     WHEN transcription is in progress
     THEN the progress display shows correct format with STATUS, SESSION ID,
     FILE, PROGRESS, ELAPSED.
     """
-    transcript_path = tmp_path / "000001_transcript_20250101.md"
-    transcript_path.write_text("---\nid: '000001'\n---\n\n", encoding="utf-8")
-    temp_audio_path = tmp_path / "temp_audio.wav"
-    temp_audio_path.write_bytes(b"dummy audio data")
-
-    # Mock config
-    from rejoice.core.config import AudioConfig, OutputConfig, TranscriptionConfig
-
-    class FakeConfig:
-        def __init__(self):
-            self.audio = AudioConfig()
-            self.output = OutputConfig(save_path=str(tmp_path))
-            self.transcription = TranscriptionConfig()
+    transcript_path, temp_audio_path = transcript_and_audio
 
     def fake_create_transcript(save_dir: Path):
         return transcript_path, "000001"
 
-    class FakeStream:
-        def stop(self) -> None:
-            pass
-
-        def close(self) -> None:
-            pass
-
-    fake_stream = FakeStream()
+    fake_stream = _FakeStream()
 
     def fake_record_audio(callback, *, device=None, samplerate=16000, channels=1):
         return fake_stream
@@ -3180,100 +1804,28 @@ def test_transcription_progress_display_format(monkeypatch, tmp_path):
             progress_display_shown["value"] = True
 
         def transcribe_file(self, audio_path):
-            # Yield segments slowly to allow progress display to update
-            import time
-
             yield {"text": "Test segment", "start": 0.0, "end": 1.0}
-            time.sleep(0.2)  # Allow display thread to update
             yield {"text": "Another segment", "start": 1.0, "end": 2.0}
 
-    monkeypatch.setattr(
-        "rejoice.cli.commands.load_config",
-        lambda: FakeConfig(),
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.create_transcript",
-        fake_create_transcript,
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.record_audio",
-        fake_record_audio,
+    _patch_commands(
+        monkeypatch,
+        create_transcript=fake_create_transcript,
+        record_audio=fake_record_audio,
+        update_status=lambda path, status: None,
+        append_to_transcript=lambda path, text: None,
+        Transcriber=FakeTranscriber,
     )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.update_status",
-        lambda path, status: None,
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.append_to_transcript",
-        lambda path, text: None,
-    )
-    monkeypatch.setattr(
-        "rejoice.cli.commands.Transcriber",
-        FakeTranscriber,
-    )
-
-    import tempfile
-    import wave
-
-    def fake_named_temporary_file(*args, **kwargs):
-        if kwargs.get("suffix") == ".wav" and kwargs.get("delete") is False:
-
-            class FakeTempFile:
-                def __init__(self):
-                    self.name = str(temp_audio_path)
-                    self._content = ""
-
-                def __enter__(self):
-                    return self
-
-                def __exit__(self, *args):
-                    pass
-
-                def write(self, data):
-                    self._content += data
-
-                def close(self):
-                    pass
-
-            return FakeTempFile()
-        else:
-            import tempfile as tf
-
-            return tf.NamedTemporaryFile(*args, **kwargs)
-
-    class FakeWaveFile:
-        def __init__(self, *args, **kwargs):
-            pass
-
-        def setnchannels(self, n):
-            pass
 
-        def setsampwidth(self, width):
-            pass
-
-        def setframerate(self, rate):
-            pass
-
-        def writeframes(self, data):
-            pass
-
-        def close(self):
-            pass
-
-    monkeypatch.setattr(tempfile, "NamedTemporaryFile", fake_named_temporary_file)
-    monkeypatch.setattr(wave, "open", FakeWaveFile)
+    _patch_wav_tempfile(monkeypatch, temp_audio_path)
+    monkeypatch.setattr(wave, "open", _FakeWaveFile)
 
     # Mock input() to avoid hanging when pytest captures output
     monkeypatch.setattr("builtins.input", lambda prompt="": "")
 
     # Mock Confirm.ask to return True (default yes for deletion)
-    from rich.prompt import Confirm
-
-    monkeypatch.setattr(Confirm, "ask", lambda prompt, default=True: True)
+    monkeypatch.setattr(cli_commands.Confirm, "ask", lambda prompt, default=True: True)
 
     # Mock sys.stdout.write to capture screen clear
-    import sys
-
     screen_clears = []
     original_write = sys.stdout.write
 
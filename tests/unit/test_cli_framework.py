@@ -1,101 +1,93 @@
 """Tests for CLI framework setup."""
 
-from click.testing import CliRunner
-
+import rejoice.cli.commands as cli_commands
 from rejoice.cli.commands import main
 
 
-def test_main_command_help():
+def test_main_command_help(cli_runner):
     """GIVEN rec command
     WHEN --help is called
     THEN help text is displayed with subcommands"""
-    runner = CliRunner()
-    result = runner.invoke(main, ["--help"])
+    result = cli_runner.invoke(main, ["--help"])
     assert result.exit_code == 0
     assert "Rejoice" in result.output
     assert "Commands:" in result.output
     assert "config" in result.output
 
 
-def test_version_flag():
+def test_version_flag(cli_runner):
     """GIVEN --version flag
     WHEN main is invoked
     THEN version is displayed and exits"""
-    runner = CliRunner()
-    result = runner.invoke(main, ["--version"])
+    result = cli_runner.invoke(main, ["--version"])
     assert result.exit_code == 0
     assert "2.0.0" in result.output
 
 
-def test_debug_flag_global():
+def test_debug_flag_global(cli_runner):
     """GIVEN --debug flag
     WHEN main is invoked
     THEN debug mode is enabled"""
-    runner = CliRunner()
-    result = runner.invoke(main, ["--debug", "--help"])
+    result = cli_runner.invoke(main, ["--debug", "--help"])
     assert result.exit_code == 0
     # Debug flag should be accepted globally
 
 
-def test_language_flag_global():
+def test_language_flag_global(cli_runner):
     """GIVEN --language flag
     WHEN main is invoked
     THEN the flag is accepted globally."""
-    runner = CliRunner()
-    result = runner.invoke(main, ["--language", "en", "--help"])
+    result = cli_runner.invoke(main, ["--language", "en", "--help"])
     assert result.exit_code == 0
 
 
-def test_config_subcommand_exists():
+def test_config_subcommand_exists(cli_runner):
     """GIVEN rec command
     WHEN config subcommand is called
     THEN config commands are available"""
-    runner = CliRunner()
-    result = runner.invoke(main, ["config", "--help"])
+    result = cli_runner.invoke(main, ["config", "--help"])
     assert result.exit_code == 0
     assert "Configuration" in result.output or "config" in result.output.lower()
 
 
-def test_config_show_command():
+def test_config_show_command(cli_runner):
     """GIVEN rec config show
     WHEN invoked
     THEN configuration is displayed"""
-    runner = CliRunner()
-    result = runner.invoke(main, ["config", "show"])
+    result = cli_runner.invoke(main, ["config", "show"])
     # Should succeed (may show defaults if no config file)
     assert result.exit_code == 0
 
 
-def test_config_path_command():
+def test_config_path_command(cli_runner):
     """GIVEN rec config path
     WHEN invoked
     THEN config file path is shown"""
-    runner = CliRunner()
-    result = runner.invoke(main, ["config", "path"])
+    result = cli_runner.invoke(main, ["config", "path"])
     assert result.exit_code == 0
     assert "Config" in result.output or "config" in result.output.lower()
 
 
-def test_config_init_command():
+def test_config_init_command(cli_runner):
     """GIVEN rec config init
     WHEN invoked
     THEN config file is created"""
-    runner = CliRunner()
     # This will create a file, so we test it works
-    result = runner.invoke(
+    result = cli_runner.invoke(
         main, ["config", "init"], input="n\n"
     )  # Don't overwrite if exists
     # Should either succeed or show message
     assert result.exit_code in [0, 1]  # May exit with code 1 if cancelled
 
 
-def test_no_subcommand_shows_help(monkeypatch, tmp_path):
+def test_no_subcommand_shows_help(monkeypatch, tmp_path, cli_runner):
     """GIVEN rec with no subcommand
     WHEN invoked
     THEN help or default behavior is shown"""
-    monkeypatch.setattr("rejoice.cli.commands.setup_logging", lambda debug=False: None)
+    monkeypatch.setattr(cli_commands, "setup_logging", lambda debug=False: None)
     monkeypatch.setattr(
-        "rejoice.cli.commands.start_recording_session",
+        cli_commands,
+        "start_recording_session",
         lambda *args, **kwargs: (None, None),
     )
 
@@ -107,9 +99,8 @@ def test_no_subcommand_shows_help(monkeypatch, tmp_path):
             self.output = OutputConfig(save_path=str(tmp_path))
             self.transcription = TranscriptionConfig()
 
-    monkeypatch.setattr("rejoice.cli.commands.load_config", lambda: FakeConfig())
+    monkeypatch.setattr(cli_commands, "load_config", lambda: FakeConfig())
 
-    runner = CliRunner()
-    result = runner.invoke(main, [])
+    result = cli_runner.invoke(main, [])
     # Should show help or default message (or start recording which we've mocked)
     assert result.exit_code == 0
@@ -250,3 +250,81 @@ def test_load_env_overrides_converts_integer_strings(monkeypatch):
             with patch.dict(os.environ, {"REJOICE_AUDIO_SAMPLE_RATE": "32000"}):
                 overrides = load_env_overrides()
                 assert overrides["audio"]["sample_rate"] == 32000
+
+
+def test_env_overrides_cpu_tuning():
+    """GIVEN CPU tuning environment variables
+    WHEN env overrides are loaded
+    THEN they are mapped to integer transcription settings"""
+    from rejoice.core.config import load_env_overrides
+
+    env = {
+        "REJOICE_TRANSCRIPTION_CPU_THREADS": "6",
+        "REJOICE_TRANSCRIPTION_NUM_WORKERS": "2",
+    }
+    with patch.dict(os.environ, env):
+        overrides = load_env_overrides()
+
+    assert overrides["transcription"]["cpu_threads"] == 6
+    assert overrides["transcription"]["num_workers"] == 2
+
+
+def test_config_validation_invalid_num_workers():
+    """GIVEN config with num_workers below 1
+    WHEN config is loaded
+    THEN validation error is raised"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_dir = Path(tmpdir) / ".config" / "rejoice"
+        config_dir.mkdir(parents=True)
+        config_file = config_dir / "config.yaml"
+        config_file.write_text(yaml.dump({"transcription": {"num_workers": 0}}))
+
+        with patch("rejoice.core.config.get_config_dir", return_value=config_dir):
+            with pytest.raises(ConfigError, match="num_workers"):
+                load_config()
+
+
+def test_config_validation_negative_cpu_threads_from_env():
+    """GIVEN a negative cpu_threads environment variable
+    WHEN config is loaded
+    THEN a ConfigError naming the field is raised"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_dir = Path(tmpdir) / ".config" / "rejoice"
+        config_dir.mkdir(parents=True)
+
+        env = {"REJOICE_TRANSCRIPTION_CPU_THREADS": "-1"}
+        with patch("rejoice.core.config.get_config_dir", return_value=config_dir):
+            with patch.dict(os.environ, env):
+                with pytest.raises(ConfigError, match="cpu_threads"):
+                    load_config()
+
+
+def test_config_validation_non_numeric_num_workers_from_env():
+    """GIVEN a non-numeric num_workers environment variable
+    WHEN config is loaded
+    THEN a ConfigError naming the field is raised"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_dir = Path(tmpdir) / ".config" / "rejoice"
+        config_dir.mkdir(parents=True)
+
+        env = {"REJOICE_TRANSCRIPTION_NUM_WORKERS": "abc"}
+        with patch("rejoice.core.config.get_config_dir", return_value=config_dir):
+            with patch.dict(os.environ, env):
+                with pytest.raises(ConfigError, match="num_workers"):
+                    load_config()
+
+
+def test_config_validation_accepts_numeric_string_from_yaml():
+    """GIVEN cpu_threads written as a quoted number in the config file
+    WHEN config is loaded
+    THEN it is converted to an integer"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_dir = Path(tmpdir) / ".config" / "rejoice"
+        config_dir.mkdir(parents=True)
+        config_file = config_dir / "config.yaml"
+        config_file.write_text("transcription:\n  cpu_threads: '4'\n")
+
+        with patch("rejoice.core.config.get_config_dir", return_value=config_dir):
+            config = load_config()
+
+    assert config.transcription.cpu_threads == 4
@@ -1,19 +1,17 @@
 """Tests for configuration CLI commands."""
 
-from click.testing import CliRunner
-
+import rejoice.cli.config_commands as config_commands
 from rejoice.cli.commands import main
 
 
-def test_config_show_displays_configuration(tmp_path, monkeypatch):
+def test_config_show_displays_configuration(tmp_path, monkeypatch, cli_runner):
     """GIVEN rec config show
     WHEN invoked with valid config
     THEN configuration table is displayed"""
     # Mock config directory
     monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
 
-    runner = CliRunner()
-    result = runner.invoke(main, ["config", "show"])
+    result = cli_runner.invoke(main, ["config", "show"])
 
     assert result.exit_code == 0
     assert "Rejoice Configuration" in result.output
@@ -21,7 +19,7 @@ def test_config_show_displays_configuration(tmp_path, monkeypatch):
     assert "Save Path" in result.output
 
 
-def test_config_show_handles_error_gracefully(monkeypatch):
+def test_config_show_handles_error_gracefully(monkeypatch, cli_runner):
     """GIVEN rec config show
     WHEN config loading fails
     THEN error is displayed and command aborts"""
@@ -29,16 +27,15 @@ def test_config_show_handles_error_gracefully(monkeypatch):
     def mock_load_config():
         raise Exception("Config error")
 
-    monkeypatch.setattr("rejoice.cli.config_commands.load_config", mock_load_config)
+    monkeypatch.setattr(config_commands, "load_config", mock_load_config)
 
-    runner = CliRunner()
-    result = runner.invoke(main, ["config", "show"])
+    result = cli_runner.invoke(main, ["config", "show"])
 
     assert result.exit_code != 0
     assert "Error loading config" in result.output
 
 
-def test_config_path_shows_path_when_file_exists(tmp_path, monkeypatch):
+def test_config_path_shows_path_when_file_exists(tmp_path, monkeypatch, cli_runner):
     """GIVEN rec config path
     WHEN config file exists
     THEN path is shown with success indicator"""
@@ -49,8 +46,7 @@ def test_config_path_shows_path_when_file_exists(tmp_path, monkeypatch):
 
     monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / ".config"))
 
-    runner = CliRunner()
-    result = runner.invoke(main, ["config", "path"])
+    result = cli_runner.invoke(main, ["config", "path"])
 
     assert result.exit_code == 0
     assert "Config directory" in result.output
@@ -58,7 +54,7 @@ def test_config_path_shows_path_when_file_exists(tmp_path, monkeypatch):
     assert "✓ Config file exists" in result.output
 
 
-def test_config_path_shows_warning_when_file_missing(tmp_path, monkeypatch):
+def test_config_path_shows_warning_when_file_missing(tmp_path, monkeypatch, cli_runner):
     """GIVEN rec config path
     WHEN config file does not exist
     THEN path is shown with warning"""
@@ -67,8 +63,7 @@ def test_config_path_shows_warning_when_file_missing(tmp_path, monkeypatch):
 
     monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / ".config"))
 
-    runner = CliRunner()
-    result = runner.invoke(main, ["config", "path"])
+    result = cli_runner.invoke(main, ["config", "path"])
 
     assert result.exit_code == 0
     assert "Config directory" in result.output
@@ -76,7 +71,7 @@ def test_config_path_shows_warning_when_file_missing(tmp_path, monkeypatch):
     assert "⚠ Config file does not exist" in result.output
 
 
-def test_config_init_creates_file_when_not_exists(tmp_path, monkeypatch):
+def test_config_init_creates_file_when_not_exists(tmp_path, monkeypatch, cli_runner):
     """GIVEN rec config init
     WHEN config file does not exist
     THEN config file is created"""
@@ -84,8 +79,7 @@ def test_config_init_creates_file_when_not_exists(tmp_path, monkeypatch):
 
     monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / ".config"))
 
-    runner = CliRunner()
-    result = runner.invoke(main, ["config", "init"])
+    result = cli_runner.invoke(main, ["config", "init"])
 
     assert result.exit_code == 0
     config_file = config_dir / "config.yaml"
@@ -94,7 +88,7 @@ def test_config_init_creates_file_when_not_exists(tmp_path, monkeypatch):
     assert "transcription:" in config_file.read_text()
 
 
-def test_config_init_prompts_when_file_exists(tmp_path, monkeypatch):
+def test_config_init_prompts_when_file_exists(tmp_path, monkeypatch, cli_runner):
     """GIVEN rec config init
     WHEN config file exists
     THEN user is prompted to overwrite"""
@@ -105,9 +99,8 @@ def test_config_init_prompts_when_file_exists(tmp_path, monkeypatch):
 
     monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / ".config"))
 
-    runner = CliRunner()
     # Answer 'n' to not overwrite
-    result = runner.invoke(main, ["config", "init"], input="n\n")
+    result = cli_runner.invoke(main, ["config", "init"], input="n\n")
 
     assert result.exit_code == 0
     assert "Cancelled" in result.output
@@ -115,7 +108,7 @@ def test_config_init_prompts_when_file_exists(tmp_path, monkeypatch):
     assert "existing: config" in config_file.read_text()
 
 
-def test_config_init_overwrites_when_confirmed(tmp_path, monkeypatch):
+def test_config_init_overwrites_when_confirmed(tmp_path, monkeypatch, cli_runner):
     """GIVEN rec config init
     WHEN config file exists and user confirms
     THEN config file is overwritten"""
@@ -126,9 +119,8 @@ def test_config_init_overwrites_when_confirmed(tmp_path, monkeypatch):
 
     monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / ".config"))
 
-    runner = CliRunner()
     # Answer 'y' to overwrite
-    result = runner.invoke(main, ["config", "init"], input="y\n")
+    result = cli_runner.invoke(main, ["config", "init"], input="y\n")
 
     assert result.exit_code == 0
     assert "Configuration file created" in result.output
@@ -138,7 +130,7 @@ def test_config_init_overwrites_when_confirmed(tmp_path, monkeypatch):
     assert "existing: config" not in content
 
 
-def test_config_list_mics_shows_devices(monkeypatch):
+def test_config_list_mics_shows_devices(monkeypatch, cli_runner):
     """GIVEN rec config list-mics
     WHEN devices are available
     THEN device table is displayed"""
@@ -151,8 +143,7 @@ def test_config_list_mics_shows_devices(monkeypatch):
         "rejoice.cli.config_commands.get_audio_input_devices", lambda: fake_devices
     )
 
-    runner = CliRunner()
-    result = runner.invoke(main, ["config", "list-mics"])
+    result = cli_runner.invoke(main, ["config", "list-mics"])
 
     assert result.exit_code == 0
     assert "Audio Input Devices" in result.output
@@ -161,7 +152,7 @@ def test_config_list_mics_shows_devices(monkeypatch):
     assert "✓" in result.output  # Default indicator
 
 
-def test_config_list_mics_shows_warning_when_no_devices(monkeypatch):
+def test_config_list_mics_shows_warning_when_no_devices(monkeypatch, cli_runner):
     """GIVEN rec config list-mics
     WHEN no devices are available
     THEN warning message is shown"""
@@ -169,14 +160,13 @@ def test_config_list_mics_shows_warning_when_no_devices(monkeypatch):
         "rejoice.cli.config_commands.get_audio_input_devices", lambda: []
     )
 
-    runner = CliRunner()
-    result = runner.invoke(main, ["config", "list-mics"])
+    result = cli_runner.invoke(main, ["config", "list-mics"])
 
     assert result.exit_code == 0
     assert "No audio input devices found" in result.output
 
 
-def test_config_list_mics_handles_runtime_error(monkeypatch):
+def test_config_list_mics_handles_runtime_error(monkeypatch, cli_runner):
     """GIVEN rec config list-mics
     WHEN get_audio_input_devices raises RuntimeError
     THEN error is displayed and command aborts"""
@@ -188,14 +178,13 @@ def test_config_list_mics_handles_runtime_error(monkeypatch):
         "rejoice.cli.config_commands.get_audio_input_devices", mock_get_devices
     )
 
-    runner = CliRunner()
-    result = runner.invoke(main, ["config", "list-mics"])
+    result = cli_runner.invoke(main, ["config", "list-mics"])
 
     assert result.exit_code != 0
     assert "Audio system error" in result.output
 
 
-def test_config_list_mics_handles_missing_device_fields(monkeypatch):
+def test_config_list_mics_handles_missing_device_fields(monkeypatch, cli_runner):
     """GIVEN rec config list-mics
     WHEN device dicts have missing fields
     THEN command handles gracefully with defaults"""
@@ -208,8 +197,7 @@ def test_config_list_mics_handles_missing_device_fields(monkeypatch):
         "rejoice.cli.config_commands.get_audio_input_devices", lambda: fake_devices
     )
 
-    runner = CliRunner()
-    result = runner.invoke(main, ["config", "list-mics"])
+    result = cli_runner.invoke(main, ["config", "list-mics"])
 
     assert result.exit_code == 0
     assert "Audio Input Devices" in result.output
@@ -217,7 +205,7 @@ def test_config_list_mics_handles_missing_device_fields(monkeypatch):
     assert "USB Mic" in result.output
 
 
-def test_config_mic_chooses_and_saves_device(tmp_path, monkeypatch):
+def test_config_mic_chooses_and_saves_device(tmp_path, monkeypatch, cli_runner):
     """GIVEN rec config mic
     WHEN user selects a device
     THEN device is saved to config"""
@@ -235,8 +223,7 @@ def test_config_mic_chooses_and_saves_device(tmp_path, monkeypatch):
     ) as mock_choose:
         with patch("rejoice.cli.config_commands.test_microphone", return_value=True):
             with patch("rich.prompt.Confirm.ask", return_value=True):
-                runner = CliRunner()
-                result = runner.invoke(main, ["config", "mic"], input="y\n")
+                result = cli_runner.invoke(main, ["config", "mic"], input="y\n")
 
                 assert result.exit_code == 0
                 mock_choose.assert_called_once()
@@ -247,7 +234,7 @@ def test_config_mic_chooses_and_saves_device(tmp_path, monkeypatch):
                 assert config_data["audio"]["device"] == "1"
 
 
-def test_config_mic_skips_test_when_user_declines(tmp_path, monkeypatch):
+def test_config_mic_skips_test_when_user_declines(tmp_path, monkeypatch, cli_runner):
     """GIVEN rec config mic
     WHEN user declines to test
     THEN device is still saved"""
@@ -262,8 +249,7 @@ def test_config_mic_skips_test_when_user_declines(tmp_path, monkeypatch):
 
     with patch("rejoice.cli.config_commands.choose_microphone", return_value="default"):
         with patch("rich.prompt.Confirm.ask", return_value=False):
-            runner = CliRunner()
-            result = runner.invoke(main, ["config", "mic"])
+            result = cli_runner.invoke(main, ["config", "mic"])
 
             assert result.exit_code == 0
             # Verify device was saved even without test
@@ -273,7 +259,7 @@ def test_config_mic_skips_test_when_user_declines(tmp_path, monkeypatch):
             assert config_data["audio"]["device"] == "default"
 
 
-def test_settings_command_opens_menu(tmp_path, monkeypatch):
+def test_settings_command_opens_menu(tmp_path, monkeypatch, cli_runner):
     """GIVEN rec settings
     WHEN invoked
     THEN interactive menu is displayed"""
@@ -284,15 +270,14 @@ def test_settings_command_opens_menu(tmp_path, monkeypatch):
 
     monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / ".config"))
 
-    runner = CliRunner()
     # Simulate user selecting "Exit" immediately
-    result = runner.invoke(main, ["config", "settings"], input="q\n")
+    result = cli_runner.invoke(main, ["config", "settings"], input="q\n")
 
     assert result.exit_code == 0
     assert "Settings" in result.output or "settings" in result.output.lower()
 
 
-def test_settings_shows_current_values(tmp_path, monkeypatch):
+def test_settings_shows_current_values(tmp_path, monkeypatch, cli_runner):
     """GIVEN rec settings
     WHEN viewing a setting category
     THEN current values are displayed"""
@@ -305,16 +290,15 @@ def test_settings_shows_current_values(tmp_path, monkeypatch):
 
     monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / ".config"))
 
-    runner = CliRunner()
     # Navigate to transcription settings, then exit
-    result = runner.invoke(main, ["config", "settings"], input="1\nq\nq\n")
+    result = cli_runner.invoke(main, ["config", "settings"], input="1\nq\nq\n")
 
     assert result.exit_code == 0
     # Should show current model value
     assert "small" in result.output or "Model" in result.output
 
 
-def test_settings_updates_transcription_model(tmp_path, monkeypatch):
+def test_settings_updates_transcription_model(tmp_path, monkeypatch, cli_runner):
     """GIVEN rec settings
     WHEN updating transcription model
     THEN config file is updated"""
@@ -325,10 +309,9 @@ def test_settings_updates_transcription_model(tmp_path, monkeypatch):
 
     monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / ".config"))
 
-    runner = CliRunner()
     # Navigate: Main menu -> Transcription -> Model -> Enter new value
     # -> No to "change another" -> Back -> Exit
-    result = runner.invoke(
+    result = cli_runner.invoke(
         main,
         ["config", "settings"],
         input="1\n1\nlarge\nn\nq\nq\n",
@@ -342,7 +325,7 @@ def test_settings_updates_transcription_model(tmp_path, monkeypatch):
     assert config_data["transcription"]["model"] == "large"
 
 
-def test_settings_validates_model_input(tmp_path, monkeypatch):
+def test_settings_validates_model_input(tmp_path, monkeypatch, cli_runner):
     """GIVEN rec settings
     WHEN entering invalid model name
     THEN validation error is shown and value is not saved"""
@@ -353,9 +336,8 @@ def test_settings_validates_model_input(tmp_path, monkeypatch):
 
     monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / ".config"))
 
-    runner = CliRunner()
     # Try to set invalid model, then exit
-    result = runner.invoke(
+    result = cli_runner.invoke(
         main,
         ["config", "settings"],
         input="1\n1\ninvalid_model\nn\n1\nmedium\nn\nq\n",
@@ -371,7 +353,7 @@ def test_settings_validates_model_input(tmp_path, monkeypatch):
     assert config_data["transcription"]["model"] == "medium"
 
 
-def test_settings_updates_save_path(tmp_path, monkeypatch):
+def test_settings_updates_save_path(tmp_path, monkeypatch, cli_runner):
     """GIVEN rec settings
     WHEN updating save path
     THEN config file is updated with expanded path"""
@@ -382,11 +364,10 @@ def test_settings_updates_save_path(tmp_path, monkeypatch):
 
     monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / ".config"))
 
-    runner = CliRunner()
     new_path = str(tmp_path / "new_transcripts")
     # Navigate: Main menu -> Output -> Save Path -> Enter new path
     # -> No to "change another" -> Back -> Exit
-    result = runner.invoke(
+    result = cli_runner.invoke(
         main,
         ["config", "settings"],
         input=f"2\n1\n{new_path}\nn\nq\nq\n",
@@ -401,7 +382,7 @@ def test_settings_updates_save_path(tmp_path, monkeypatch):
     assert "new_transcripts" in config_data["output"]["save_path"]
 
 
-def test_settings_validates_boolean_input(tmp_path, monkeypatch):
+def test_settings_validates_boolean_input(tmp_path, monkeypatch, cli_runner):
     """GIVEN rec settings
     WHEN updating boolean setting
     THEN accepts yes/no or true/false and saves correctly"""
@@ -412,9 +393,8 @@ def test_settings_validates_boolean_input(tmp_path, monkeypatch):
 
     monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / ".config"))
 
-    runner = CliRunner()
     # Navigate: Main menu -> Output -> Auto Copy -> Toggle -> Exit
-    result = runner.invoke(
+    result = cli_runner.invoke(
         main,
         ["config", "settings"],
         input="2\n3\nn\nn\nq\nq\n",
@@ -428,7 +408,7 @@ def test_settings_validates_boolean_input(tmp_path, monkeypatch):
     assert config_data["output"]["auto_copy"] is False
 
 
-def test_settings_preserves_other_config_values(tmp_path, monkeypatch):
+def test_settings_preserves_other_config_values(tmp_path, monkeypatch, cli_runner):
     """GIVEN rec settings
     WHEN updating one setting
     THEN other config values are preserved"""
@@ -448,9 +428,8 @@ audio:
 
     monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / ".config"))
 
-    runner = CliRunner()
     # Only update transcription model
-    result = runner.invoke(
+    result = cli_runner.invoke(
         main,
         ["config", "settings"],
         input="1\n1\nsmall\nn\nq\nq\n",
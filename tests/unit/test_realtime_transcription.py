@@ -9,6 +9,7 @@ import numpy as np
 from rejoice.core.config import TranscriptionConfig
 from rejoice.exceptions import TranscriptionError
 from rejoice.transcript.manager import append_to_transcript
+from rejoice.transcription.realtime import RealtimeTranscriptionWorker
 
 
 def test_realtime_transcription_updates_transcript_incrementally(monkeypatch, tmp_path):
@@ -211,3 +212,270 @@ def test_realtime_transcription_with_vad(monkeypatch):
     # VAD is enabled in the transcriber config
     # The actual VAD processing happens in faster-whisper
     # This test just verifies the config is set correctly
+
+
+def test_worker_transcribes_accumulated_audio_in_memory(tmp_path):
+    """GIVEN a real-time worker with accumulated audio chunks
+    WHEN the accumulated audio is processed
+    THEN the samples are transcribed directly from memory
+    AND non-empty segments are appended to the transcript."""
+    transcript_path = tmp_path / "000001_transcript_20250101.md"
+    transcript_path.write_text("---\nid: '000001'\n---\n\n", encoding="utf-8")
+
+    received: List[np.ndarray] = []
+
+    class ArrayTranscriber:
+        def transcribe_array_texts(self, audio: np.ndarray):
+            received.append(audio)
+            return iter(["hello there"])
+
+    worker = RealtimeTranscriptionWorker(ArrayTranscriber(), transcript_path)
+    worker._append_to_buffer(np.full(8000, 0.1, dtype=np.float32))
+    worker._append_to_buffer(np.zeros(8000, dtype=np.float32))
+
+    worker._process_accumulated_audio()
+
+    assert len(received) == 1
+    assert received[0].shape == (16000,)
+    assert worker._buffer_len == 0
+    assert worker.processed_chunks_count == 1
+    assert "hello there" in transcript_path.read_text(encoding="utf-8")
+
+
+def test_worker_buffer_grows_beyond_initial_capacity(tmp_path):
+    """GIVEN a real-time worker
+    WHEN more audio is appended than the preallocated buffer holds
+    THEN the buffer grows and keeps all samples in order."""
+    worker = RealtimeTranscriptionWorker(
+        object(), tmp_path / "t.md", min_chunk_size_seconds=0.001
+    )
+    capacity = len(worker._buffer)
+
+    first = np.arange(capacity, dtype=np.float32)
+    second = np.arange(capacity, capacity + 5, dtype=np.float32)
+    worker._append_to_buffer(first)
+    worker._append_to_buffer(second.reshape(-1, 1))
+
+    assert worker._buffer_len == capacity + 5
+    np.testing.assert_array_equal(
+        worker._buffer[: worker._buffer_len], np.concatenate([first, second])
+    )
+
+
+def test_worker_skips_transcription_for_silent_audio(tmp_path):
+    """GIVEN a real-time worker whose accumulated audio is silent
+    WHEN the accumulated audio is processed
+    THEN the model is not invoked and the buffer is discarded."""
+
+    class NeverCalledTranscriber:
+        def transcribe_array_texts(self, audio):  # pragma: no cover - must not run
+            raise AssertionError("silent audio should not be transcribed")
+
+    worker = RealtimeTranscriptionWorker(NeverCalledTranscriber(), tmp_path / "t.md")
+    worker._append_to_buffer(np.full(16000, 1e-4, dtype=np.float32))
+
+    worker._process_accumulated_audio()
+
+    assert worker._buffer_len == 0
+    assert worker.processed_chunks_count == 0
+
+
+def test_worker_keeps_segments_decoded_before_a_failure(tmp_path):
+    """GIVEN a transcriber that fails partway through a window
+    WHEN the accumulated audio is processed
+    THEN the segments decoded before the failure are still appended."""
+    transcript_path = tmp_path / "000001_transcript_20250101.md"
+    transcript_path.write_text("---\nid: '000001'\n---\n\n", encoding="utf-8")
+
+    class FailingTranscriber:
+        def transcribe_array_texts(self, audio):
+            yield "decoded before failure"
+            raise TranscriptionError("decoder crashed")
+
+    worker = RealtimeTranscriptionWorker(FailingTranscriber(), transcript_path)
+    worker._append_to_buffer(np.full(16000, 0.1, dtype=np.float32))
+
+    worker._process_accumulated_audio()
+
+    assert worker.processed_chunks_count == 1
+    content = transcript_path.read_text(encoding="utf-8")
+    assert "decoded before failure" in content
+
+
+def test_worker_does_not_repeat_partial_segments_after_a_failure(tmp_path):
+    """GIVEN a transcriber that fails partway through a window, then recovers
+    WHEN the worker processes the next window
+    THEN the segments written before the failure are not written again."""
+    transcript_path = tmp_path / "000001_transcript_20250101.md"
+    transcript_path.write_text("---\nid: '000001'\n---\n\n", encoding="utf-8")
+
+    class FlakyTranscriber:
+        def __init__(self):
+            self.calls = 0
+
+        def transcribe_array_texts(self, audio):
+            self.calls += 1
+            if self.calls == 1:
+                yield "first window"
+                raise TranscriptionError("decoder crashed")
+            yield f"window of {len(audio)} samples"
+
+    worker = RealtimeTranscriptionWorker(FlakyTranscriber(), transcript_path)
+    worker._append_to_buffer(np.full(16000, 0.1, dtype=np.float32))
+    worker._process_accumulated_audio()
+    worker._append_to_buffer(np.full(16000, 0.1, dtype=np.float32))
+    worker._process_accumulated_audio()
+
+    content = transcript_path.read_text(encoding="utf-8")
+    assert content.count("first window") == 1
+    assert "window of 16000 samples" in content
+    assert worker._buffer_len == 0
+
+
+def test_worker_appends_segments_via_writer_thread(tmp_path):
+    """GIVEN a running real-time worker
+    WHEN an audio chunk is queued and the worker is stopped
+    THEN transcribed segments are appended in order by the writer thread."""
+    transcript_path = tmp_path / "000001_transcript_20250101.md"
+    transcript_path.write_text("---\nid: '000001'\n---\n\n", encoding="utf-8")
+
+    class TwoSegmentTranscriber:
+        def transcribe_array_texts(self, audio):
+            return iter(["segment 1", "segment 2"])
+
+    worker = RealtimeTranscriptionWorker(TwoSegmentTranscriber(), transcript_path)
+    worker.start()
+    worker.add_audio_chunk(np.full(16000, 0.1, dtype=np.float32))
+    worker.stop()
+
+    assert worker.writer_thread is not None
+    assert not worker.writer_thread.is_alive()
+    content = transcript_path.read_text(encoding="utf-8")
+    assert content.index("segment 1") < content.index("segment 2")
+
+
+def test_worker_folds_queued_backlog_into_one_window(tmp_path):
+    """GIVEN several chunks already waiting in the worker queue
+    WHEN the worker processes them
+    THEN they are transcribed together in a single model call."""
+    transcript_path = tmp_path / "000001_transcript_20250101.md"
+    transcript_path.write_text("---\nid: '000001'\n---\n\n", encoding="utf-8")
+
+    window_sizes: List[int] = []
+
+    class RecordingTranscriber:
+        def transcribe_array_texts(self, audio):
+            window_sizes.append(len(audio))
+            return iter([])
+
+    worker = RealtimeTranscriptionWorker(RecordingTranscriber(), transcript_path)
+    for _ in range(3):
+        worker.audio_queue.append(np.full(16000, 0.1, dtype=np.float32))
+
+    worker.start()
+    worker.stop()
+
+    assert window_sizes == [48000]
+
+
+def test_add_audio_chunk_queues_without_copying(tmp_path):
+    """GIVEN a running real-time worker
+    WHEN an audio chunk is added
+    THEN the same array object is queued (the worker takes ownership)."""
+    worker = RealtimeTranscriptionWorker(object(), tmp_path / "unused.md")
+    worker.is_running.set()
+    chunk = np.zeros(160, dtype=np.float32)
+
+    worker.add_audio_chunk(chunk)
+
+    assert worker.audio_queue[0] is chunk
+
+
+def test_finalize_appends_after_writer_thread_output(tmp_path):
+    """GIVEN a worker whose writer thread has flushed real-time segments
+    WHEN finalize transcribes the remaining audio
+    THEN the final text is appended after the earlier segments."""
+    transcript_path = tmp_path / "000001_transcript_20250101.md"
+    transcript_path.write_text("---\nid: '000001'\n---\n\n", encoding="utf-8")
+    remaining = tmp_path / "remaining.wav"
+    remaining.write_bytes(b"")
+
+    class FileAndArrayTranscriber:
+        def transcribe_array_texts(self, audio):
+            return iter(["live segment"])
+
+        def transcribe_file(self, audio_path):
+            return iter([{"text": "final segment"}])
+
+    worker = RealtimeTranscriptionWorker(FileAndArrayTranscriber(), transcript_path)
+    worker.start()
+    worker.add_audio_chunk(np.full(16000, 0.1, dtype=np.float32))
+    worker.stop()
+    worker.finalize(remaining)
+
+    content = transcript_path.read_text(encoding="utf-8")
+    assert content.index("live segment") < content.index("final segment")
+
+
+def test_stop_timeout_releases_writer_and_finalize_waits_for_live_worker(tmp_path):
+    """GIVEN a worker stuck in a transcription call past the stop timeout
+    WHEN stop and finalize are called
+    THEN the writer thread still exits and finalize waits for the worker before
+    running the final pass, so no text is lost or reordered."""
+    transcript_path = tmp_path / "000001_transcript_20250101.md"
+    transcript_path.write_text("---\nid: '000001'\n---\n\n", encoding="utf-8")
+    remaining = tmp_path / "remaining.wav"
+    remaining.write_bytes(b"")
+    entered = threading.Event()
+    release = threading.Event()
+
+    class StuckTranscriber:
+        def transcribe_array_texts(self, audio):
+            entered.set()
+            release.wait()
+            return iter(["late segment"])
+
+        def transcribe_file(self, audio_path):
+            return iter([{"text": "final segment"}])
+
+    worker = RealtimeTranscriptionWorker(StuckTranscriber(), transcript_path)
+    worker.start()
+    worker.add_audio_chunk(np.full(16000, 0.1, dtype=np.float32))
+    assert entered.wait(timeout=5)
+
+    try:
+        worker.stop(timeout=0.05)
+        assert worker.writer_thread is not None
+        assert not worker.writer_thread.is_alive()
+
+        finalizer = threading.Thread(target=worker.finalize, args=(remaining,))
+        finalizer.start()
+        finalizer.join(timeout=0.1)
+        assert finalizer.is_alive()
+    finally:
+        release.set()
+
+    finalizer.join(timeout=5)
+    assert not finalizer.is_alive()
+    assert worker._buffer_len == 0
+    content = transcript_path.read_text(encoding="utf-8")
+    assert content.index("late segment") < content.index("final segment")
+
+
+def test_write_segments_after_writer_closes_appends_directly(tmp_path):
+    """GIVEN a worker whose writer has been closed
+    WHEN more segments are written
+    THEN they are appended directly instead of queued behind the sentinel."""
+    transcript_path = tmp_path / "000001_transcript_20250101.md"
+    transcript_path.write_text("---\nid: '000001'\n---\n\n", encoding="utf-8")
+
+    worker = RealtimeTranscriptionWorker(object(), transcript_path)
+    worker._writer_accepting = True
+    worker._close_writer()
+    worker._close_writer()
+
+    worker._write_segments(["after close"])
+
+    assert worker.append_queue.get_nowait() is None
+    assert worker.append_queue.empty()
+    assert "after close" in transcript_path.read_text(encoding="utf-8")
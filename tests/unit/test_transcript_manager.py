@@ -2,6 +2,8 @@
 
 from pathlib import Path
 import re
+import stat
+import sys
 import tempfile
 from unittest.mock import patch
 
@@ -21,7 +23,7 @@ def test_filename_pattern_matches_new_pattern():
     THEN it matches and returns ID then date groups."""
     filename = "000123_transcript_20250120.md"
 
-    match = manager.TRANSCRIPT_FILENAME_PATTERN.match(filename)
+    match = manager.TRANSCRIPT_FILENAME_PATTERN.fullmatch(filename)
 
     assert match is not None
     id_str, date_str = match.groups()
@@ -29,6 +31,49 @@ def test_filename_pattern_matches_new_pattern():
     assert date_str == "20250120"
 
 
+def test_filename_pattern_rejects_trailing_characters():
+    """GIVEN the transcript filename regex
+    WHEN matching a filename with a suffix after '.md'
+    THEN it does not match."""
+    assert (
+        manager.TRANSCRIPT_FILENAME_PATTERN.fullmatch(
+            "000123_transcript_20250120.md.bak"
+        )
+        is None
+    )
+
+
+def test_parse_transcript_filename_returns_id_and_date():
+    """GIVEN a standard transcript filename
+    WHEN parse_transcript_filename is called
+    THEN it returns the ID and date parts."""
+    assert manager.parse_transcript_filename("000123_transcript_20250120.md") == (
+        "000123",
+        "20250120",
+    )
+
+
+def test_parse_transcript_filename_returns_none_for_other_files():
+    """GIVEN a non-transcript filename
+    WHEN parse_transcript_filename is called
+    THEN it returns None."""
+    assert manager.parse_transcript_filename("notes.md") is None
+
+
+def test_parse_transcript_filename_is_memoised():
+    """GIVEN a filename parsed once
+    WHEN it is parsed again
+    THEN the cached result is reused."""
+    manager.parse_transcript_filename.cache_clear()
+
+    manager.parse_transcript_filename("000001_transcript_20250101.md")
+    manager.parse_transcript_filename("000001_transcript_20250101.md")
+
+    info = manager.parse_transcript_filename.cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
+
+
 def test_create_transcript_uses_new_pattern():
     """GIVEN a new transcript creation
     WHEN create_transcript is called
@@ -87,6 +132,114 @@ def test_get_next_id_increments_over_existing_files():
         assert next_id == "000003"
 
 
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions only")
+def test_create_transcript_is_owner_only(tmp_path: Path):
+    """GIVEN a new transcript
+    WHEN create_transcript is called
+    THEN the file is not readable by group or other users
+    """
+    filepath, _tid = manager.create_transcript(tmp_path)
+
+    mode = stat.S_IMODE(filepath.stat().st_mode)
+    assert mode & (stat.S_IRWXG | stat.S_IRWXO) == 0
+
+
+def test_create_transcript_records_last_id_in_sidecar(tmp_path: Path):
+    """GIVEN a new transcript
+    WHEN create_transcript is called
+    THEN the allocated ID is recorded in the next-ID sidecar file
+    """
+    _filepath, tid = manager.create_transcript(tmp_path)
+
+    sidecar = tmp_path / manager.NEXT_ID_FILENAME
+    assert sidecar.read_text(encoding="utf-8") == tid
+
+
+def test_get_next_id_uses_sidecar_without_scanning(tmp_path: Path, monkeypatch):
+    """GIVEN a next-ID sidecar file
+    WHEN get_next_id is called
+    THEN the ID is derived from the sidecar and the directory is never listed
+    """
+    (tmp_path / manager.NEXT_ID_FILENAME).write_text("000041", encoding="utf-8")
+
+    def fail_listing(*args, **kwargs):
+        raise AssertionError("directory should not be listed")
+
+    monkeypatch.setattr(manager.os, "scandir", fail_listing)
+    monkeypatch.setattr(manager.os, "listdir", fail_listing)
+    monkeypatch.setattr(Path, "glob", fail_listing)
+    monkeypatch.setattr(Path, "iterdir", fail_listing)
+
+    assert manager.get_next_id(tmp_path) == "000042"
+
+
+def test_get_next_id_falls_back_to_scan_for_corrupt_sidecar(tmp_path: Path):
+    """GIVEN an unreadable next-ID sidecar file
+    WHEN get_next_id is called
+    THEN the directory is scanned instead
+    """
+    (tmp_path / manager.NEXT_ID_FILENAME).write_text("garbage", encoding="utf-8")
+    (tmp_path / "000007_transcript_20240101.md").write_text("test")
+
+    assert manager.get_next_id(tmp_path) == "000008"
+
+
+def test_create_transcript_skips_past_stale_sidecar_collisions(
+    tmp_path: Path, monkeypatch
+):
+    """GIVEN a stale next-ID sidecar and newer transcripts from the same date
+    WHEN create_transcript is called
+    THEN the exclusive create skips the taken IDs without listing the directory
+    """
+    from datetime import datetime
+
+    fixed_date = datetime(2025, 1, 1, 12, 0, 0)
+
+    class MockDatetime:
+        @staticmethod
+        def now() -> datetime:
+            return fixed_date
+
+    monkeypatch.setattr(manager, "datetime", MockDatetime)
+    (tmp_path / manager.NEXT_ID_FILENAME).write_text("000001", encoding="utf-8")
+    (tmp_path / "000002_transcript_20250101.md").write_text("test")
+    (tmp_path / "000003_transcript_20250101.md").write_text("test")
+
+    def fail_listing(*args, **kwargs):
+        raise AssertionError("directory should not be listed")
+
+    monkeypatch.setattr(manager.os, "scandir", fail_listing)
+    monkeypatch.setattr(Path, "glob", fail_listing)
+
+    filepath, tid = manager.create_transcript(tmp_path)
+
+    assert tid == "000004"
+    assert filepath.name == "000004_transcript_20250101.md"
+    assert (tmp_path / manager.NEXT_ID_FILENAME).read_text(encoding="utf-8") == tid
+
+
+def test_create_transcript_removes_sidecar_when_update_fails(
+    tmp_path: Path, monkeypatch
+):
+    """GIVEN a next-ID sidecar that cannot be rewritten
+    WHEN create_transcript is called
+    THEN the transcript is still created and the sidecar is removed
+    """
+    sidecar = tmp_path / manager.NEXT_ID_FILENAME
+    sidecar.write_text("000001", encoding="utf-8")
+
+    def failing_write(target_path, content):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(manager, "write_file_atomic", failing_write)
+
+    filepath, tid = manager.create_transcript(tmp_path)
+
+    assert filepath.exists()
+    assert tid == "000002"
+    assert not sidecar.exists()
+
+
 def test_get_next_id_ignores_non_transcript_files():
     """GIVEN a directory with non-transcript files
     WHEN get_next_id is called
@@ -226,6 +379,44 @@ def test_append_to_transcript_handles_empty_body_gracefully():
         assert body.endswith("\n")
 
 
+def test_append_many_to_transcript_writes_all_lines_in_one_rewrite(
+    tmp_path: Path, monkeypatch
+):
+    """GIVEN an existing transcript
+    WHEN append_many_to_transcript is called with several lines
+    THEN all lines are appended in order with a single atomic write
+    """
+    filepath, _tid = manager.create_transcript(tmp_path)
+    before = read_file(filepath)
+
+    real_write = manager.write_file_atomic
+    writes = []
+
+    def counting_write(target, content):
+        writes.append(target)
+        real_write(target, content)
+
+    monkeypatch.setattr(manager, "write_file_atomic", counting_write)
+
+    manager.append_many_to_transcript(filepath, ["First line.", "Second line."])
+
+    assert writes == [filepath]
+    assert read_file(filepath) == before + "First line.\nSecond line.\n"
+
+
+def test_append_many_to_transcript_ignores_empty_batches(tmp_path: Path):
+    """GIVEN an existing transcript
+    WHEN append_many_to_transcript is called with no lines
+    THEN the file is left untouched
+    """
+    filepath, _tid = manager.create_transcript(tmp_path)
+    before = read_file(filepath)
+
+    manager.append_many_to_transcript(filepath, [])
+
+    assert read_file(filepath) == before
+
+
 def test_append_to_transcript_is_atomic(tmp_path: Path):
     """GIVEN an existing transcript
     WHEN append_to_transcript is called
@@ -496,6 +687,55 @@ def test_create_transcript_handles_collision_retry(monkeypatch):
             assert filepath.exists()
 
 
+def test_create_transcript_collision_does_not_create_placeholder_files(monkeypatch):
+    """GIVEN create_transcript
+    WHEN the next ID's filename is already taken
+    THEN no placeholder files are left behind in the directory"""
+    from datetime import datetime
+
+    fixed_date = datetime(2025, 1, 1, 12, 0, 0)
+
+    class MockDatetime:
+        @staticmethod
+        def now() -> datetime:
+            return fixed_date
+
+    monkeypatch.setattr(manager, "datetime", MockDatetime)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        save_dir = Path(tmpdir)
+        (save_dir / "000001_transcript_20250101.md").write_text("existing")
+
+        with patch.object(manager, "get_next_id", return_value="000001"):
+            filepath, tid = manager.create_transcript(save_dir)
+
+        assert tid == "000002"
+        assert sorted(p.name for p in save_dir.iterdir()) == [
+            manager.NEXT_ID_FILENAME,
+            "000001_transcript_20250101.md",
+            "000002_transcript_20250101.md",
+        ]
+        assert (save_dir / "000001_transcript_20250101.md").read_text() == "existing"
+
+
+def test_create_transcript_removes_reserved_file_when_write_fails(
+    tmp_path: Path, monkeypatch
+):
+    """GIVEN create_transcript
+    WHEN writing the frontmatter to the reserved file fails
+    THEN a TranscriptError is raised and no empty transcript is left behind"""
+
+    def failing_fsync(fd):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(manager.os, "fsync", failing_fsync)
+
+    with pytest.raises(manager.TranscriptError, match="Failed to write transcript"):
+        manager.create_transcript(tmp_path)
+
+    assert list(tmp_path.iterdir()) == []
+
+
 def test_append_to_transcript_handles_empty_body():
     """GIVEN append_to_transcript
     WHEN body is empty
@@ -525,6 +765,32 @@ def test_update_status_handles_missing_frontmatter():
             manager.update_status(filepath, "completed")
 
 
+def test_update_status_handles_unterminated_frontmatter(tmp_path: Path):
+    """GIVEN update_status
+    WHEN the frontmatter has no closing --- marker
+    THEN TranscriptError is raised"""
+    filepath = tmp_path / "transcript.md"
+    filepath.write_text("---\nid: '000001'\nstatus: recording\nbody text\n")
+
+    with pytest.raises(manager.TranscriptError, match="malformed"):
+        manager.update_status(filepath, "completed")
+
+
+def test_update_status_accepts_empty_frontmatter(tmp_path: Path):
+    """GIVEN a transcript whose frontmatter block is empty
+    WHEN update_status is called
+    THEN the status is added and the body is preserved
+    """
+    filepath = tmp_path / "transcript.md"
+    filepath.write_text("---\n---\nbody text\n", encoding="utf-8")
+
+    manager.update_status(filepath, "completed")
+
+    content = read_file(filepath)
+    assert content.startswith("---\nstatus: completed\n---\n")
+    assert content.endswith("body text\n")
+
+
 def test_update_language_handles_missing_frontmatter():
     """GIVEN update_language
     WHEN file doesn't start with ---
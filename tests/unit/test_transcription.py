@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import os
+import subprocess
+import sys
 from pathlib import Path
 from typing import Dict, List
 
+import numpy as np
 import pytest
 
 from rejoice.core.config import TranscriptionConfig
@@ -13,6 +17,14 @@ import rejoice.transcription as transcription
 from rejoice.transcript import manager as transcript_manager
 
 
+@pytest.fixture(autouse=True)
+def _clear_model_cache():
+    """Ensure each test constructs its own (monkeypatched) model."""
+    transcription.clear_model_cache()
+    yield
+    transcription.clear_model_cache()
+
+
 class DummySegment:
     """Simple stand-in for faster-whisper segment objects."""
 
@@ -36,17 +48,22 @@ def test_transcriber_initialises_model_with_config(monkeypatch):
             model_size: str,
             device: str = "cpu",
             compute_type: str = "int8",
+            cpu_threads: int = 0,
+            num_workers: int = 1,
             local_files_only: bool = False,
         ):
             created["model_size"] = model_size
             created["device"] = device
             created["compute_type"] = compute_type
+            created["cpu_threads"] = cpu_threads
+            created["num_workers"] = num_workers
             created["local_files_only"] = local_files_only
 
         def transcribe(self, *args, **kwargs):  # pragma: no cover - not used here
             return [], {}
 
     monkeypatch.setattr(transcription, "WhisperModel", DummyModel)
+    monkeypatch.setattr(transcription, "_cuda_available", lambda: False)
 
     cfg = TranscriptionConfig(model="small", language="en", vad_filter=True)
 
@@ -56,9 +73,50 @@ def test_transcriber_initialises_model_with_config(monkeypatch):
     assert created["model_size"] == "small"
     assert created["device"] == "cpu"
     assert created["compute_type"] == "int8"
+    assert created["cpu_threads"] >= 1  # 0 in config resolves to the core count
+    assert created["num_workers"] == 1
     assert created["local_files_only"] is True  # Enforced for local-only operation
 
 
+def test_transcriber_passes_configured_cpu_tuning(monkeypatch):
+    """GIVEN explicit cpu_threads and num_workers in config
+    WHEN Transcriber is constructed
+    THEN they are passed through to WhisperModel."""
+
+    created: Dict[str, object] = {}
+
+    class DummyModel:
+        def __init__(self, model_size: str, **kwargs):
+            created.update(kwargs)
+
+    monkeypatch.setattr(transcription, "WhisperModel", DummyModel)
+
+    cfg = TranscriptionConfig(model="tiny", cpu_threads=3, num_workers=2)
+    transcription.Transcriber(cfg)
+
+    assert created["cpu_threads"] == 3
+    assert created["num_workers"] == 2
+
+
+def test_resolve_device_prefers_float16_on_cuda(monkeypatch):
+    """GIVEN a CUDA-capable machine
+    WHEN device and compute type are 'auto'
+    THEN CUDA with float16 is selected."""
+    monkeypatch.setattr(transcription, "_cuda_available", lambda: True)
+
+    assert transcription._resolve_device("auto", "auto") == ("cuda", "float16")
+
+
+def test_resolve_device_keeps_explicit_values(monkeypatch):
+    """GIVEN explicit device and compute type values
+    WHEN _resolve_device is called
+    THEN they are returned unchanged."""
+    monkeypatch.setattr(transcription, "_cuda_available", lambda: True)
+
+    assert transcription._resolve_device("cpu", "float32") == ("cpu", "float32")
+    assert transcription._resolve_device("cpu", "auto") == ("cpu", "int8")
+
+
 def test_transcribe_file_yields_normalised_segments_and_uses_vad_and_language(
     monkeypatch, tmp_path: Path
 ):
@@ -189,6 +247,7 @@ def test_transcriber_raises_helpful_error_when_faster_whisper_missing(monkeypatc
     """
 
     monkeypatch.setattr(transcription, "WhisperModel", None)
+    monkeypatch.setitem(sys.modules, "faster_whisper", None)
 
     cfg = TranscriptionConfig(model="small", language="en", vad_filter=True)
 
@@ -200,6 +259,23 @@ def test_transcriber_raises_helpful_error_when_faster_whisper_missing(monkeypatc
     assert "install" in message or "dependency" in message
 
 
+def test_importing_transcription_does_not_import_faster_whisper():
+    """GIVEN a fresh interpreter
+    WHEN rejoice.transcription is imported
+    THEN faster-whisper is not loaded until a Transcriber needs it.
+    """
+
+    code = (
+        "import sys, rejoice.transcription; "
+        "sys.exit('faster_whisper' in sys.modules)"
+    )
+    src_dir = Path(transcription.__file__).resolve().parents[2]
+    env = {**os.environ, "PYTHONPATH": str(src_dir)}
+    result = subprocess.run([sys.executable, "-c", code], env=env, check=False)
+
+    assert result.returncode == 0
+
+
 def test_transcribe_file_wraps_lower_level_errors(monkeypatch, tmp_path: Path):
     """GIVEN faster-whisper raises during transcription
     WHEN transcribe_file is called
@@ -368,3 +444,191 @@ def test_transcriber_handles_dict_style_info(monkeypatch, tmp_path):
     assert len(segments) > 0
     # Language should be detected from dict-style info
     assert transcriber.last_language == "fr"
+
+
+def test_transcribe_array_passes_float32_samples_to_model(monkeypatch):
+    """GIVEN in-memory audio samples
+    WHEN transcribe_array is called
+    THEN the float32 array is passed directly to faster-whisper
+    AND segments are normalised like transcribe_file."""
+
+    calls: Dict[str, object] = {}
+
+    class DummyModel:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def transcribe(self, audio, vad_filter: bool, language=None):
+            calls["audio"] = audio
+            return [DummySegment(" hello ", 0.0, 0.5)], {}
+
+    monkeypatch.setattr(transcription, "WhisperModel", DummyModel)
+
+    cfg = TranscriptionConfig(model="tiny", language="en", vad_filter=True)
+    transcriber = transcription.Transcriber(cfg)
+
+    samples = np.zeros(16000, dtype=np.float64)
+    results = list(transcriber.transcribe_array(samples))
+
+    assert isinstance(calls["audio"], np.ndarray)
+    assert calls["audio"].dtype == np.float32
+    assert results == [{"text": "hello", "start": 0.0, "end": 0.5}]
+
+
+def test_transcribe_array_wraps_lower_level_errors(monkeypatch):
+    """GIVEN faster-whisper raises while transcribing in-memory audio
+    WHEN transcribe_array is called
+    THEN a TranscriptionError describing the buffer is raised."""
+
+    class DummyModel:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def transcribe(self, *args, **kwargs):
+            raise RuntimeError("boom")
+
+    monkeypatch.setattr(transcription, "WhisperModel", DummyModel)
+
+    cfg = TranscriptionConfig(model="tiny", language="en", vad_filter=True)
+    transcriber = transcription.Transcriber(cfg)
+
+    with pytest.raises(TranscriptionError, match="in-memory audio"):
+        list(transcriber.transcribe_array(np.zeros(10, dtype=np.float32)))
+
+
+def _write_silent_wav(path: Path, seconds: float, framerate: int = 1000) -> None:
+    import wave
+
+    with wave.open(str(path), "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(framerate)
+        wav_file.writeframes(b"\x00\x00" * int(seconds * framerate))
+
+
+def test_transcribe_file_uses_batched_pipeline_for_long_audio(
+    monkeypatch, tmp_path: Path
+):
+    """GIVEN a WAV file longer than the batching threshold
+    WHEN transcribe_file is called
+    THEN the batched inference pipeline is used with the configured options."""
+
+    calls: Dict[str, object] = {}
+
+    class DummyModel:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def transcribe(self, *args, **kwargs):  # pragma: no cover - not used here
+            raise AssertionError("sequential path should not be used")
+
+    class DummyPipeline:
+        def __init__(self, model):
+            calls["model"] = model
+
+        def transcribe(self, audio_path, batch_size, vad_filter, language=None):
+            calls["batch_size"] = batch_size
+            calls["vad_filter"] = vad_filter
+            return [DummySegment("long", 0.0, 61.0)], {}
+
+    monkeypatch.setattr(transcription, "WhisperModel", DummyModel)
+    monkeypatch.setattr(transcription, "BatchedInferencePipeline", DummyPipeline)
+
+    audio_path = tmp_path / "long.wav"
+    _write_silent_wav(audio_path, transcription.BATCHED_MIN_DURATION_SECONDS + 1)
+
+    cfg = TranscriptionConfig(model="tiny", language="en", vad_filter=True)
+    transcriber = transcription.Transcriber(cfg)
+
+    results = list(transcriber.transcribe_file(str(audio_path)))
+
+    assert isinstance(calls["model"], DummyModel)
+    assert calls["batch_size"] == transcription.BATCH_SIZE
+    assert calls["vad_filter"] is True
+    assert results[0]["text"] == "long"
+
+
+def test_transcribe_file_keeps_sequential_path_for_short_audio(
+    monkeypatch, tmp_path: Path
+):
+    """GIVEN a short WAV file
+    WHEN transcribe_file is called
+    THEN the sequential model path is used."""
+
+    class DummyModel:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def transcribe(self, audio_path, vad_filter, language=None):
+            return [DummySegment("short", 0.0, 1.0)], {}
+
+    class DummyPipeline:  # pragma: no cover - must not be constructed
+        def __init__(self, model):
+            raise AssertionError("batched path should not be used")
+
+    monkeypatch.setattr(transcription, "WhisperModel", DummyModel)
+    monkeypatch.setattr(transcription, "BatchedInferencePipeline", DummyPipeline)
+
+    audio_path = tmp_path / "short.wav"
+    _write_silent_wav(audio_path, 1.0)
+
+    cfg = TranscriptionConfig(model="tiny", language="en", vad_filter=True)
+    transcriber = transcription.Transcriber(cfg)
+
+    results = list(transcriber.transcribe_file(str(audio_path)))
+
+    assert results[0]["text"] == "short"
+
+
+def test_transcribers_share_a_cached_model(monkeypatch):
+    """GIVEN two Transcribers with the same model settings
+    WHEN both are constructed
+    THEN the underlying WhisperModel is only loaded once."""
+
+    loads: List[str] = []
+
+    class DummyModel:
+        def __init__(self, model_size: str, **kwargs):
+            loads.append(model_size)
+
+    monkeypatch.setattr(transcription, "WhisperModel", DummyModel)
+
+    cfg = TranscriptionConfig(model="tiny", language="en", vad_filter=True)
+    first = transcription.Transcriber(cfg, device="cpu", compute_type="int8")
+    second = transcription.Transcriber(cfg, device="cpu", compute_type="int8")
+    transcription.Transcriber(cfg, device="cpu", compute_type="float32")
+
+    assert first._model is second._model
+    assert loads == ["tiny", "tiny"]
+
+    transcription.clear_model_cache()
+    transcription.Transcriber(cfg, device="cpu", compute_type="int8")
+
+    assert loads == ["tiny", "tiny", "tiny"]
+
+
+def test_transcribe_array_texts_yields_only_non_empty_text(monkeypatch):
+    """GIVEN a model returning blank and padded segments
+    WHEN transcribe_array_texts is called
+    THEN only the stripped, non-empty texts are yielded."""
+
+    class DummyModel:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def transcribe(self, audio, vad_filter: bool, language=None):
+            segments = [
+                DummySegment(" hello ", 0.0, 0.5),
+                DummySegment("   ", 0.5, 1.0),
+                DummySegment("world", 1.0, 1.5),
+            ]
+            return segments, {}
+
+    monkeypatch.setattr(transcription, "WhisperModel", DummyModel)
+
+    cfg = TranscriptionConfig(model="tiny", language="en", vad_filter=True)
+    transcriber = transcription.Transcriber(cfg)
+
+    texts = list(transcriber.transcribe_array_texts(np.zeros(16000, np.float32)))
+
+    assert texts == ["hello", "world"]